@@ -1,7 +1,7 @@
 from __future__ import annotations
 import os
 import logging
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 from importlib_metadata import version
 from typing_extensions import Final
 import sys
@@ -25,6 +25,9 @@ from .trace_spans.aws_lambda import aws_lambda_span  # noqa E402
 from sls_sdk import ServerlessSdk, TraceSpans  # noqa E402
 from sls_sdk.lib.trace import TraceSpan  # noqa E402
 from .instrumentation import aws_sdk  # noqa E402
+from .lib.sampling import Sampler  # noqa E402
+from .lib.records import Record, trace_records  # noqa E402
+from sls_sdk.lib.warning import report as report_warning  # noqa E402
 
 # module metadata
 __name__: Final[str] = "serverless-aws-lambda-sdk"
@@ -55,14 +58,81 @@ TraceSpans.aws_lambda_initialization = next(
 
 baseSdk._is_dev_mode = bool(os.environ.get("SLS_DEV_MODE_ORG_ID"))
 baseSdk.instrumentation.aws_sdk = aws_sdk
+baseSdk.sampler = Sampler()
+baseSdk.trace_records = trace_records
 
 
-def _initialize_extension(self, disable_aws_sdk_monitoring=False):
+DEFAULT_EVENT_MESSAGE_IDS_LIMIT: Final[int] = 100
+DEFAULT_DEV_MODE_BUFFER_MAX_ITEMS: Final[int] = 10_000
+DEFAULT_DEV_MODE_BUFFER_MAX_BYTES: Final[int] = 16 * 1024 * 1024
+DEV_MODE_BUFFER_DROP_POLICIES: Final[tuple] = ("oldest", "newest")
+
+
+def _resolve_int_setting(name: str, default: int, code: str) -> int:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        report_warning(
+            f'Ignored "{name}" environment variable: '
+            f'Expected an integer, received "{value}"',
+            code,
+            type="USER",
+        )
+        return default
+
+
+def _resolve_drop_policy(default: str) -> str:
+    value = os.environ.get("SLS_DEV_MODE_BUFFER_DROP_POLICY") or default
+    if value in DEV_MODE_BUFFER_DROP_POLICIES:
+        return value
+    report_warning(
+        'Ignored "SLS_DEV_MODE_BUFFER_DROP_POLICY" setting: '
+        f'Expected "oldest" or "newest", received "{value}"',
+        "INVALID_DEV_MODE_BUFFER_SETTING",
+        type="USER",
+    )
+    return DEV_MODE_BUFFER_DROP_POLICIES[0]
+
+
+def _initialize_extension(
+    self,
+    disable_aws_sdk_monitoring=False,
+    event_message_ids_limit=DEFAULT_EVENT_MESSAGE_IDS_LIMIT,
+    sample_event_message_ids=False,
+    dev_mode_buffer_max_items=DEFAULT_DEV_MODE_BUFFER_MAX_ITEMS,
+    dev_mode_buffer_max_bytes=DEFAULT_DEV_MODE_BUFFER_MAX_BYTES,
+    dev_mode_buffer_drop_policy="oldest",
+):
     try:
         settings = self._settings
         self._settings.disable_aws_sdk_monitoring = bool(
             os.environ.get("SLS_DISABLE_AWS_SDK_MONITORING", disable_aws_sdk_monitoring)
         )
+        settings.event_message_ids_limit = _resolve_int_setting(
+            "SLS_EVENT_MESSAGE_IDS_LIMIT",
+            event_message_ids_limit,
+            "INVALID_EVENT_MESSAGE_IDS_LIMIT",
+        )
+        settings.sample_event_message_ids = (
+            bool(os.environ.get("SLS_SAMPLE_EVENT_MESSAGE_IDS"))
+            or sample_event_message_ids
+        )
+        settings.dev_mode_buffer_max_items = _resolve_int_setting(
+            "SLS_DEV_MODE_BUFFER_MAX_ITEMS",
+            dev_mode_buffer_max_items,
+            "INVALID_DEV_MODE_BUFFER_SETTING",
+        )
+        settings.dev_mode_buffer_max_bytes = _resolve_int_setting(
+            "SLS_DEV_MODE_BUFFER_MAX_BYTES",
+            dev_mode_buffer_max_bytes,
+            "INVALID_DEV_MODE_BUFFER_SETTING",
+        )
+        settings.dev_mode_buffer_drop_policy = _resolve_drop_policy(
+            dev_mode_buffer_drop_policy
+        )
         if not settings.disable_aws_sdk_monitoring:
             baseSdk.instrumentation.aws_sdk.install()
     except Exception as error:
@@ -80,6 +150,8 @@ class AwsLambdaTraceSpans(TraceSpans):
 
 class AwsLambdaSdk(ServerlessSdk):
     trace_spans: AwsLambdaTraceSpans
+    sampler: Sampler
+    trace_records: Callable[[Iterable[Record]], Iterator[Record]]
     _is_dev_mode: bool
 
 
@@ -6,19 +6,21 @@ import copy
 import json
 from typing import List, Optional, Any
 from typing_extensions import Final
-import random
 from sls_sdk.lib.timing import to_protobuf_epoch_timestamp
 from .lib.sdk import serverlessSdk
 from .lib.invocation_context import (
     set as set_invocation_context,
     get as get_invocation_context,
 )
-from .lib.payload_conversion import to_trace_payload, to_request_response_payload
+from .lib.payload_conversion import (
+    encode_trace_payload,
+    to_request_response_payload,
+)
 from .lib.event_tags import resolve as resolve_event_tags
+from .lib import telemetry_writer
 from .lib.response_tags import resolve as resolve_response_tags
 from sls_sdk.lib.trace import TraceSpan
 from sls_sdk.lib.captured_event import CapturedEvent
-import base64
 
 
 def debug_log(msg):
@@ -30,6 +32,8 @@ __all__: Final[List[str]] = [
     "instrument",
 ]
 
+_TELEMETRY_LOG_PREFIX: Final[bytes] = b"SERVERLESS_TELEMETRY.T."
+
 
 def _resolve_outcome_enum_value(outcome: str) -> int:
     if outcome == "success":
@@ -78,10 +82,8 @@ class Instrumenter:
         self.current_invocation_id = 0
         serverlessSdk._captured_events = []
         self.event_loop = None
+        self.is_event_loop_flushed = False
         serverlessSdk._event_emitter.on("captured-event", self._captured_event_handler)
-        serverlessSdk._event_emitter.on(
-            "trace-span-close", self._trace_span_close_handler
-        )
         serverlessSdk._initialize()
 
         self.aws_lambda = serverlessSdk.trace_spans.aws_lambda
@@ -97,11 +99,15 @@ class Instrumenter:
             from .lib.dev_mode import get_event_loop
 
             self.event_loop = get_event_loop()
+            serverlessSdk._event_emitter.on(
+                "trace-span-close", self._trace_span_close_handler
+            )
 
         serverlessSdk.trace_spans.aws_lambda_initialization.close()
 
     def _captured_event_handler(self, captured_event: CapturedEvent):
         serverlessSdk._captured_events.append(captured_event)
+        serverlessSdk.sampler.on_captured_event(captured_event)
         # Only report captured events, if dev mode is active and the event is not
         # a dev mode server issue, to prevent infinite loops.
         if self.event_loop and not (
@@ -110,9 +116,8 @@ class Instrumenter:
         ):
             self.event_loop.add_captured_event(captured_event)
 
-    def _trace_span_close_handler(self, span):
-        if self.event_loop:
-            self.event_loop.add_span(span)
+    def _trace_span_close_handler(self, span: TraceSpan):
+        self.event_loop.add_span(span)
 
     def _report_request(self, event, context):
         payload_dct = serverlessSdk._last_request = {
@@ -168,42 +173,32 @@ class Instrumenter:
             "request-response", payload_buffer.SerializeToString()
         )
 
+    def _core_trace_spans(self) -> List[TraceSpan]:
+        # `aws.lambda.initialization` is part of the first invocation trace only
+        spans = [self.aws_lambda]
+        initialization = serverlessSdk.trace_spans.aws_lambda_initialization
+        sub_spans = self.aws_lambda.sub_spans
+        if sub_spans and sub_spans[0] is initialization:
+            spans.append(initialization)
+        if serverlessSdk.trace_spans.aws_lambda_invocation:
+            spans.append(serverlessSdk.trace_spans.aws_lambda_invocation)
+        return spans
+
     def _report_trace(self, is_error_outcome: bool):
         is_sampled_out = (
-            (not is_error_outcome)
-            and (not serverlessSdk._is_debug_mode)
+            (not serverlessSdk._is_debug_mode)
             and (not serverlessSdk._is_dev_mode)
-            and (
-                not [
-                    e
-                    for e in serverlessSdk._captured_events
-                    if e.name
-                    in [
-                        "telemetry.error.generated.v1",
-                        "telemetry.warning.generated.v1",
-                    ]
-                ]
+            and serverlessSdk.sampler.is_sampled_out(
+                self.aws_lambda,
+                serverlessSdk.trace_spans.aws_lambda_invocation,
+                is_error_outcome,
             )
-            and random.random() > 0.2
         )
 
-        def _map_span(span: TraceSpan) -> Optional[TraceSpan]:
-            nonlocal is_sampled_out
-            core_trace_span_names = [
-                "aws.lambda",
-                "aws.lambda.initialization",
-                "aws.lambda.invocation",
-            ]
-            if is_sampled_out and span.name not in core_trace_span_names:
-                return None
-            span_payload = span.to_protobuf_dict()
-            del span_payload["input"]
-            del span_payload["output"]
-            return span_payload
-
-        payload_dct = {
-            "isSampledOut": is_sampled_out or None,
-            "slsTags": {
+        spans = self._core_trace_spans() if is_sampled_out else self.aws_lambda.spans
+
+        payload = encode_trace_payload(
+            {
                 "orgId": serverlessSdk.org_id,
                 "service": os.environ.get("AWS_LAMBDA_FUNCTION_NAME", None),
                 "sdk": {
@@ -212,23 +207,19 @@ class Instrumenter:
                     "runtime": "python",
                 },
             },
-            "spans": [s for s in map(_map_span, self.aws_lambda.spans) if s],
-            "events": [e.to_protobuf_dict() for e in serverlessSdk._captured_events]
-            if not is_sampled_out
-            else [],
-            "customTags": json.dumps(serverlessSdk._custom_tags)
+            spans,
+            serverlessSdk._captured_events if not is_sampled_out else [],
+            custom_tags=json.dumps(serverlessSdk._custom_tags)
             if not is_sampled_out
             else None,
-        }
-        payload = to_trace_payload(payload_dct)
-        print(
-            f"SERVERLESS_TELEMETRY.T.{base64.b64encode(payload.SerializeToString()).decode('utf-8')}"
+            is_sampled_out=is_sampled_out,
         )
+        telemetry_writer.write(_TELEMETRY_LOG_PREFIX, payload.SerializeToString())
 
-    def _flush_and_close_event_loop(self):
+    def _flush_event_loop(self):
+        self.is_event_loop_flushed = True
         if self.event_loop:
-            self.event_loop.terminate()
-            self.event_loop = None
+            self.event_loop.flush()
 
     def _close_trace(self, outcome: str, outcome_result: Optional[Any] = None):
         self.is_root_span_reset = False
@@ -266,7 +257,7 @@ class Instrumenter:
 
             if get_invocation_context():
                 self._report_trace(is_error_outcome)
-            self._flush_and_close_event_loop()
+            self._flush_event_loop()
             self._clear_root_span()
 
             debug_log(
@@ -286,6 +277,7 @@ class Instrumenter:
         del self.aws_lambda.end_time
         serverlessSdk._captured_events = []
         serverlessSdk._custom_tags.clear()
+        serverlessSdk.sampler.reset()
         self.is_root_span_reset = True
 
     def _handler(self, user_handler, event, context):
@@ -299,7 +291,7 @@ class Instrumenter:
 
             self.aws_lambda.tags["aws.lambda.request_id"] = context.aws_request_id
 
-            # Event loop may already be active in case of a cold start
+            # Event loop is started on initialization and kept across invocations
             # That's why we create it only if it's not already set
             if serverlessSdk._is_dev_mode and self.event_loop is None:
                 from .lib.dev_mode import get_event_loop
@@ -312,6 +304,7 @@ class Instrumenter:
                 )
             )
             resolve_event_tags(event)
+            serverlessSdk.sampler.on_invocation_start(self.aws_lambda)
             if (
                 serverlessSdk._is_dev_mode
                 and not serverlessSdk._settings.disable_request_response_monitoring
@@ -342,11 +335,14 @@ class Instrumenter:
 
         def stub(event, context):
             nonlocal user_handler
+            self.is_event_loop_flushed = False
             try:
                 if not user_handler:
                     user_handler = user_handler_generator()
                 return self._handler(user_handler, event, context)
             finally:
-                self._flush_and_close_event_loop()
+                # flushed on trace close, unless it didn't get that far
+                if not self.is_event_loop_flushed:
+                    self._flush_event_loop()
 
         return stub
@@ -1,11 +1,20 @@
 import asyncio
+import concurrent.futures
 import json
 from threading import Thread, Event, Lock
 import os
-from .telemetry import send_async, close_session, open_session
+import time
+from typing import Optional
+from typing_extensions import Final
+from .telemetry import (
+    send_async,
+    close_session,
+    open_session,
+    get_stats as get_telemetry_stats,
+)
 from .sdk import serverlessSdk
 from .invocation_context import get as get_invocation_context
-from .payload_conversion import to_trace_payload
+from .payload_conversion import encode_trace_payload
 import builtins
 import logging
 
@@ -21,30 +30,114 @@ def _print(self, *args, **kwargs):
 builtins.print = _print
 
 
+# actions to take after data is added to the buffer
+SCHEDULE_FLUSH: Final[int] = 1
+FLUSH_NOW: Final[int] = 2
+
+# pending data is sent once there's this many spans and captured events
+MAX_BATCH_SIZE: Final[int] = 500
+# flush window (in seconds) shrinks as the rate grows, aiming for batches of this size
+TARGET_BATCH_SIZE: Final[int] = 100
+MIN_FLUSH_WINDOW: Final[float] = 0.005
+MAX_FLUSH_WINDOW: Final[float] = 0.05
+# flush at the end of an invocation waits at most this long (in seconds)
+# for the dev mode extension to acknowledge sent data
+FLUSH_TIMEOUT: Final[float] = 2.0
+
+
+DEFAULT_MAX_ITEMS: Final[int] = 10_000
+
+
+def _in_order(items: list, head: int) -> list:
+    return items[head:] + items[:head] if head else items
+
+
 class ThreadSafeBuffer:
-    def __init__(self):
+    """
+    Buffers spans and captured events, and tells whether a flush should be
+    scheduled, or done right away, so that at most one flush is pending.
+
+    Each of spans and captured events is bounded by `max_items`. Once that many
+    are pending, either the oldest ones are overwritten in a ring (`drop_oldest`),
+    or new ones are dropped.
+    """
+
+    def __init__(self, max_items: int = DEFAULT_MAX_ITEMS, drop_oldest: bool = True):
+        self._max_items = max_items
+        self._drop_oldest = drop_oldest
         self._pending_spans = []
         self._pending_captured_events = []
+        # positions of the oldest items, once pending lists are full
+        self._spans_head = 0
+        self._captured_events_head = 0
+        self._dropped = 0
         self._lock = Lock()
+        self._is_flush_scheduled = False
+        self._is_flush_requested = False
 
     def get_all(self):
+        # pending lists are swapped for new ones, and not copied
         with self._lock:
-            spans, captured_events = (
-                self._pending_spans.copy(),
-                self._pending_captured_events.copy(),
+            spans, spans_head = self._pending_spans, self._spans_head
+            captured_events, captured_events_head = (
+                self._pending_captured_events,
+                self._captured_events_head,
             )
-
-            self._pending_spans.clear()
-            self._pending_captured_events.clear()
-            return (spans, captured_events)
-
-    def add_span(self, span):
+            self._pending_spans = []
+            self._pending_captured_events = []
+            self._spans_head = 0
+            self._captured_events_head = 0
+            self._is_flush_scheduled = False
+            self._is_flush_requested = False
+        return (
+            _in_order(spans, spans_head),
+            _in_order(captured_events, captured_events_head),
+        )
+
+    def take_dropped_count(self) -> int:
+        """
+        Number of spans and captured events dropped since the previous call.
+        """
         with self._lock:
-            self._pending_spans.append(span)
+            dropped, self._dropped = self._dropped, 0
+            return dropped
+
+    def _add(self, items: list, head: int, item) -> int:
+        if len(items) < self._max_items:
+            items.append(item)
+            return head
+        self._dropped += 1
+        if not self._drop_oldest or not self._max_items:
+            return head
+        items[head] = item
+        return (head + 1) % self._max_items
+
+    def _resolve_action(self) -> Optional[int]:
+        if not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            return SCHEDULE_FLUSH
+        if (
+            not self._is_flush_requested
+            and len(self._pending_spans) + len(self._pending_captured_events)
+            >= MAX_BATCH_SIZE
+        ):
+            self._is_flush_requested = True
+            return FLUSH_NOW
+        return None
+
+    def add_span(self, span) -> Optional[int]:
+        with self._lock:
+            self._spans_head = self._add(self._pending_spans, self._spans_head, span)
+            return self._resolve_action()
 
-    def add_captured_event(self, captured_event):
+    def add_captured_event(self, captured_event) -> Optional[int]:
         with self._lock:
-            self._pending_captured_events.append(captured_event)
+            self._captured_events_head = self._add(
+                self._pending_captured_events,
+                self._captured_events_head,
+                captured_event,
+            )
+            return self._resolve_action()
 
     def __len__(self):
         with self._lock:
@@ -78,18 +171,37 @@ class EventLoop(Thread):
     1. Main thread can add spans and captured events to the buffer.
     2. Main thread can schedule a task to be executed in the asyncio loop.
     3. Main thread can flush the buffer.
-    4. Main thread can stop the asyncio loop.
+    4. Main thread can wait until all data sent so far is acknowledged (flush).
+    5. Main thread can stop the asyncio loop.
+
+    The thread is started once and kept for the lifetime of the container,
+    invocations end with a flush.
     """
 
     def __init__(self, start_event):
-        super().__init__()
+        # doesn't block interpreter exit, data is flushed at the end of invocations
+        super().__init__(daemon=True)
 
         self._loop = None
         self._event = start_event  # when the thread starts, the event will be signalled
-        self._buffered_data = (
-            ThreadSafeBuffer()
-        )  # used to buffer spans and captured events
+        # used to buffer spans and captured events
+        if serverlessSdk._is_initialized:
+            settings = serverlessSdk._settings
+            self._buffered_data = ThreadSafeBuffer(
+                settings.dev_mode_buffer_max_items,
+                settings.dev_mode_buffer_drop_policy == "oldest",
+            )
+        else:
+            self._buffered_data = ThreadSafeBuffer()
+        self._reported_dropped_payloads = 0
         self._scheduled_tasks = ScheduledTasks()
+        self._flush_handle = None
+        self._flush_scheduled_at = None
+        self._rate = None  # spans and captured events per second
+        self._window = MAX_FLUSH_WINDOW
+        self._batches = 0
+        self._batched_items = 0
+        self._early_flushes = 0
 
     def send_telemetry(self, name: str, body: bytes):
         """
@@ -104,19 +216,22 @@ class EventLoop(Thread):
         self._loop.call_soon_threadsafe(_add_task, coro)
 
     def _send_data(self):
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         (spans, captured_events) = self._buffered_data.get_all()
+        self._report_dropped()
 
         if not spans and not captured_events:
             return
 
-        def _convert_span(span):
-            span_payload = span.to_protobuf_dict()
-            del span_payload["input"]
-            del span_payload["output"]
-            return span_payload
+        self._update_window(len(spans) + len(captured_events))
 
-        payload = {
-            "slsTags": {
+        if not get_invocation_context():
+            spans = [s for s in spans if s.name != "aws.lambda"]
+
+        payload = encode_trace_payload(
+            {
                 "orgId": serverlessSdk.org_id,
                 "service": os.environ.get("AWS_LAMBDA_FUNCTION_NAME", None),
                 "sdk": {
@@ -125,34 +240,113 @@ class EventLoop(Thread):
                     "runtime": "python",
                 },
             },
-            "spans": [_convert_span(s) for s in spans],
-            "events": [e.to_protobuf_dict() for e in captured_events],
-            "customTags": json.dumps(serverlessSdk._custom_tags),
-        }
-        if not get_invocation_context():
-            payload["spans"] = [
-                s for s in payload["spans"] if s["name"] != "aws.lambda"
-            ]
-
-        self.send_telemetry("trace", to_trace_payload(payload).SerializeToString())
+            spans,
+            captured_events,
+            custom_tags=json.dumps(serverlessSdk._custom_tags),
+        )
+        self.send_telemetry("trace", payload.SerializeToString())
+
+    def _report_dropped(self):
+        dropped_items = self._buffered_data.take_dropped_count()
+        dropped_payloads = (
+            get_telemetry_stats()["dropped_payloads"] - self._reported_dropped_payloads
+        )
+        if not dropped_items and not dropped_payloads:
+            return
+        self._reported_dropped_payloads += dropped_payloads
+        serverlessSdk._report_notice(
+            f"Dropped {dropped_items} spans and captured events, "
+            f"and {dropped_payloads} telemetry payloads: "
+            "Dev mode extension doesn't keep up",
+            "DEV_MODE_SERVER_OVERLOAD",
+            serverlessSdk.trace_spans.aws_lambda,
+        )
+
+    def _update_window(self, batch_size: int):
+        """
+        Adapt the flush window to the observed rate, so that batches
+        aim for `TARGET_BATCH_SIZE` items without delaying data longer than
+        `MAX_FLUSH_WINDOW`.
+        """
+        self._batches += 1
+        self._batched_items += batch_size
+        if self._flush_scheduled_at is None:
+            return
+        elapsed = time.monotonic() - self._flush_scheduled_at
+        self._flush_scheduled_at = None
+        if elapsed <= 0:
+            return
+        rate = batch_size / elapsed
+        self._rate = rate if self._rate is None else (self._rate + rate) / 2
+        self._window = max(
+            MIN_FLUSH_WINDOW, min(MAX_FLUSH_WINDOW, TARGET_BATCH_SIZE / self._rate)
+        )
 
-    def _schedule_eventually(self):
+    def _schedule_eventually(self, action: Optional[int]):
         """
-        If there is no scheduled task, schedule one to be executed in the future.
+        Schedule a flush, unless one is already scheduled,
+        or flush right away if enough data is pending.
         """
+        if action == SCHEDULE_FLUSH:
+            self._flush_scheduled_at = time.monotonic()
+            window = self._window
 
-        def _schedule_for_later():
-            self._loop.call_later(0.05, self._send_data)
+            def _schedule_for_later():
+                self._flush_handle = self._loop.call_later(window, self._send_data)
 
-        self._loop.call_soon_threadsafe(_schedule_for_later)
+            self._loop.call_soon_threadsafe(_schedule_for_later)
+        elif action == FLUSH_NOW:
+            self._early_flushes += 1
+            self._loop.call_soon_threadsafe(self._send_data)
 
     def add_span(self, span):
-        self._buffered_data.add_span(span)
-        self._schedule_eventually()
+        self._schedule_eventually(self._buffered_data.add_span(span))
 
     def add_captured_event(self, captured_event):
-        self._buffered_data.add_captured_event(captured_event)
-        self._schedule_eventually()
+        self._schedule_eventually(
+            self._buffered_data.add_captured_event(captured_event)
+        )
+
+    def get_stats(self) -> dict:
+        """
+        Trace payload batching stats: batches sent, their average size,
+        flushes done early due to batch size, and the current flush window.
+        """
+        return {
+            "batches": self._batches,
+            "average_batch_size": (
+                self._batched_items / self._batches if self._batches else 0
+            ),
+            "early_flushes": self._early_flushes,
+            "flush_window": self._window,
+        }
+
+    def flush(self):
+        """
+        Send buffered data, and block until all telemetry sent so far
+        is acknowledged by the dev mode extension, or `FLUSH_TIMEOUT` passes.
+        """
+        future = asyncio.run_coroutine_threadsafe(self._flush(), self._loop)
+        try:
+            future.result(FLUSH_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            # stops waiting only, sending continues in the background
+            future.cancel()
+            serverlessSdk._report_notice(
+                f"Telemetry not acknowledged within {FLUSH_TIMEOUT}s: "
+                "Dev mode extension doesn't respond",
+                "DEV_MODE_FLUSH_TIMEOUT",
+                serverlessSdk.trace_spans.aws_lambda,
+            )
+
+    async def _flush(self):
+        self._send_data()
+        # let tasks scheduled with `call_soon_threadsafe` be created
+        await asyncio.sleep(0)
+        tasks = self._scheduled_tasks.get_all()
+        if tasks:
+            # unlike `gather`, cancellation on timeout doesn't cancel the tasks
+            await asyncio.wait(tasks)
 
     def run(self):
         """
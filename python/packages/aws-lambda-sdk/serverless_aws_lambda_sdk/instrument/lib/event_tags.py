@@ -149,21 +149,110 @@ _SNS_EVENT_MAP = [
 ]
 
 
-def _does_key_match(event, key):
-    if isinstance(key, list):
-        if key[0] == 0:
-            if not isinstance(event, list):
+_KINESIS_EVENT_MAP = [
+    [
+        "Records",
+        [
+            [
+                0,
+                [
+                    [
+                        "kinesis",
+                        ["partitionKey", "sequenceNumber", "data"],
+                    ],
+                    "eventSource",
+                    "eventID",
+                    "eventSourceARN",
+                    "awsRegion",
+                ],
+            ],
+        ],
+    ],
+]
+
+_DYNAMODB_STREAM_EVENT_MAP = [
+    [
+        "Records",
+        [
+            [
+                0,
+                [
+                    "eventID",
+                    "eventName",
+                    "eventSource",
+                    ["dynamodb", ["Keys", "SequenceNumber", "StreamViewType"]],
+                    "eventSourceARN",
+                    "awsRegion",
+                ],
+            ],
+        ],
+    ],
+]
+
+_S3_EVENT_MAP = [
+    [
+        "Records",
+        [
+            [
+                0,
+                [
+                    "eventSource",
+                    "eventName",
+                    "awsRegion",
+                    ["s3", ["bucket", "object"]],
+                ],
+            ],
+        ],
+    ],
+]
+
+_EVENTBRIDGE_EVENT_MAP = [
+    "version",
+    "id",
+    "detail-type",
+    "source",
+    "account",
+    "time",
+    "region",
+    "resources",
+    "detail",
+]
+
+
+class _EventShape:
+    """Event map compiled to a matcher.
+
+    Plain keys are checked at once against the event keys,
+    nested maps are matched only when all plain keys are present.
+    """
+
+    __slots__ = ("keys", "nested")
+
+    def __init__(self, event_map):
+        self.keys = frozenset(key for key in event_map if not isinstance(key, list))
+        self.nested = tuple(
+            (key[0], _EventShape(key[1])) for key in event_map if isinstance(key, list)
+        )
+
+    def matches(self, event) -> bool:
+        if isinstance(event, dict):
+            if not event.keys() >= self.keys:
                 return False
-        elif key[0] not in event:
+        elif isinstance(event, list):
+            if not all(key in event for key in self.keys):
+                return False
+        else:
             return False
-        return _does_event_match_map(event[key[0]], key[1])
-    return key in event
-
 
-def _does_event_match_map(event, map):
-    if not isinstance(event, list) and not isinstance(event, dict):
-        return False
-    return all([_does_key_match(event, key) for key in map])
+        for key, shape in self.nested:
+            if key == 0:
+                if not isinstance(event, list) or not event:
+                    return False
+            elif key not in event:
+                return False
+            if not shape.matches(event[key]):
+                return False
+        return True
 
 
 def _resolve_api_gateway_event(event):
@@ -294,6 +383,34 @@ def _resolve_alb_event(event):
     aws_lambda_span.tags.set("aws.lambda.http_router.path", event.get("path"))
 
 
+def _resolve_message_ids(records, get_message_id, notice_code):
+    """
+    Resolve message ids of batch records, up to `event_message_ids_limit` of them.
+
+    Ids of bigger batches are taken from the head of the batch, or evenly across it
+    with `sample_event_message_ids`, and the total count is reported with a notice.
+    """
+    settings = serverlessSdk._settings
+    limit = settings.event_message_ids_limit
+    count = len(records)
+    if count <= limit:
+        return [get_message_id(record) for record in records]
+
+    if not limit:
+        selected = ()
+    elif settings.sample_event_message_ids:
+        step = count / limit
+        selected = (records[int(index * step)] for index in range(limit))
+    else:
+        selected = records[:limit]
+    serverlessSdk._report_notice(
+        f"Reported {limit} out of {count} message ids of the batch",
+        notice_code,
+        aws_lambda_span,
+    )
+    return [get_message_id(record) for record in selected]
+
+
 def _resolve_sqs_event(event):
     queue_arn = event.get("Records", [{}])[0].get("eventSourceARN")
     aws_lambda_span.tags.update(
@@ -306,7 +423,11 @@ def _resolve_sqs_event(event):
     aws_lambda_span.tags.update(
         {
             "queue_name": queue_arn.split(":")[-1],
-            "message_ids": [record.get("messageId") for record in event.get("Records")],
+            "message_ids": _resolve_message_ids(
+                event.get("Records"),
+                lambda record: record.get("messageId"),
+                "SQS_MESSAGE_IDS_LIMITED",
+            ),
         },
         "aws.lambda.sqs",
     )
@@ -324,25 +445,89 @@ def _resolve_sns_event(event):
     aws_lambda_span.tags.update(
         {
             "topic_name": topic_arn.split(":")[-1],
-            "message_ids": [
-                record.get("Sns", {}).get("MessageId")
-                for record in event.get("Records")
-            ],
+            "message_ids": _resolve_message_ids(
+                event.get("Records"),
+                lambda record: record.get("Sns", {}).get("MessageId"),
+                "SNS_MESSAGE_IDS_LIMITED",
+            ),
         },
         "aws.lambda.sns",
     )
 
 
+def _resolve_kinesis_event(event):
+    aws_lambda_span.tags.update(
+        {
+            "event_source": "aws.kinesis",
+            "event_type": "aws.kinesis",
+        },
+        "aws.lambda",
+    )
+
+
+def _resolve_dynamodb_stream_event(event):
+    aws_lambda_span.tags.update(
+        {
+            "event_source": "aws.dynamodb",
+            "event_type": "aws.dynamodb.stream",
+        },
+        "aws.lambda",
+    )
+
+
+def _resolve_s3_event(event):
+    aws_lambda_span.tags.update(
+        {
+            "event_source": "aws.s3",
+            "event_type": "aws.s3",
+        },
+        "aws.lambda",
+    )
+
+
+def _resolve_eventbridge_event(event):
+    aws_lambda_span.tags.update(
+        {
+            "event_source": "aws.events",
+            "event_type": "aws.events",
+        },
+        "aws.lambda",
+    )
+
+
+# in order of precedence, although in practice the shapes are mutually exclusive
+_EVENT_SHAPES = (
+    (_EventShape(_API_GATEWAY_EVENT_MAP), _resolve_api_gateway_event),
+    (_EventShape(_HTTP_API_V2_EVENT_MAP), _resolve_http_api_v2_event),
+    (_EventShape(_ALB_EVENT_MAP), _resolve_alb_event),
+    (_EventShape(_SQS_EVENT_MAP), _resolve_sqs_event),
+    (_EventShape(_SNS_EVENT_MAP), _resolve_sns_event),
+    (_EventShape(_KINESIS_EVENT_MAP), _resolve_kinesis_event),
+    (_EventShape(_DYNAMODB_STREAM_EVENT_MAP), _resolve_dynamodb_stream_event),
+    (_EventShape(_S3_EVENT_MAP), _resolve_s3_event),
+    (_EventShape(_EVENTBRIDGE_EVENT_MAP), _resolve_eventbridge_event),
+)
+
+# functions usually receive events of a single type, last matched shape is tried first
+_last_matched = None
+
+
+def _match_event(event):
+    global _last_matched
+    last_matched = _last_matched
+    if last_matched is not None and last_matched[0].matches(event):
+        return last_matched[1]
+
+    for entry in _EVENT_SHAPES:
+        if entry is not last_matched and entry[0].matches(event):
+            _last_matched = entry
+            return entry[1]
+    return None
+
+
 def resolve(event):
     if not isinstance(event, dict):
         return
-    if _does_event_match_map(event, _API_GATEWAY_EVENT_MAP):
-        _resolve_api_gateway_event(event)
-    elif _does_event_match_map(event, _HTTP_API_V2_EVENT_MAP):
-        _resolve_http_api_v2_event(event)
-    elif _does_event_match_map(event, _ALB_EVENT_MAP):
-        _resolve_alb_event(event)
-    elif _does_event_match_map(event, _SQS_EVENT_MAP):
-        _resolve_sqs_event(event)
-    elif _does_event_match_map(event, _SNS_EVENT_MAP):
-        _resolve_sns_event(event)
+    resolve_event = _match_event(event)
+    if resolve_event:
+        resolve_event(event)
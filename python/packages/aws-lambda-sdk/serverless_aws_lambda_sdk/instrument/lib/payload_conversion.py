@@ -1,5 +1,20 @@
+import json
 from serverless_sdk_schema import TracePayload, RequestResponse
 from google.protobuf import json_format
+from google.protobuf.descriptor import FieldDescriptor
+from sls_sdk.lib.tags import _snake_to_camel_case, _to_key_path
+from sls_sdk.lib.timing import to_protobuf_epoch_timestamp
+
+
+_INTEGER_CPP_TYPES = (
+    FieldDescriptor.CPPTYPE_INT32,
+    FieldDescriptor.CPPTYPE_INT64,
+    FieldDescriptor.CPPTYPE_UINT32,
+    FieldDescriptor.CPPTYPE_UINT64,
+)
+
+# (message descriptor, camelCased tag key token) -> field descriptor
+_field_cache = {}
 
 
 def to_trace_payload(payload_dct: dict) -> TracePayload:
@@ -26,3 +41,126 @@ def to_request_response_payload(payload_dct: dict) -> RequestResponse:
     payload.span_id = bytes(payload_dct["spanId"], "utf-8")
     payload.trace_id = bytes(payload_dct["traceId"], "utf-8")
     return payload
+
+
+def encode_trace_payload(
+    sls_tags: dict,
+    spans,
+    captured_events=(),
+    custom_tags=None,
+    is_sampled_out: bool = False,
+) -> TracePayload:
+    """
+    Build a TracePayload directly from TraceSpan and CapturedEvent objects.
+
+    Produces the same message as passing `to_protobuf_dict()` results through
+    `to_trace_payload`, without the intermediate dicts and `json_format` round trip.
+    Span input and output bodies are not included, same as in trace payloads.
+    """
+    payload = TracePayload()
+    _fill_message(payload.sls_tags, sls_tags)
+    for span in spans:
+        encode_span(payload.spans.add(), span)
+    for captured_event in captured_events:
+        encode_captured_event(payload.events.add(), captured_event)
+    if custom_tags is not None:
+        payload.custom_tags = custom_tags
+    if is_sampled_out:
+        payload.is_sampled_out = True
+    return payload
+
+
+def encode_span(message, span):
+    message.id = span.id.encode("utf-8")
+    message.trace_id = span.trace_id.encode("utf-8")
+    if span.parent_span:
+        message.parent_span_id = span.parent_span.id.encode("utf-8")
+    message.name = span.name
+    if span.start_time is not None:
+        message.start_time_unix_nano = to_protobuf_epoch_timestamp(span.start_time)
+    if span.end_time is not None:
+        message.end_time_unix_nano = to_protobuf_epoch_timestamp(span.end_time)
+    # read the underlying tag containers, to not allocate them for untagged spans
+    _fill_tags(message.tags, span._tags or {})
+    if span._custom_tags:
+        message.custom_tags = json.dumps(span._custom_tags)
+    return message
+
+
+def encode_captured_event(message, captured_event):
+    message.id = captured_event.id.encode("utf-8")
+    if captured_event.trace_span:
+        message.trace_id = captured_event.trace_span.trace_id.encode("utf-8")
+        message.span_id = captured_event.trace_span.id.encode("utf-8")
+    message.timestamp_unix_nano = to_protobuf_epoch_timestamp(captured_event.timestamp)
+    message.event_name = captured_event.name
+    # stack trace tags of captured events are formatted on read
+    _fill_tags(message.tags, captured_event.tags)
+    message.custom_tags = json.dumps(captured_event._custom_tags or {})
+    if captured_event.custom_fingerprint is not None:
+        message.custom_fingerprint = captured_event.custom_fingerprint
+    return message
+
+
+def _resolve_field(descriptor, token: str) -> FieldDescriptor:
+    key = (descriptor, token)
+    field = _field_cache.get(key)
+    if field is not None:
+        return field
+
+    # same lookup rules as json_format.ParseDict applied to camelCased tag tokens
+    name = _snake_to_camel_case(token)
+    field = next(
+        (f for f in descriptor.fields if f.json_name == name),
+        descriptor.fields_by_name.get(name),
+    )
+    if field is None:
+        raise json_format.ParseError(
+            f'Message type "{descriptor.full_name}" has no field named "{name}".'
+        )
+    _field_cache[key] = field
+    return field
+
+
+def _set_field(message, field: FieldDescriptor, value):
+    if field.message_type is not None:
+        sub_message = getattr(message, field.name)
+        sub_message.SetInParent()
+        _fill_message(sub_message, value)
+    elif isinstance(value, list):
+        getattr(message, field.name).extend(value)
+    elif field.enum_type is not None and isinstance(value, str):
+        setattr(message, field.name, field.enum_type.values_by_name[value].number)
+    elif field.cpp_type in _INTEGER_CPP_TYPES and isinstance(value, float):
+        if not value.is_integer():
+            raise json_format.ParseError(f"Couldn't parse integer: {value}.")
+        setattr(message, field.name, int(value))
+    else:
+        setattr(message, field.name, value)
+
+
+def _fill_message(message, dct: dict):
+    if not isinstance(dct, dict):
+        raise json_format.ParseError(
+            f"Expected object for {message.DESCRIPTOR.full_name}, received {dct}."
+        )
+    for key, value in dct.items():
+        if value is None:
+            continue
+        _set_field(message, _resolve_field(message.DESCRIPTOR, key), value)
+
+
+def _fill_tags(message, tags):
+    message.SetInParent()
+    contexts = {(): message}
+    for key, value in tags.items():
+        parent_path, last_token = _to_key_path(key)
+        context = contexts.get(parent_path)
+        if context is None:
+            context = message
+            for token in parent_path:
+                context = getattr(
+                    context, _resolve_field(context.DESCRIPTOR, token).name
+                )
+            contexts[parent_path] = context
+        _set_field(context, _resolve_field(context.DESCRIPTOR, last_token), value)
@@ -1,46 +1,215 @@
 from .sdk import serverlessSdk
 
 if serverlessSdk._is_dev_mode:
+    import asyncio
     import time
+    from collections import deque
     import aiohttp
 
-    _session = None
-
     _TELEMETRY_SERVER_URL = "http://localhost:2773/"
 
-    async def close_session():
-        global _session
-        if _session:
-            await _session.close()
-            _session = None
+    # Trace payloads differ in repeated fields only, and concatenated protobuf
+    # messages parse as a single message with repeated fields merged,
+    # so pending trace payloads are sent together in a single request.
+    _COALESCED_PAYLOAD_NAMES = frozenset(("trace",))
 
-    async def open_session():
-        global _session
-        conn = aiohttp.TCPConnector(limit=10)
-        _session = aiohttp.ClientSession(connector=conn)
-        _session._sls_ignore = True
+    DEFAULT_MAX_BYTES = 16 * 1024 * 1024
 
-    async def send_async(name: str, body: bytes):
-        request_start_time = time.perf_counter_ns()
-        serverlessSdk._debug_log(f"Telemetry send {name}")
-        try:
-            async with _session.get(
+    class TelemetryStats:
+        __slots__ = (
+            "payloads",
+            "requests",
+            "failed_requests",
+            "dropped_payloads",
+            "pending_payloads",
+            "max_pending_payloads",
+            "max_pending_bytes",
+        )
+
+        def __init__(self):
+            self.payloads = 0
+            self.requests = 0
+            self.failed_requests = 0
+            self.dropped_payloads = 0
+            self.pending_payloads = 0
+            self.max_pending_payloads = 0
+            self.max_pending_bytes = 0
+
+        @property
+        def coalesced_payloads(self) -> int:
+            return (
+                self.payloads
+                - self.pending_payloads
+                - self.dropped_payloads
+                - self.requests
+            )
+
+        def to_dict(self) -> dict:
+            return {
+                "payloads": self.payloads,
+                "requests": self.requests,
+                "coalesced_payloads": self.coalesced_payloads,
+                "failed_requests": self.failed_requests,
+                "dropped_payloads": self.dropped_payloads,
+                "max_pending_payloads": self.max_pending_payloads,
+                "max_pending_bytes": self.max_pending_bytes,
+            }
+
+    class TelemetryTransport:
+        """
+        Sends telemetry payloads to the dev mode extension over a single
+        keep-alive connection.
+
+        Payloads are sent one request at a time, in order. Payloads that queue up
+        while a request is in flight are coalesced when their type allows it,
+        so that a slow extension results in fewer, bigger requests.
+
+        Queued payloads are bounded by `max_bytes`. When it's exceeded,
+        either the oldest queued payloads are dropped (`drop_oldest`), or the new one.
+        """
+
+        def __init__(
+            self, max_bytes: int = DEFAULT_MAX_BYTES, drop_oldest: bool = True
+        ):
+            self._max_bytes = max_bytes
+            self._drop_oldest = drop_oldest
+            self._session = None
+            self._pending = deque()
+            self._pending_bytes = 0
+            self._sender = None
+            self.stats = TelemetryStats()
+
+        async def open(self):
+            conn = aiohttp.TCPConnector(limit=1)
+            self._session = aiohttp.ClientSession(connector=conn)
+            self._session._sls_ignore = True
+
+        async def close(self):
+            if self._sender:
+                await self._sender
+            if self._session:
+                await self._session.close()
+                self._session = None
+            serverlessSdk._debug_log(f"Telemetry transport: {self.stats.to_dict()}")
+
+        async def send(self, name: str, body: bytes):
+            """
+            Queue the payload, and resolve once it's sent (or failed to be sent).
+            """
+            stats = self.stats
+            stats.payloads += 1
+            size = len(body)
+            if self._pending and self._pending_bytes + size > self._max_bytes:
+                if not self._drop_oldest:
+                    stats.dropped_payloads += 1
+                    return
+                while self._pending and self._pending_bytes + size > self._max_bytes:
+                    self._drop_oldest_pending()
+
+            done = asyncio.get_running_loop().create_future()
+            self._pending.append((name, body, done))
+            self._pending_bytes += size
+            stats.pending_payloads += 1
+            if stats.pending_payloads > stats.max_pending_payloads:
+                stats.max_pending_payloads = stats.pending_payloads
+            if self._pending_bytes > stats.max_pending_bytes:
+                stats.max_pending_bytes = self._pending_bytes
+
+            if self._sender is None or self._sender.done():
+                self._sender = asyncio.ensure_future(self._send_pending())
+            await done
+
+        def _drop_oldest_pending(self):
+            _, body, done = self._pending.popleft()
+            self._pending_bytes -= len(body)
+            self.stats.pending_payloads -= 1
+            self.stats.dropped_payloads += 1
+            done.set_result(None)
+
+        def _take_next(self):
+            name, body, done = self._pending.popleft()
+            bodies, waiters = [body], [done]
+            if name in _COALESCED_PAYLOAD_NAMES:
+                while self._pending and self._pending[0][0] == name:
+                    _, body, done = self._pending.popleft()
+                    bodies.append(body)
+                    waiters.append(done)
+            self._pending_bytes -= sum(len(body) for body in bodies)
+            self.stats.pending_payloads -= len(bodies)
+            return name, bodies[0] if len(bodies) == 1 else b"".join(bodies), waiters
+
+        async def _send_pending(self):
+            while self._pending:
+                name, body, waiters = self._take_next()
+                try:
+                    await self._post(name, body)
+                finally:
+                    for done in waiters:
+                        if not done.done():
+                            done.set_result(None)
+
+        def _request(self, name: str, body: bytes):
+            return self._session.post(
                 _TELEMETRY_SERVER_URL + name,
                 data=body,
-                headers={
-                    "Content-Type": "application/x-protobuf",
-                    "Content-Length": str(len(body)),
-                },
-            ) as response:
-                if response.status != 200:
-                    serverlessSdk._report_warning(
-                        "Cannot propagate telemetry, "
-                        f'server responded with "{response.status}" status code\n',
-                        "DEV_MODE_SERVER_REJECTION",
-                    )
-        except Exception as ex:
-            serverlessSdk._report_warning(
-                f"Cannot propagate telemetry: {ex}", "DEV_MODE_SERVER_ERROR"
+                headers={"Content-Type": "application/x-protobuf"},
             )
-        diff = int((time.perf_counter_ns() - request_start_time) / 1000_000)
-        serverlessSdk._debug_log(f"Telemetry sent in: {diff}ms")
+
+        async def _post(self, name: str, body: bytes):
+            request_start_time = time.perf_counter_ns()
+            serverlessSdk._debug_log(f"Telemetry send {name}")
+            self.stats.requests += 1
+            try:
+                try:
+                    response = await self._request(name, body)
+                except aiohttp.ServerDisconnectedError:
+                    # kept alive connection may have been closed by the extension
+                    # while the container was frozen, retry on a new one
+                    response = await self._request(name, body)
+                async with response:
+                    # read the response fully, so that the connection is reused
+                    await response.read()
+                    if response.status != 200:
+                        self.stats.failed_requests += 1
+                        serverlessSdk._report_warning(
+                            "Cannot propagate telemetry, "
+                            f'server responded with "{response.status}" status code\n',
+                            "DEV_MODE_SERVER_REJECTION",
+                        )
+            except Exception as ex:
+                self.stats.failed_requests += 1
+                serverlessSdk._report_warning(
+                    f"Cannot propagate telemetry: {ex}", "DEV_MODE_SERVER_ERROR"
+                )
+            diff = int((time.perf_counter_ns() - request_start_time) / 1000_000)
+            serverlessSdk._debug_log(f"Telemetry sent in: {diff}ms")
+
+    _transport = None
+
+    async def close_session():
+        global _transport
+        if _transport:
+            await _transport.close()
+            _transport = None
+
+    async def open_session():
+        global _transport
+        if serverlessSdk._is_initialized:
+            settings = serverlessSdk._settings
+            _transport = TelemetryTransport(
+                settings.dev_mode_buffer_max_bytes,
+                settings.dev_mode_buffer_drop_policy == "oldest",
+            )
+        else:
+            _transport = TelemetryTransport()
+        await _transport.open()
+
+    async def send_async(name: str, body: bytes):
+        await _transport.send(name, body)
+
+    def get_stats() -> dict:
+        """
+        Back-pressure stats of the current transport (payloads queued, requests
+        made, payloads coalesced, failed and dropped payloads, and peak queue size).
+        """
+        return _transport.stats.to_dict() if _transport else TelemetryStats().to_dict()
@@ -0,0 +1,58 @@
+import logging
+import os
+import sys
+from binascii import b2a_base64
+from typing_extensions import Final
+
+STDOUT_FILENO: Final[int] = 1
+
+# a multiple of 3, so that chunks are base64 encoded without padding
+_CHUNK_SIZE: Final[int] = 3 * 64 * 1024
+
+
+def _encoded_length(size: int) -> int:
+    return (size + 2) // 3 * 4
+
+
+def encode(prefix: bytes, payload: bytes) -> bytearray:
+    """
+    Encode `payload` as a base64 line following `prefix`.
+
+    The output buffer is allocated once, with its final size, and the payload
+    is encoded into it in chunks. At no point is another full copy of either held.
+    """
+    size = len(payload)
+    output = bytearray(len(prefix) + _encoded_length(size) + 1)
+    output_view = memoryview(output)
+    offset = len(prefix)
+    output_view[:offset] = prefix
+    with memoryview(payload) as payload_view:
+        for start in range(0, size, _CHUNK_SIZE):
+            chunk = b2a_base64(payload_view[start : start + _CHUNK_SIZE], newline=False)
+            output_view[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+    output_view[offset] = ord("\n")
+    output_view.release()
+    return output
+
+
+def write(prefix: bytes, payload: bytes, fd: int = STDOUT_FILENO):
+    """
+    Write `payload` as a base64 encoded line directly to the `fd` file descriptor.
+
+    Bypasses `print` and `sys.stdout`, so that the encoded payload
+    doesn't get decoded to `str` and re-encoded on the way out.
+    """
+    output = encode(prefix, payload)
+    # the same lock `print` (patched in dev mode) and logging calls serialize on,
+    # so that the payload line is not interleaved with their output
+    with logging._lock:
+        # make sure what was printed before is written first
+        try:
+            sys.stdout.flush()
+        except Exception:
+            pass
+        # a single write unless the descriptor accepts only part of the buffer
+        view = memoryview(output)
+        while view:
+            view = view[os.write(fd, view) :]
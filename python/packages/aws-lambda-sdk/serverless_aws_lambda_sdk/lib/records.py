@@ -0,0 +1,46 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, List, Optional, TypeVar
+from typing_extensions import Final
+
+from sls_sdk import serverlessSdk
+from sls_sdk.lib.trace import TraceSpan
+
+__all__: Final[List[str]] = [
+    "trace_records",
+]
+
+RECORD_SPAN_NAME: Final[str] = "aws.lambda.record"
+
+Record = TypeVar("Record")
+
+
+def _is_invocation_open() -> bool:
+    aws_lambda_invocation = getattr(
+        serverlessSdk.trace_spans, "aws_lambda_invocation", None
+    )
+    return aws_lambda_invocation is not None and aws_lambda_invocation.end_time is None
+
+
+def trace_records(records: Iterable[Record]) -> Iterator[Record]:
+    """Yield `records`, each processed within its own `aws.lambda.record` span.
+
+    A span is created only once its record is requested, and closed once the next
+    record is requested or iteration stops, so spans cover record processing only.
+    Outside of an invocation records are yielded as they are.
+    """
+    record_span: Optional[TraceSpan] = None
+    try:
+        for record in records:
+            if _is_invocation_open():
+                try:
+                    record_span = TraceSpan(RECORD_SPAN_NAME)
+                except Exception as ex:
+                    serverlessSdk._report_error(ex)
+            yield record
+            if record_span is not None:
+                if record_span.end_time is None:
+                    record_span.close()
+                record_span = None
+    finally:
+        if record_span is not None and record_span.end_time is None:
+            record_span.close()
@@ -0,0 +1,198 @@
+from __future__ import annotations
+import os
+import random
+import time
+from threading import Lock
+from typing import Callable, Dict, List, Optional
+from typing_extensions import Final
+
+from sls_sdk.lib.captured_event import CapturedEvent
+from sls_sdk.lib.trace import TraceSpan
+from sls_sdk.lib.warning import report as report_warning
+
+__all__: Final[List[str]] = [
+    "Sampler",
+    "SamplingPolicy",
+]
+
+DEFAULT_SAMPLING_RATE: Final[float] = 0.2
+
+_KEEP_EVENT_NAMES: Final[frozenset] = frozenset(
+    ("telemetry.error.generated.v1", "telemetry.warning.generated.v1")
+)
+
+# Custom policy, evaluated on invocation close with the root `aws.lambda` span
+# and whether invocation ended with an error.
+# Returns `True` to keep the trace, `False` to sample it out, `None` to not decide.
+SamplingPolicy = Callable[[TraceSpan, bool], Optional[bool]]
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        # at least one token, so that rates below one per second keep traces
+        self.capacity = max(1, rate) if capacity is None else capacity
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = Lock()
+
+    def consume(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def _parse_float(name: str) -> Optional[float]:
+    value = os.environ.get(name)
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        report_warning(
+            f'Ignored "{name}" environment variable: '
+            f'Expected a number, received "{value}"',
+            "INVALID_SAMPLING_SETTING",
+            type="USER",
+        )
+        return None
+
+
+def _parse_route_rates(name: str) -> Dict[str, float]:
+    value = os.environ.get(name)
+    if not value:
+        return {}
+    route_rates = {}
+    for entry in value.split(","):
+        route, _, rate = entry.strip().rpartition("=")
+        try:
+            if not route:
+                raise ValueError()
+            route_rates[route] = float(rate)
+        except ValueError:
+            report_warning(
+                f'Ignored "{entry}" entry of "{name}" environment variable: '
+                'Expected "<route>=<rate>"',
+                "INVALID_SAMPLING_SETTING",
+                type="USER",
+            )
+    return route_rates
+
+
+class Sampler:
+    """Decides which invocation traces are sampled out.
+
+    Sampled out traces are reported with core `aws.lambda*` spans only.
+    Traces are always kept if invocation errored or captured an error or warning.
+    Other traces are kept, in order of precedence:
+    - when `aws.lambda.invocation` took at least `latency_threshold` milliseconds,
+    - when a custom policy decides so,
+    - with `route_rates` probability for the invocation HTTP route,
+      and `rate` probability otherwise, while keeping no more than
+      `max_traces_per_second` traces this way.
+
+    Head (probability) decision is made once event tags are resolved, and
+    error and warning events are tracked as they are captured,
+    so that the final decision on invocation close doesn't traverse the trace.
+    `max_traces_per_second` budget is taken on that final decision, only by
+    traces kept with the head decision.
+    """
+
+    def __init__(self):
+        self._policies: List[SamplingPolicy] = []
+        self._bucket: Optional[TokenBucket] = None
+        self.rate = DEFAULT_SAMPLING_RATE
+        self.route_rates: Dict[str, float] = {}
+        self.latency_threshold: Optional[float] = None
+        self.reset()
+
+        self.configure(
+            rate=_parse_float("SLS_SAMPLING_RATE"),
+            route_rates=_parse_route_rates("SLS_SAMPLING_ROUTE_RATES"),
+            max_traces_per_second=_parse_float("SLS_SAMPLING_MAX_TRACES_PER_SECOND"),
+            latency_threshold=_parse_float("SLS_SAMPLING_LATENCY_THRESHOLD"),
+        )
+
+    def configure(
+        self,
+        rate: Optional[float] = None,
+        route_rates: Optional[Dict[str, float]] = None,
+        max_traces_per_second: Optional[float] = None,
+        latency_threshold: Optional[float] = None,
+    ):
+        if rate is not None:
+            self.rate = rate
+        if route_rates:
+            self.route_rates.update(route_rates)
+        if max_traces_per_second is not None:
+            self._bucket = TokenBucket(max_traces_per_second)
+        if latency_threshold is not None:
+            self.latency_threshold = latency_threshold
+
+    @property
+    def max_traces_per_second(self) -> Optional[float]:
+        return self._bucket.rate if self._bucket else None
+
+    def add_policy(self, policy: SamplingPolicy):
+        self._policies.append(policy)
+
+    def reset(self):
+        self._is_head_kept: Optional[bool] = None
+        self._is_rate_limit_applied = False
+        self._has_error_events = False
+
+    def on_captured_event(self, captured_event: CapturedEvent):
+        if captured_event.name in _KEEP_EVENT_NAMES:
+            self._has_error_events = True
+
+    def on_invocation_start(self, aws_lambda: TraceSpan):
+        route = aws_lambda.tags.get("aws.lambda.http_router.path")
+        rate = self.route_rates.get(route, self.rate) if route else self.rate
+        self._is_head_kept = random.random() <= rate
+
+    def is_sampled_out(
+        self,
+        aws_lambda: TraceSpan,
+        aws_lambda_invocation: Optional[TraceSpan],
+        is_error_outcome: bool,
+    ) -> bool:
+        if is_error_outcome or self._has_error_events:
+            return False
+
+        if (
+            self.latency_threshold is not None
+            and aws_lambda_invocation is not None
+            and aws_lambda_invocation.end_time is not None
+        ):
+            duration = (
+                aws_lambda_invocation.end_time - aws_lambda_invocation.start_time
+            ) / 1000_000
+            if duration >= self.latency_threshold:
+                return False
+
+        for policy in self._policies:
+            try:
+                decision = policy(aws_lambda, is_error_outcome)
+            except Exception as ex:
+                # to avoid circular dependency, require inline
+                from sls_sdk import serverlessSdk
+
+                # a failing policy should not cost the trace
+                serverlessSdk._report_error(ex, type="USER")
+                return False
+            if decision is not None:
+                return not decision
+
+        if self._is_head_kept is None:
+            self.on_invocation_start(aws_lambda)
+        if self._is_head_kept and not self._is_rate_limit_applied:
+            self._is_rate_limit_applied = True
+            self._is_head_kept = self._bucket is None or self._bucket.consume()
+        return not self._is_head_kept
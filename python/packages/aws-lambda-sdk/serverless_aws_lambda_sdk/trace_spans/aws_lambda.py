@@ -52,7 +52,7 @@ if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") == "on-demand":
 def _clear(self: TraceSpan):
     self.tags.clear()
     self.tags.update(IMMUTABLE_TAGS)
-    self.sub_spans.clear()
+    self._clear_sub_spans()
 
 
 TraceSpan.clear = _clear
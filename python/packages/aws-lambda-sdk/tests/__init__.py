@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import inspect
+import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, Dict
+from typing import Callable, Dict, List
+from unittest.mock import patch
 
 
 sys.path.append(str(Path(__file__).parent / "fixtures/lambdas"))
@@ -43,3 +46,19 @@ def compare_handlers(original, instrumented):
     orig_result = original({}, context)
     instrumented_result = instrumented({}, context)
     assert orig_result == instrumented_result
+
+
+@contextmanager
+def capture_telemetry_output():
+    # telemetry payloads are written directly to the stdout file descriptor
+    original_write = os.write
+    output: List[str] = []
+
+    def _write(fd, data):
+        if fd != 1:
+            return original_write(fd, data)
+        output.append(bytes(data).decode("utf-8").rstrip("\n"))
+        return len(data)
+
+    with patch("os.write", side_effect=_write):
+        yield output
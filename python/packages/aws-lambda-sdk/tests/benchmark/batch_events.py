@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+from . import measure, setup_environment
+
+setup_environment()
+
+from serverless_aws_lambda_sdk import serverlessSdk  # noqa: E402
+from serverless_aws_lambda_sdk.instrument.lib import event_tags  # noqa: E402
+from serverless_aws_lambda_sdk.instrument.lib.payload_conversion import (  # noqa: E402
+    encode_span,
+)
+from serverless_sdk_schema import TracePayload  # noqa: E402
+
+EVENTS_PATH = Path(__file__).parent.parent / "fixtures" / "events"
+BATCH_SIZE = 10000
+
+
+def _batch_event() -> dict:
+    with open(EVENTS_PATH / "sqs.json") as file:
+        record = json.load(file)["Records"][0]
+    return {
+        "Records": [
+            dict(record, messageId=f"{index:08d}-4d1f-455c-b504-807abed7ca02")
+            for index in range(BATCH_SIZE)
+        ]
+    }
+
+
+def _resolve(event):
+    aws_lambda = serverlessSdk.trace_spans.aws_lambda
+    aws_lambda._tags = None
+    event_tags.resolve(event)
+    return aws_lambda
+
+
+if __name__ == "__main__":
+    serverlessSdk._initialize(
+        disable_aws_sdk_monitoring=True, disable_http_monitoring=True
+    )
+    event = _batch_event()
+
+    print(f"SQS event of {BATCH_SIZE} records:")
+    for name, limit in (("all message ids", BATCH_SIZE), ("default limit", 100)):
+        serverlessSdk._settings.event_message_ids_limit = limit
+        measure(f"resolve, {name}", lambda: _resolve(event))
+        span_size = encode_span(TracePayload().spans.add(), _resolve(event)).ByteSize()
+        print(f"{f'aws.lambda span size, {name}'.ljust(48)} {span_size:12d}B")
@@ -0,0 +1,45 @@
+import os
+from . import measure, setup_environment
+
+setup_environment()
+os.environ.setdefault("SLS_DEV_MODE_ORG_ID", "benchmark-org")
+
+from serverless_aws_lambda_sdk import serverlessSdk  # noqa: E402
+from serverless_aws_lambda_sdk.instrument.lib import dev_mode  # noqa: E402
+from sls_sdk.lib.trace import TraceSpan  # noqa: E402
+
+SPAN_COUNT = 1000
+
+payloads = []
+
+
+async def _send(name, body):
+    payloads.append(body)
+
+
+def main():
+    serverlessSdk._initialize(
+        disable_aws_sdk_monitoring=True, disable_http_monitoring=True
+    )
+    # extension responses are not part of the measurement
+    dev_mode.send_async = _send
+    event_loop = dev_mode.get_event_loop()
+    spans = [TraceSpan("span") for _ in range(SPAN_COUNT)]
+
+    runs = 0
+
+    def _send_spans():
+        nonlocal runs
+        runs += 1
+        for span in spans:
+            event_loop.add_span(span)
+        event_loop.flush()
+
+    print(f"Buffering {SPAN_COUNT} spans and flushing them:")
+    measure("add_span and flush", _send_spans, number=20)
+    print(f"{'payloads per flush'.ljust(48)} {len(payloads) / runs:12.1f}")
+    event_loop.terminate()
+
+
+if __name__ == "__main__":
+    main()
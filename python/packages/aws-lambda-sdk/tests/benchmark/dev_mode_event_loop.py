@@ -0,0 +1,33 @@
+import os
+from . import measure, setup_environment
+
+setup_environment()
+os.environ.setdefault("SLS_DEV_MODE_ORG_ID", "benchmark-org")
+
+from serverless_aws_lambda_sdk import serverlessSdk  # noqa: E402
+from serverless_aws_lambda_sdk.instrument.lib import dev_mode  # noqa: E402
+
+
+async def _send(name, body):
+    pass
+
+
+def main():
+    serverlessSdk._initialize(
+        disable_aws_sdk_monitoring=True, disable_http_monitoring=True
+    )
+    # extension responses are not part of the measurement
+    dev_mode.send_async = _send
+
+    def _start_and_terminate():
+        dev_mode.get_event_loop().terminate()
+
+    print("End of invocation in dev mode, nothing to send:")
+    measure("start and terminate event loop", _start_and_terminate)
+    event_loop = dev_mode.get_event_loop()
+    measure("flush kept event loop", event_loop.flush)
+    event_loop.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+from . import measure, setup_environment
+
+setup_environment()
+
+from serverless_aws_lambda_sdk.instrument.lib import event_tags  # noqa: E402
+
+EVENTS_PATH = Path(__file__).parent.parent / "fixtures" / "events"
+EVENT_NAMES = ("api_gateway_rest", "http_api_v2", "alb", "sqs", "sns")
+
+
+def _load_event(name: str) -> dict:
+    with open(EVENTS_PATH / f"{name}.json") as file:
+        return json.load(file)
+
+
+if __name__ == "__main__":
+    events = {name: _load_event(name) for name in EVENT_NAMES}
+
+    print("Event type detection, first invocation:")
+    for name, event in events.items():
+
+        def _first_match():
+            event_tags._last_matched = None
+            event_tags._match_event(event)
+
+        measure(name, _first_match, number=10000)
+
+    print("Event type detection, subsequent invocations:")
+    for name, event in events.items():
+        event_tags._match_event(event)
+        measure(name, lambda: event_tags._match_event(event), number=10000)
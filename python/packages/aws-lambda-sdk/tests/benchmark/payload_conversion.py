@@ -0,0 +1,82 @@
+import json
+from . import measure, setup_environment
+
+setup_environment()
+
+from serverless_aws_lambda_sdk import serverlessSdk  # noqa: E402
+from serverless_aws_lambda_sdk.instrument.lib.payload_conversion import (  # noqa: E402
+    encode_trace_payload,
+    to_trace_payload,
+)
+
+SPAN_COUNT = 300
+
+SLS_TAGS = {
+    "orgId": serverlessSdk.org_id,
+    "service": "benchmark-function",
+    "sdk": {
+        "name": serverlessSdk.name,
+        "version": serverlessSdk.version,
+        "runtime": "python",
+    },
+}
+
+
+def _create_spans():
+    serverlessSdk.trace_spans.aws_lambda_initialization.close()
+    invocation = serverlessSdk._create_trace_span("aws.lambda.invocation")
+    for index in range(SPAN_COUNT):
+        span = serverlessSdk._create_trace_span("python.https.request")
+        span.tags.update(
+            {
+                "method": "GET",
+                "protocol": "HTTP/1.1",
+                "host": "example.com:443",
+                "path": f"/items/{index}",
+                "request_header_names": ["Host", "User-Agent", "Accept"],
+                "query_parameter_names": ["page", "size"],
+                "status_code": 200,
+            },
+            prefix="http",
+        )
+        span.close()
+    invocation.close()
+    serverlessSdk.trace_spans.aws_lambda.close()
+    return serverlessSdk.trace_spans.aws_lambda.spans
+
+
+def _dict_conversion(spans):
+    def _convert_span(span):
+        span_payload = span.to_protobuf_dict()
+        del span_payload["input"]
+        del span_payload["output"]
+        return span_payload
+
+    return to_trace_payload(
+        {
+            "slsTags": SLS_TAGS,
+            "spans": [_convert_span(s) for s in spans],
+            "events": [],
+            "customTags": json.dumps({}),
+        }
+    ).SerializeToString()
+
+
+def _direct_encoding(spans):
+    return encode_trace_payload(
+        SLS_TAGS, spans, [], custom_tags=json.dumps({})
+    ).SerializeToString()
+
+
+def main():
+    spans = _create_spans()
+    assert _dict_conversion(spans) == _direct_encoding(spans)
+
+    print(f"Trace payload encoding ({len(spans)} spans)")
+    before = measure("to_protobuf_dict + ParseDict", lambda: _dict_conversion(spans))
+    after = measure("encode_trace_payload", lambda: _direct_encoding(spans))
+    print(f"Speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+from . import measure, setup_environment
+
+setup_environment()
+
+from serverless_aws_lambda_sdk import serverlessSdk  # noqa: E402
+
+RECORD_COUNT = 1000
+
+
+def main():
+    serverlessSdk._initialize(
+        disable_aws_sdk_monitoring=True, disable_http_monitoring=True
+    )
+    serverlessSdk.trace_spans.aws_lambda_invocation = serverlessSdk._create_trace_span(
+        "aws.lambda.invocation"
+    )
+    records = [{"messageId": str(index)} for index in range(RECORD_COUNT)]
+
+    def _iterate(iterable):
+        for _ in iterable:
+            pass
+        serverlessSdk.trace_spans.aws_lambda_invocation.sub_spans.clear()
+        serverlessSdk.trace_spans.aws_lambda._descendant_spans[1:] = ()
+
+    print(f"Iterating over {RECORD_COUNT} records:")
+    baseline = measure("plain iteration", lambda: _iterate(records))
+    traced = measure(
+        "trace_records", lambda: _iterate(serverlessSdk.trace_records(records))
+    )
+    print(
+        f"{'overhead per record'.ljust(48)} {(traced - baseline) * 1e9 / RECORD_COUNT:12.1f}ns"
+    )
+
+
+if __name__ == "__main__":
+    main()
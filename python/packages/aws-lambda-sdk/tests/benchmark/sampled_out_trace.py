@@ -0,0 +1,46 @@
+from . import measure, setup_environment
+
+setup_environment()
+
+from serverless_aws_lambda_sdk import serverlessSdk  # noqa: E402
+from serverless_aws_lambda_sdk.instrument import Instrumenter  # noqa: E402
+from serverless_aws_lambda_sdk.instrument.lib import telemetry_writer  # noqa: E402
+
+SPAN_COUNT = 300
+
+
+def _create_trace():
+    invocation = (
+        serverlessSdk.trace_spans.aws_lambda_invocation
+    ) = serverlessSdk._create_trace_span("aws.lambda.invocation")
+    for index in range(SPAN_COUNT):
+        span = serverlessSdk._create_trace_span("python.https.request")
+        span.tags.update(
+            {"method": "GET", "path": f"/items/{index}", "status_code": 200},
+            prefix="http",
+        )
+        span.close()
+    invocation.close()
+    serverlessSdk.trace_spans.aws_lambda.close()
+
+
+def main():
+    written = []
+    telemetry_writer.write = lambda prefix, payload: written.append(payload)
+    serverlessSdk._initialize(disable_http_monitoring=True)
+    instrumenter = Instrumenter()
+    _create_trace()
+
+    def _report_trace():
+        serverlessSdk.sampler.reset()
+        instrumenter._report_trace(False)
+
+    print(f"Reporting trace of {SPAN_COUNT + 3} spans:")
+    serverlessSdk.sampler.configure(rate=0)
+    measure("Sampled out trace", _report_trace)
+    serverlessSdk.sampler.configure(rate=1)
+    measure("Full trace", _report_trace)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+from datetime import datetime
+from . import measure, setup_environment
+
+setup_environment()
+
+from sls_sdk.lib.tags import Tags  # noqa: E402
+from sls_sdk.lib import thread_mode  # noqa: E402
+
+# key sets and value shapes as set by `instrument/lib/event_tags.py`
+# for an API Gateway REST event and by `aws_sdk/service_mapper.py`
+EVENT_TAGS = (
+    (
+        "aws.lambda",
+        {"event_source": "aws.apigateway", "event_type": "aws.apigateway.rest"},
+    ),
+    (
+        "aws.lambda.api_gateway",
+        {"account_id": "123456789012", "api_id": "xxxxxxxxxx", "api_stage": "dev"},
+    ),
+    (
+        "aws.lambda.api_gateway.request",
+        {
+            "id": "b1bbf7c1-5b1e-4a9a-9d3b-3d1bd3c2f7e4",
+            "time_epoch": 1680000000000,
+            "path_parameter_names": ["id"],
+        },
+    ),
+    (
+        "aws.lambda.http",
+        {
+            "method": "GET",
+            "protocol": "HTTP/1.1",
+            "host": "xxxxxxxxxx.execute-api.us-east-1.amazonaws.com",
+            "path": "/dev/items/1",
+            "query_parameter_names": ["page", "size"],
+            "request_header_names": ["Accept", "Host", "User-Agent"],
+        },
+    ),
+)
+
+SERVICE_TAGS = (
+    (
+        "aws.sdk",
+        {
+            "region": "us-east-1",
+            "signature_version": "v4",
+            "service": "dynamodb",
+            "operation": "query",
+            "request_id": "UQKJAS7N6CU4P7FG1V0H1G2KPJVV4KQNSO5AEMVJF66Q9ASUAAJG",
+        },
+    ),
+    (
+        "aws.sdk.dynamodb",
+        {
+            "table_name": "items",
+            "consistent_read": True,
+            "limit": 10,
+            "attributes_to_get": [],
+            "projection": "#id, #name",
+            "index_name": "by-name",
+            "scan_forward": True,
+            "key_condition": "#id = :id",
+            "count": 1,
+            "scanned_count": 1,
+        },
+    ),
+    ("aws.sdk.sqs", {"queue_name": "queue", "message_ids": ["m-1", "m-2"]}),
+    ("http", {"status_code": 200}),
+)
+
+ALL_TAGS = EVENT_TAGS + SERVICE_TAGS
+TAG_COUNT = sum(len(tags) for _, tags in ALL_TAGS)
+
+
+def _set_tags():
+    tags = Tags()
+    for prefix, values in ALL_TAGS:
+        tags._update(values, prefix)
+
+
+def _set_single_tags():
+    tags = Tags()
+    tags._set("aws.lambda.http_router.path", "/items/{id}")
+    tags._set("aws.lambda.request_time", datetime(2023, 1, 1))
+    tags._set("aws.lambda.outcome", 1)
+
+
+if __name__ == "__main__":
+    print(f"Setting {TAG_COUNT} tags on a fresh Tags instance:")
+    measure("Tags._update with real key sets", _set_tags, number=2000)
+    measure("Tags._set of single tags", _set_single_tags, number=2000)
+
+    thread_mode.enable_single_threaded_mode()
+    print("In single threaded mode:")
+    measure("Tags._update with real key sets", _set_tags, number=2000)
+    measure("Tags._set of single tags", _set_single_tags, number=2000)
@@ -0,0 +1,43 @@
+import base64
+import os
+import tracemalloc
+from . import measure, setup_environment
+
+setup_environment()
+
+from serverless_aws_lambda_sdk.instrument.lib import telemetry_writer  # noqa: E402
+
+PAYLOAD_SIZE = 2 * 1024 * 1024
+PREFIX = "SERVERLESS_TELEMETRY.T."
+
+
+def _print_payload(payload: bytes, stdout):
+    print(f"{PREFIX}{base64.b64encode(payload).decode('utf-8')}", file=stdout)
+    stdout.flush()
+
+
+def _write_payload(payload: bytes, fd: int):
+    telemetry_writer.write(PREFIX.encode("utf-8"), payload, fd=fd)
+
+
+def _peak_memory(func) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    payload = os.urandom(PAYLOAD_SIZE)
+    stdout = open(os.devnull, "w")
+    fd = os.open(os.devnull, os.O_WRONLY)
+
+    print(f"Writing a {PAYLOAD_SIZE // 1024}KB trace payload:")
+    measure("print + base64.b64encode", lambda: _print_payload(payload, stdout))
+    measure("telemetry_writer.write", lambda: _write_payload(payload, fd))
+    for name, func in (
+        ("print + base64.b64encode", lambda: _print_payload(payload, stdout)),
+        ("telemetry_writer.write", lambda: _write_payload(payload, fd)),
+    ):
+        print(f"{name.ljust(48)} {_peak_memory(func) / 1024:10.0f}KB peak")
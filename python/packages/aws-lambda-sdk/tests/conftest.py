@@ -1,8 +1,13 @@
 import pytest
-from unittest.mock import patch
 import sys
 import importlib
-from . import TEST_FUNCTION, TEST_FUNCTION_VERSION, TEST_ORG, TEST_DEV_MODE_ORG_ID
+from . import (
+    TEST_FUNCTION,
+    TEST_FUNCTION_VERSION,
+    TEST_ORG,
+    TEST_DEV_MODE_ORG_ID,
+    capture_telemetry_output,
+)
 
 
 @pytest.fixture()
@@ -50,12 +55,9 @@ def _reset_sdk(
 
 
 @pytest.fixture()
-def mocked_print():
-    from builtins import print as original_print
-
-    with patch("builtins.print") as mocked_print:
-        mocked_print.side_effect = original_print
-        yield mocked_print
+def telemetry_output():
+    with capture_telemetry_output() as output:
+        yield output
 
 
 @pytest.fixture(scope="session")
@@ -5,6 +5,7 @@ from serverless_sdk_schema import TracePayload
 import asyncio
 import time
 import base64
+import pytest
 
 
 def test_buffer(reset_sdk_dev_mode):
@@ -164,3 +165,234 @@ def test_dev_mode_close_timing(reset_sdk_dev_mode, monkeypatch):
         "span1",
         "span2",
     ]
+
+
+def test_dev_mode_flush(reset_sdk_dev_mode, monkeypatch):
+    # given
+    import serverless_aws_lambda_sdk.instrument.lib.dev_mode
+
+    sent = []
+
+    async def _send(name, body):
+        # mimic behaviour of an http request
+        await asyncio.sleep(0.05)
+        sent.append(name)
+
+    async def _noop():
+        pass
+
+    monkeypatch.setattr(
+        serverless_aws_lambda_sdk.instrument.lib.dev_mode, "send_async", _send
+    )
+    monkeypatch.setattr(
+        serverless_aws_lambda_sdk.instrument.lib.dev_mode, "close_session", _noop
+    )
+    monkeypatch.setattr(
+        serverless_aws_lambda_sdk.instrument.lib.dev_mode, "open_session", _noop
+    )
+    loop = serverless_aws_lambda_sdk.instrument.lib.dev_mode.get_event_loop()
+
+    # when
+    loop.send_telemetry("request-response", b"request")
+    loop.add_span(TraceSpan("span1"))
+    loop.flush()
+
+    # then
+    assert sent == ["request-response", "trace"]
+    assert loop.is_alive()
+
+    # when
+    loop.add_captured_event(CapturedEvent("event1"))
+    loop.flush()
+
+    # then
+    assert sent == ["request-response", "trace", "trace"]
+    assert loop._scheduled_tasks.get_all() == set()
+    loop.terminate()
+
+
+def test_dev_mode_flush_timeout(reset_sdk_dev_mode, monkeypatch):
+    # given
+    import serverless_aws_lambda_sdk.instrument.lib.dev_mode as dev_mode
+    from serverless_aws_lambda_sdk import serverlessSdk
+
+    sent = []
+
+    async def _send(name, body):
+        # mimic a stalled dev mode extension
+        await asyncio.sleep(0.2)
+        sent.append(name)
+
+    async def _noop():
+        pass
+
+    monkeypatch.setattr(dev_mode, "send_async", _send)
+    monkeypatch.setattr(dev_mode, "close_session", _noop)
+    monkeypatch.setattr(dev_mode, "open_session", _noop)
+    monkeypatch.setattr(dev_mode, "FLUSH_TIMEOUT", 0.05)
+    serverlessSdk._initialize()
+    notices = []
+
+    def on_captured_event(captured_event):
+        notices.append(captured_event)
+
+    serverlessSdk._event_emitter.on("captured-event", on_captured_event)
+    loop = dev_mode.get_event_loop()
+
+    # when
+    loop.send_telemetry("request-response", b"request")
+    start = time.monotonic()
+    loop.flush()
+
+    # then
+    assert time.monotonic() - start < 0.2
+    assert [notice.custom_fingerprint for notice in notices] == [
+        "DEV_MODE_FLUSH_TIMEOUT"
+    ]
+    loop.terminate()
+    assert sent == ["request-response"], "should keep sending in the background"
+
+
+def test_buffer_actions(reset_sdk_dev_mode):
+    # given
+    from serverless_aws_lambda_sdk.instrument.lib.dev_mode import (
+        ThreadSafeBuffer,
+        SCHEDULE_FLUSH,
+        FLUSH_NOW,
+        MAX_BATCH_SIZE,
+    )
+
+    buffer = ThreadSafeBuffer()
+
+    # when
+    actions = [buffer.add_span(index) for index in range(MAX_BATCH_SIZE + 10)]
+
+    # then
+    assert actions[0] == SCHEDULE_FLUSH
+    assert actions[MAX_BATCH_SIZE - 1] == FLUSH_NOW
+    assert [a for a in actions if a is not None] == [SCHEDULE_FLUSH, FLUSH_NOW]
+
+    # when
+    buffer.get_all()
+
+    # then
+    assert buffer.add_captured_event("event") == SCHEDULE_FLUSH
+
+
+def test_dev_mode_coalescing(reset_sdk_dev_mode, monkeypatch):
+    # given
+    import serverless_aws_lambda_sdk.instrument.lib.dev_mode as dev_mode
+
+    sent = []
+
+    async def _send(name, body):
+        sent.append(TracePayload.FromString(body))
+
+    async def _noop():
+        pass
+
+    monkeypatch.setattr(dev_mode, "send_async", _send)
+    monkeypatch.setattr(dev_mode, "close_session", _noop)
+    monkeypatch.setattr(dev_mode, "open_session", _noop)
+    loop = dev_mode.get_event_loop()
+    spans = [TraceSpan("span") for _ in range(1000)]
+
+    # when
+    for span in spans:
+        loop.add_span(span)
+    loop.flush()
+    stats = loop.get_stats()
+    loop.terminate()
+
+    # then
+    assert sum(len(payload.spans) for payload in sent) == 1000
+    assert stats["batches"] == len(sent)
+    assert stats["batches"] <= 3
+    assert stats["early_flushes"] >= 1
+    assert stats["average_batch_size"] == 1000 / stats["batches"]
+
+
+def test_dev_mode_flush_window(reset_sdk_dev_mode):
+    # given
+    from serverless_aws_lambda_sdk.instrument.lib.dev_mode import (
+        EventLoop,
+        MAX_FLUSH_WINDOW,
+        MIN_FLUSH_WINDOW,
+    )
+
+    loop = EventLoop(None)
+
+    # when
+    loop._flush_scheduled_at = time.monotonic() - 1
+    loop._update_window(2)
+
+    # then
+    assert loop.get_stats()["flush_window"] == MAX_FLUSH_WINDOW
+
+    # when
+    for _ in range(3):
+        loop._flush_scheduled_at = time.monotonic() - 0.01
+        loop._update_window(500)
+
+    # then
+    assert loop.get_stats()["flush_window"] == MIN_FLUSH_WINDOW
+
+
+@pytest.mark.parametrize(
+    "drop_oldest,expected_spans",
+    [(True, ["span3", "span4", "span5"]), (False, ["span1", "span2", "span3"])],
+)
+def test_buffer_drop_policy(reset_sdk_dev_mode, drop_oldest, expected_spans):
+    # given
+    from serverless_aws_lambda_sdk.instrument.lib.dev_mode import ThreadSafeBuffer
+
+    buffer = ThreadSafeBuffer(max_items=3, drop_oldest=drop_oldest)
+
+    # when
+    for index in range(1, 6):
+        buffer.add_span(f"span{index}")
+    buffer.add_captured_event("event1")
+
+    # then
+    assert buffer.get_all() == (expected_spans, ["event1"])
+    assert buffer.take_dropped_count() == 2
+    assert buffer.take_dropped_count() == 0
+    assert buffer.get_all() == ([], [])
+
+
+def test_dev_mode_reports_dropped(reset_sdk_dev_mode, monkeypatch):
+    # given
+    import serverless_aws_lambda_sdk.instrument.lib.dev_mode as dev_mode
+    from serverless_aws_lambda_sdk import serverlessSdk
+
+    async def _noop(*args):
+        pass
+
+    monkeypatch.setattr(dev_mode, "send_async", _noop)
+    monkeypatch.setattr(dev_mode, "close_session", _noop)
+    monkeypatch.setattr(dev_mode, "open_session", _noop)
+    monkeypatch.setenv("SLS_DEV_MODE_BUFFER_MAX_ITEMS", "2")
+    serverlessSdk._initialize()
+    notices = []
+
+    def on_captured_event(captured_event):
+        notices.append(captured_event)
+
+    serverlessSdk._event_emitter.on("captured-event", on_captured_event)
+    loop = dev_mode.get_event_loop()
+
+    # when
+    for _ in range(5):
+        loop.add_span(TraceSpan("span"))
+    loop.flush()
+    loop.flush()
+    loop.terminate()
+
+    # then
+    assert [notice.custom_fingerprint for notice in notices] == [
+        "DEV_MODE_SERVER_OVERLOAD"
+    ]
+    assert notices[0].tags["notice.message"] == (
+        "Dropped 3 spans and captured events, and 0 telemetry payloads: "
+        "Dev mode extension doesn't keep up"
+    )
@@ -0,0 +1,172 @@
+import json
+from pathlib import Path
+import pytest
+
+_EVENTS_PATH = Path(__file__).parent.parent.parent / "fixtures" / "events"
+
+
+def _load_event(name: str) -> dict:
+    with open(_EVENTS_PATH / f"{name}.json") as file:
+        return json.load(file)
+
+
+@pytest.mark.parametrize(
+    "event_name,resolver_name",
+    [
+        ("api_gateway_rest", "_resolve_api_gateway_event"),
+        ("http_api_v1", "_resolve_api_gateway_event"),
+        ("http_api_v2", "_resolve_http_api_v2_event"),
+        ("lambda_url", "_resolve_http_api_v2_event"),
+        ("alb", "_resolve_alb_event"),
+        ("sqs", "_resolve_sqs_event"),
+        ("sns", "_resolve_sns_event"),
+        ("kinesis", "_resolve_kinesis_event"),
+        ("dynamodb_stream", "_resolve_dynamodb_stream_event"),
+        ("s3", "_resolve_s3_event"),
+        ("eventbridge", "_resolve_eventbridge_event"),
+    ],
+)
+def test_match_event(reset_sdk, event_name, resolver_name):
+    # given
+    from serverless_aws_lambda_sdk.instrument.lib import event_tags
+
+    event = _load_event(event_name)
+    expected = getattr(event_tags, resolver_name)
+
+    # when
+    first = event_tags._match_event(event)
+    second = event_tags._match_event(event)
+
+    # then
+    assert first is expected
+    assert second is expected
+    assert event_tags._last_matched[1] is expected
+
+
+def test_match_event_after_event_type_change(reset_sdk):
+    # given
+    from serverless_aws_lambda_sdk.instrument.lib import event_tags
+
+    event_tags._match_event(_load_event("sqs"))
+
+    # then
+    assert event_tags._match_event(_load_event("alb")) is event_tags._resolve_alb_event
+    assert event_tags._match_event({"Records": []}) is None
+    assert event_tags._match_event({"foo": "bar"}) is None
+    assert event_tags._last_matched[1] is event_tags._resolve_alb_event
+
+
+@pytest.mark.parametrize(
+    "event_name,event_source,event_type",
+    [
+        ("sqs", "aws.sqs", "aws.sqs"),
+        ("kinesis", "aws.kinesis", "aws.kinesis"),
+        ("dynamodb_stream", "aws.dynamodb", "aws.dynamodb.stream"),
+        ("s3", "aws.s3", "aws.s3"),
+        ("eventbridge", "aws.events", "aws.events"),
+    ],
+)
+def test_resolve_event_source(reset_sdk, event_name, event_source, event_type):
+    # given
+    from serverless_aws_lambda_sdk import serverlessSdk
+    from serverless_aws_lambda_sdk.instrument.lib import event_tags
+
+    serverlessSdk._initialize(disable_aws_sdk_monitoring=True)
+
+    # when
+    event_tags.resolve(_load_event(event_name))
+
+    # then
+    tags = serverlessSdk.trace_spans.aws_lambda.tags
+    assert tags["aws.lambda.event_source"] == event_source
+    assert tags["aws.lambda.event_type"] == event_type
+
+
+def _batch_event(name: str, size: int) -> dict:
+    event = _load_event(name)
+    record = event["Records"][0]
+    event["Records"] = [dict(record) for _ in range(size)]
+    for index, record in enumerate(event["Records"]):
+        if name == "sns":
+            record["Sns"] = dict(record["Sns"], MessageId=str(index))
+        else:
+            record["messageId"] = str(index)
+    return event
+
+
+@pytest.mark.parametrize(
+    "event_name,tag_name,notice_code",
+    [
+        ("sqs", "aws.lambda.sqs.message_ids", "SQS_MESSAGE_IDS_LIMITED"),
+        ("sns", "aws.lambda.sns.message_ids", "SNS_MESSAGE_IDS_LIMITED"),
+    ],
+)
+def test_limit_message_ids(reset_sdk, event_name, tag_name, notice_code):
+    # given
+    from serverless_aws_lambda_sdk import serverlessSdk
+    from serverless_aws_lambda_sdk.instrument.lib import event_tags
+
+    serverlessSdk._initialize(
+        disable_aws_sdk_monitoring=True, event_message_ids_limit=3
+    )
+    notices = []
+
+    def on_captured_event(captured_event):
+        notices.append(captured_event)
+
+    serverlessSdk._event_emitter.on("captured-event", on_captured_event)
+
+    # when
+    event_tags.resolve(_batch_event(event_name, 10))
+
+    # then
+    assert serverlessSdk.trace_spans.aws_lambda.tags[tag_name] == ["0", "1", "2"]
+    assert [notice.custom_fingerprint for notice in notices] == [notice_code]
+    assert notices[0].tags["notice.message"] == (
+        "Reported 3 out of 10 message ids of the batch"
+    )
+
+
+def test_sample_message_ids(reset_sdk, monkeypatch):
+    # given
+    monkeypatch.setenv("SLS_EVENT_MESSAGE_IDS_LIMIT", "4")
+    monkeypatch.setenv("SLS_SAMPLE_EVENT_MESSAGE_IDS", "1")
+    from serverless_aws_lambda_sdk import serverlessSdk
+    from serverless_aws_lambda_sdk.instrument.lib import event_tags
+
+    serverlessSdk._initialize(disable_aws_sdk_monitoring=True)
+
+    # when
+    event_tags.resolve(_batch_event("sqs", 10))
+
+    # then
+    assert serverlessSdk.trace_spans.aws_lambda.tags["aws.lambda.sqs.message_ids"] == [
+        "0",
+        "2",
+        "5",
+        "7",
+    ]
+
+
+def test_message_ids_within_limit(reset_sdk):
+    # given
+    from serverless_aws_lambda_sdk import serverlessSdk
+    from serverless_aws_lambda_sdk.instrument.lib import event_tags
+
+    serverlessSdk._initialize(disable_aws_sdk_monitoring=True)
+    notices = []
+
+    def on_captured_event(captured_event):
+        notices.append(captured_event)
+
+    serverlessSdk._event_emitter.on("captured-event", on_captured_event)
+
+    # when
+    event_tags.resolve(_batch_event("sqs", 100))
+
+    # then
+    assert (
+        len(serverlessSdk.trace_spans.aws_lambda.tags["aws.lambda.sqs.message_ids"])
+        == 100
+    )
+    assert notices == []
@@ -0,0 +1,130 @@
+import json
+
+
+_SLS_TAGS = {
+    "orgId": "test-org",
+    "service": "test-function",
+    "sdk": {
+        "name": "serverless-aws-lambda-sdk",
+        "version": "0.0.0",
+        "runtime": "python",
+    },
+}
+
+
+def _to_legacy_payload(spans, captured_events, custom_tags, is_sampled_out):
+    from serverless_aws_lambda_sdk.instrument.lib.payload_conversion import (
+        to_trace_payload,
+    )
+
+    def _convert_span(span):
+        span_payload = span.to_protobuf_dict()
+        del span_payload["input"]
+        del span_payload["output"]
+        return span_payload
+
+    return to_trace_payload(
+        {
+            "isSampledOut": is_sampled_out or None,
+            "slsTags": _SLS_TAGS,
+            "spans": [_convert_span(s) for s in spans],
+            "events": [e.to_protobuf_dict() for e in captured_events],
+            "customTags": custom_tags,
+        }
+    )
+
+
+def _create_trace():
+    from serverless_aws_lambda_sdk import serverlessSdk
+
+    serverlessSdk._initialize(disable_http_monitoring=True)
+    captured_events = []
+
+    def _captured_event_handler(captured_event):
+        captured_events.append(captured_event)
+
+    serverlessSdk._event_emitter.on("captured-event", _captured_event_handler)
+    serverlessSdk.trace_spans.aws_lambda_initialization.close()
+
+    aws_lambda = serverlessSdk.trace_spans.aws_lambda
+    aws_lambda.tags.update(
+        {
+            "request_id": "request-id",
+            "outcome": 1,
+            "event_source": "aws.apigateway",
+            "event_type": "aws.apigateway.rest",
+            "http_router.path": "/foo/{bar}",
+            "api_gateway.request.path_parameter_names": ["bar"],
+            "api_gateway.request.time_epoch": 1680000000000,
+        },
+        prefix="aws.lambda",
+    )
+    invocation = serverlessSdk._create_trace_span("aws.lambda.invocation")
+    http_span = serverlessSdk._create_trace_span(
+        "python.https.request", input="request body", output="response body"
+    )
+    http_span.tags.update(
+        {
+            "method": "GET",
+            "protocol": "HTTP/1.1",
+            "host": "example.com:443",
+            "path": "/foo",
+            "request_header_names": ["User-Agent"],
+            "query_parameter_names": [],
+            "status_code": 200,
+        },
+        prefix="http",
+    )
+    http_span.custom_tags["user.tag"] = "value"
+    http_span.close()
+    serverlessSdk.capture_warning("Something happened", tags={"foo": "bar"})
+    serverlessSdk.capture_error(Exception("Boom"), fingerprint="boom")
+    invocation.close()
+    aws_lambda.close()
+    return aws_lambda.spans, captured_events
+
+
+def test_encode_trace_payload_matches_dict_conversion(reset_sdk):
+    # given
+    from serverless_aws_lambda_sdk.instrument.lib.payload_conversion import (
+        encode_trace_payload,
+    )
+
+    spans, captured_events = _create_trace()
+    assert len(captured_events) == 2
+    custom_tags = json.dumps({"custom": "tag"})
+
+    # when
+    payload = encode_trace_payload(_SLS_TAGS, spans, captured_events, custom_tags)
+
+    # then
+    expected = _to_legacy_payload(spans, captured_events, custom_tags, False)
+    assert payload == expected
+    assert payload.SerializeToString() == expected.SerializeToString()
+    assert [s.name for s in payload.spans] == [
+        "aws.lambda",
+        "aws.lambda.initialization",
+        "aws.lambda.invocation",
+        "python.https.request",
+    ]
+    assert not payload.spans[-1].HasField("input")
+    assert payload.spans[-1].tags.http.status_code == 200
+
+
+def test_encode_trace_payload_sampled_out(reset_sdk):
+    # given
+    from serverless_aws_lambda_sdk.instrument.lib.payload_conversion import (
+        encode_trace_payload,
+    )
+
+    spans, _ = _create_trace()
+    spans = spans[:3]
+
+    # when
+    payload = encode_trace_payload(_SLS_TAGS, spans, is_sampled_out=True)
+
+    # then
+    expected = _to_legacy_payload(spans, [], None, True)
+    assert payload.SerializeToString() == expected.SerializeToString()
+    assert payload.is_sampled_out
+    assert not payload.HasField("custom_tags")
@@ -1,3 +1,5 @@
+import asyncio
+import pytest
 from aiohttp.test_utils import loop_context
 from aiohttp import web
 import base64
@@ -33,7 +35,7 @@ def test_telemetry_dev_mode_enabled(reset_sdk_dev_mode, aiohttp_server):
 
         async def _trace_request():
             app = web.Application()
-            app.router.add_get("/trace", _mock_server)
+            app.router.add_post("/trace", _mock_server)
             server = await aiohttp_server(app, port=2774)
             await telemetry.open_session()
             await telemetry.send_async("trace", payload)
@@ -67,7 +69,7 @@ def test_telemetry_multiple_requests(reset_sdk_dev_mode, aiohttp_server):
         async def _trace_request():
             nonlocal path
             app = web.Application()
-            app.router.add_get("/trace", _mock_server)
+            app.router.add_post("/trace", _mock_server)
             server = await aiohttp_server(app, port=2774)
             await telemetry.open_session()
             await telemetry.send_async("trace", payload)
@@ -82,3 +84,140 @@ def test_telemetry_multiple_requests(reset_sdk_dev_mode, aiohttp_server):
             await server.close()
 
         loop.run_until_complete(_trace_request())
+
+
+def test_telemetry_coalesces_pending_payloads(reset_sdk_dev_mode, aiohttp_server):
+    # given
+    import serverless_aws_lambda_sdk.instrument.lib.telemetry as telemetry
+    from serverless_aws_lambda_sdk import serverlessSdk
+    from serverless_sdk_schema import TracePayload
+
+    serverlessSdk._initialize()
+    telemetry._TELEMETRY_SERVER_URL = "http://localhost:2774/"
+
+    def _trace_payload(span_name):
+        payload = TracePayload()
+        payload.spans.add().name = span_name
+        return payload.SerializeToString()
+
+    requests = []
+    connections = set()
+
+    # when
+    with loop_context() as loop:
+
+        async def _mock_server(request):
+            body = await request.read()
+            connections.add(request.transport.get_extra_info("peername"))
+            if request.path == "/trace":
+                requests.append([s.name for s in TracePayload.FromString(body).spans])
+            else:
+                requests.append(body)
+            return web.Response(text="OK")
+
+        async def _trace_request():
+            app = web.Application()
+            app.router.add_post("/trace", _mock_server)
+            app.router.add_post("/request-response", _mock_server)
+            server = await aiohttp_server(app, port=2774)
+            await telemetry.open_session()
+            await asyncio.gather(
+                telemetry.send_async("trace", _trace_payload("span1")),
+                telemetry.send_async("trace", _trace_payload("span2")),
+                telemetry.send_async("trace", _trace_payload("span3")),
+                telemetry.send_async("request-response", b"request"),
+                telemetry.send_async("trace", _trace_payload("span4")),
+            )
+            stats = telemetry.get_stats()
+            await telemetry.close_session()
+            await server.close()
+            return stats
+
+        stats = loop.run_until_complete(_trace_request())
+
+    # then
+    assert requests == [["span1", "span2", "span3"], b"request", ["span4"]]
+    assert len(connections) == 1
+    assert stats == {
+        "payloads": 5,
+        "requests": 3,
+        "coalesced_payloads": 2,
+        "failed_requests": 0,
+        "dropped_payloads": 0,
+        "max_pending_payloads": 5,
+        "max_pending_bytes": stats["max_pending_bytes"],
+    }
+    assert stats["max_pending_bytes"] > 0
+
+
+def test_telemetry_server_error(reset_sdk_dev_mode):
+    # given
+    import serverless_aws_lambda_sdk.instrument.lib.telemetry as telemetry
+    from serverless_aws_lambda_sdk import serverlessSdk
+
+    serverlessSdk._initialize()
+    telemetry._TELEMETRY_SERVER_URL = "http://localhost:2775/"
+
+    # when
+    with loop_context() as loop:
+
+        async def _trace_request():
+            await telemetry.open_session()
+            await telemetry.send_async("trace", b"")
+            stats = telemetry.get_stats()
+            await telemetry.close_session()
+            return stats
+
+        stats = loop.run_until_complete(_trace_request())
+
+    # then
+    assert stats["requests"] == 1
+    assert stats["failed_requests"] == 1
+
+
+@pytest.mark.parametrize(
+    "drop_oldest,expected_requests",
+    [(True, [b"request-3", b"request-4"]), (False, [b"request-1", b"request-2"])],
+)
+def test_telemetry_drops_payloads_over_budget(
+    reset_sdk_dev_mode, aiohttp_server, drop_oldest, expected_requests
+):
+    # given
+    import serverless_aws_lambda_sdk.instrument.lib.telemetry as telemetry
+    from serverless_aws_lambda_sdk import serverlessSdk
+
+    serverlessSdk._initialize()
+    telemetry._TELEMETRY_SERVER_URL = "http://localhost:2774/"
+    requests = []
+
+    # when
+    with loop_context() as loop:
+
+        async def _mock_server(request):
+            requests.append(await request.read())
+            return web.Response(text="OK")
+
+        async def _request():
+            app = web.Application()
+            app.router.add_post("/request-response", _mock_server)
+            server = await aiohttp_server(app, port=2774)
+            transport = telemetry.TelemetryTransport(
+                max_bytes=20, drop_oldest=drop_oldest
+            )
+            await transport.open()
+            # payloads are queued before any is sent, two fit in the budget
+            await asyncio.gather(
+                *[
+                    transport.send("request-response", f"request-{index}".encode())
+                    for index in range(1, 5)
+                ]
+            )
+            await transport.close()
+            await server.close()
+            return transport.stats.to_dict()
+
+        stats = loop.run_until_complete(_request())
+
+    # then
+    assert requests == expected_requests
+    assert stats["dropped_payloads"] == 2
@@ -0,0 +1,77 @@
+import base64
+import os
+import pytest
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 196607, 196608, 196609, 2_000_000])
+def test_encode(size):
+    # given
+    from serverless_aws_lambda_sdk.instrument.lib.telemetry_writer import encode
+
+    payload = os.urandom(size)
+
+    # when
+    output = encode(b"SERVERLESS_TELEMETRY.T.", payload)
+
+    # then
+    assert output == b"SERVERLESS_TELEMETRY.T." + base64.b64encode(payload) + b"\n"
+
+
+def test_write_handles_partial_writes(monkeypatch):
+    # given
+    from serverless_aws_lambda_sdk.instrument.lib import telemetry_writer
+
+    written = []
+
+    def _write(fd, data):
+        written.append((fd, bytes(data[:10])))
+        return min(len(data), 10)
+
+    monkeypatch.setattr(os, "write", _write)
+    payload = os.urandom(30)
+
+    # when
+    telemetry_writer.write(b"P.", payload, fd=3)
+
+    # then
+    assert {fd for fd, _ in written} == {3}
+    assert b"".join(chunk for _, chunk in written) == (
+        b"P." + base64.b64encode(payload) + b"\n"
+    )
+
+
+def test_write_holds_logging_lock(monkeypatch):
+    # given
+    import logging
+    from serverless_aws_lambda_sdk.instrument.lib import telemetry_writer
+
+    lock_held = []
+
+    def _write(fd, data):
+        # `logging._lock` is reentrant, it's held if another thread can't take it
+        lock_held.append(not _acquire_from_other_thread(logging._lock))
+        return len(data)
+
+    monkeypatch.setattr(os, "write", _write)
+
+    # when
+    telemetry_writer.write(b"P.", b"payload", fd=3)
+
+    # then
+    assert lock_held == [True]
+
+
+def _acquire_from_other_thread(lock) -> bool:
+    import threading
+
+    acquired = []
+
+    def _acquire():
+        acquired.append(lock.acquire(blocking=False))
+        if acquired[0]:
+            lock.release()
+
+    thread = threading.Thread(target=_acquire)
+    thread.start()
+    thread.join()
+    return acquired[0]
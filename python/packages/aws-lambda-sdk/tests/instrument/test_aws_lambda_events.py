@@ -14,7 +14,7 @@ def instrumenter(reset_sdk):
     return Instrumenter()
 
 
-def test_handle_api_gateway_rest_api_event(instrumenter, mocked_print):
+def test_handle_api_gateway_rest_api_event(instrumenter, telemetry_output):
     # given
     from ..fixtures.lambdas.api_endpoint import handler
 
@@ -77,11 +77,9 @@ def test_handle_api_gateway_rest_api_event(instrumenter, mocked_print):
 
     # when
     instrumented(event, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -113,7 +111,9 @@ def test_handle_api_gateway_rest_api_event(instrumenter, mocked_print):
     assert lambda_tags.http_router.path == "/some-path/{param}"
 
 
-def test_handle_api_gateway_v2_http_api_payload_v1_event(instrumenter, mocked_print):
+def test_handle_api_gateway_v2_http_api_payload_v1_event(
+    instrumenter, telemetry_output
+):
     # given
     from ..fixtures.lambdas.api_endpoint import handler
 
@@ -180,11 +180,9 @@ def test_handle_api_gateway_v2_http_api_payload_v1_event(instrumenter, mocked_pr
 
     # when
     instrumented(event, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -215,7 +213,9 @@ def test_handle_api_gateway_v2_http_api_payload_v1_event(instrumenter, mocked_pr
     assert lambda_tags.http_router.path == "/v1"
 
 
-def test_handle_api_gateway_v2_http_api_payload_v2_event(instrumenter, mocked_print):
+def test_handle_api_gateway_v2_http_api_payload_v2_event(
+    instrumenter, telemetry_output
+):
     # given
     from ..fixtures.lambdas.api_endpoint import handler
 
@@ -256,11 +256,9 @@ def test_handle_api_gateway_v2_http_api_payload_v2_event(instrumenter, mocked_pr
 
     # when
     instrumented(event, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -291,7 +289,7 @@ def test_handle_api_gateway_v2_http_api_payload_v2_event(instrumenter, mocked_pr
     assert lambda_tags.http_router.path == "/v2"
 
 
-def test_handle_function_url_payload_event(instrumenter, mocked_print):
+def test_handle_function_url_payload_event(instrumenter, telemetry_output):
     # given
     from ..fixtures.lambdas.api_endpoint import handler
 
@@ -331,11 +329,9 @@ def test_handle_function_url_payload_event(instrumenter, mocked_print):
 
     # when
     instrumented(event, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -357,7 +353,7 @@ def test_handle_function_url_payload_event(instrumenter, mocked_print):
     assert lambda_tags.http.status_code == 200
 
 
-def test_handle_sqs_event(instrumenter, mocked_print):
+def test_handle_sqs_event(instrumenter, telemetry_output):
     # given
     from ..fixtures.lambdas.success import handler
 
@@ -408,11 +404,9 @@ def test_handle_sqs_event(instrumenter, mocked_print):
 
     # when
     instrumented(event, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -426,7 +420,7 @@ def test_handle_sqs_event(instrumenter, mocked_print):
     ]
 
 
-def test_handle_sns_event(instrumenter, mocked_print):
+def test_handle_sns_event(instrumenter, telemetry_output):
     # given
     from ..fixtures.lambdas.success import handler
 
@@ -475,11 +469,9 @@ def test_handle_sns_event(instrumenter, mocked_print):
 
     # when
     instrumented(event, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
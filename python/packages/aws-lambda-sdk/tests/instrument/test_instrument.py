@@ -3,7 +3,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 import json
 import importlib
-from .. import compare_handlers, context
+from .. import capture_telemetry_output, compare_handlers, context
 from .test_assertions import (
     assert_trace_payload,
     assert_lambda_tags,
@@ -57,7 +57,7 @@ def test_instrument_works_with_all_callables(instrumenter):
     compare_handlers(example, instrumented)
 
 
-def test_instrument_lambda_success(instrumenter, mocked_print):
+def test_instrument_lambda_success(instrumenter, telemetry_output):
     # given
     from ..fixtures.lambdas.success import handler
 
@@ -65,11 +65,9 @@ def test_instrument_lambda_success(instrumenter, mocked_print):
 
     # when
     instrumented({}, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -101,28 +99,21 @@ def test_instrument_subsequent_calls(instrumenter):
         return handler
 
     instrumented = instrumenter.instrument(handler_generator)
-    from builtins import print
 
     # when
-    with patch("builtins.print") as mocked_print:
-        mocked_print.side_effect = print
+    with capture_telemetry_output() as telemetry_output:
         instrumented({}, context)
-        first = [
-            x[0][0]
-            for x in mocked_print.call_args_list
-            if x[0][0].startswith(_TARGET_LOG_PREFIX)
-        ][0].replace(_TARGET_LOG_PREFIX, "")
+        first = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+            0
+        ].replace(_TARGET_LOG_PREFIX, "")
     assert generator_call_count == 1
     assert handler_call_count == 1
 
-    with patch("builtins.print") as mocked_print:
-        mocked_print.side_effect = print
+    with capture_telemetry_output() as telemetry_output:
         instrumented({}, context)
-        second = [
-            x[0][0]
-            for x in mocked_print.call_args_list
-            if x[0][0].startswith(_TARGET_LOG_PREFIX)
-        ][0].replace(_TARGET_LOG_PREFIX, "")
+        second = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+            0
+        ].replace(_TARGET_LOG_PREFIX, "")
     assert generator_call_count == 1
     assert handler_call_count == 2
 
@@ -157,7 +148,7 @@ def test_instrument_subsequent_calls(instrumenter):
     assert aws_lambda.start_time_unix_nano == aws_lambda_invocation.start_time_unix_nano
 
 
-def test_instrument_lambda_unhandled_error(instrumenter, mocked_print):
+def test_instrument_lambda_unhandled_error(instrumenter, telemetry_output):
     # given
     from ..fixtures.lambdas.error_unhandled import handler
 
@@ -166,11 +157,9 @@ def test_instrument_lambda_unhandled_error(instrumenter, mocked_print):
     # when
     with pytest.raises(SystemExit):
         instrumented({}, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -185,7 +174,7 @@ def test_instrument_lambda_unhandled_error(instrumenter, mocked_print):
     )
 
 
-def test_instrument_lambda_handled_error(instrumenter, mocked_print):
+def test_instrument_lambda_handled_error(instrumenter, telemetry_output):
     # given
     from ..fixtures.lambdas.error import handler
 
@@ -194,11 +183,9 @@ def test_instrument_lambda_handled_error(instrumenter, mocked_print):
     # when
     with pytest.raises(Exception):
         instrumented({}, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -247,7 +234,7 @@ def test_instrument_lambda_sdk(instrumenter):
         original_warning_logger = Logger.warning
 
         # when
-        with patch("builtins.print") as mocked_print, patch.object(
+        with capture_telemetry_output() as telemetry_output, patch.object(
             Logger, "error", autospec=True
         ) as mock_error_logger, patch.object(
             Logger, "warning", autospec=True
@@ -257,9 +244,7 @@ def test_instrument_lambda_sdk(instrumenter):
             instrumented({}, context)
 
             serialized = [
-                x[0][0]
-                for x in mocked_print.call_args_list
-                if x[0][0].startswith(_TARGET_LOG_PREFIX)
+                x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)
             ][0].replace(_TARGET_LOG_PREFIX, "")
 
         # then
@@ -333,7 +318,7 @@ def test_instrument_lambda_sdk(instrumenter):
 
 @pytest.mark.parametrize("sampled_out", [True, False])
 def test_instrument_sdk_sampled_out(
-    monkeypatch, instrumenter, sampled_out, mocked_print
+    monkeypatch, instrumenter, sampled_out, telemetry_output
 ):
     # given
     monkeypatch.setattr("random.random", lambda: 0.9 if sampled_out else 0.1)
@@ -343,11 +328,9 @@ def test_instrument_sdk_sampled_out(
 
     # when
     instrumented({}, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -368,7 +351,7 @@ def test_instrument_sdk_sampled_out(
 
 
 def test_instrument_lambda_success_dev_mode_without_server(
-    reset_sdk_dev_mode, mocked_print
+    reset_sdk_dev_mode, telemetry_output
 ):
     # given
     import serverless_aws_lambda_sdk.instrument
@@ -381,11 +364,9 @@ def test_instrument_lambda_success_dev_mode_without_server(
 
     # when
     instrumented({}, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -402,7 +383,7 @@ def test_instrument_lambda_success_dev_mode_without_server(
 
 def test_instrument_lambda_success_dev_mode_with_server(
     reset_sdk_dev_mode,
-    mocked_print,
+    telemetry_output,
     httpserver_listen_address,
     httpserver: HTTPServer,
 ):
@@ -447,11 +428,9 @@ def test_instrument_lambda_success_dev_mode_with_server(
     # when
     instrumented(event, context)
 
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -491,15 +470,17 @@ def test_instrument_lambda_success_dev_mode_with_server(
     ][0]
     assert_lambda_tags(dev_mode_trace_payload_lambda_span, 1)
 
+    event_loop = instrumenter_dev_mode.event_loop
+    assert event_loop.is_alive()
+
     # when
     request_response_payloads = []
     trace_payloads = []
     instrumented(event, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    assert instrumenter_dev_mode.event_loop is event_loop
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -546,7 +527,7 @@ def test_instrument_lambda_success_close_trace_failure(instrumenter):
     instrumenter._close_trace = _original
 
 
-def test_instrument_lambda_http_requests(reset_sdk_debug_mode, mocked_print):
+def test_instrument_lambda_http_requests(reset_sdk_debug_mode, telemetry_output):
     # given
     from serverless_aws_lambda_sdk.instrument import Instrumenter
 
@@ -557,11 +538,9 @@ def test_instrument_lambda_http_requests(reset_sdk_debug_mode, mocked_print):
 
     # when
     instrumented({}, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
@@ -586,7 +565,7 @@ def test_instrument_lambda_http_requests(reset_sdk_debug_mode, mocked_print):
     assert tags.http.status_code == 200
 
 
-def test_instrument_flask(reset_sdk_debug_mode, mocked_print):
+def test_instrument_flask(reset_sdk_debug_mode, telemetry_output):
     # given
     from serverless_aws_lambda_sdk.instrument import Instrumenter
 
@@ -633,11 +612,9 @@ def test_instrument_flask(reset_sdk_debug_mode, mocked_print):
 
     # when
     instrumented(event, context)
-    serialized = [
-        x[0][0]
-        for x in mocked_print.call_args_list
-        if x[0][0].startswith(_TARGET_LOG_PREFIX)
-    ][0].replace(_TARGET_LOG_PREFIX, "")
+    serialized = [x for x in telemetry_output if x.startswith(_TARGET_LOG_PREFIX)][
+        0
+    ].replace(_TARGET_LOG_PREFIX, "")
 
     # then
     trace_payload = TracePayload.FromString(base64.b64decode(serialized))
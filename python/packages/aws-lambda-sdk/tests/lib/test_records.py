@@ -0,0 +1,80 @@
+import pytest
+
+
+@pytest.fixture()
+def sdk(reset_sdk):
+    from serverless_aws_lambda_sdk import serverlessSdk
+
+    serverlessSdk._initialize(disable_aws_sdk_monitoring=True)
+    return serverlessSdk
+
+
+@pytest.fixture()
+def invocation(sdk):
+    sdk.trace_spans.aws_lambda_invocation = sdk._create_trace_span(
+        "aws.lambda.invocation"
+    )
+    return sdk.trace_spans.aws_lambda_invocation
+
+
+def test_trace_records(sdk, invocation):
+    # given
+    records = [{"messageId": "1"}, {"messageId": "2"}, {"messageId": "3"}]
+    processed = []
+
+    # when
+    for record in sdk.trace_records(records):
+        processed.append(record)
+        assert invocation.sub_spans[-1].end_time is None
+        sdk._create_trace_span("record.processing").close()
+
+    # then
+    assert processed == records
+    assert [span.name for span in invocation.sub_spans] == ["aws.lambda.record"] * 3
+    for span in invocation.sub_spans:
+        assert span.end_time is not None
+        assert [sub_span.name for sub_span in span.sub_spans] == ["record.processing"]
+    assert sdk._create_trace_span("after.records").parent_span is invocation
+
+
+def test_trace_records_is_lazy(sdk, invocation):
+    # given
+    iterator = sdk.trace_records(iter(range(1000)))
+
+    # when
+    next(iterator)
+    next(iterator)
+
+    # then
+    assert len(invocation.sub_spans) == 2
+    assert invocation.sub_spans[0].end_time is not None
+    assert invocation.sub_spans[1].end_time is None
+
+
+def test_trace_records_break(sdk, invocation):
+    # when
+    for record in sdk.trace_records(range(10)):
+        if record == 4:
+            break
+
+    # then
+    assert len(invocation.sub_spans) == 5
+    assert all(span.end_time is not None for span in invocation.sub_spans)
+
+
+def test_trace_records_span_closed_by_user(sdk, invocation):
+    # when
+    for _ in sdk.trace_records(range(2)):
+        invocation.sub_spans[-1].close()
+
+    # then
+    assert len(invocation.sub_spans) == 2
+
+
+def test_trace_records_outside_of_invocation(sdk):
+    # when
+    processed = list(sdk.trace_records(range(3)))
+
+    # then
+    assert processed == [0, 1, 2]
+    assert sdk.trace_spans.aws_lambda.spans[-1].name == "aws.lambda.initialization"
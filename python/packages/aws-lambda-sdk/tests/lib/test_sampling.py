@@ -0,0 +1,191 @@
+from types import SimpleNamespace
+import pytest
+
+
+def _invocation(duration_ms: int):
+    return SimpleNamespace(start_time=0, end_time=duration_ms * 1000_000)
+
+
+@pytest.fixture()
+def sampler(reset_sdk):
+    from serverless_aws_lambda_sdk.lib.sampling import Sampler
+
+    return Sampler()
+
+
+@pytest.fixture()
+def aws_lambda(reset_sdk):
+    from serverless_aws_lambda_sdk import serverlessSdk
+
+    return serverlessSdk.trace_spans.aws_lambda
+
+
+@pytest.mark.parametrize("random_value,sampled_out", [(0.1, False), (0.9, True)])
+def test_default_rate(monkeypatch, sampler, aws_lambda, random_value, sampled_out):
+    # given
+    monkeypatch.setattr("random.random", lambda: random_value)
+
+    # when
+    sampler.on_invocation_start(aws_lambda)
+
+    # then
+    assert sampler.is_sampled_out(aws_lambda, _invocation(1), False) is sampled_out
+
+
+def test_always_keeps_errors(monkeypatch, sampler, aws_lambda):
+    # given
+    from sls_sdk.lib.captured_event import CapturedEvent
+
+    monkeypatch.setattr("random.random", lambda: 0.9)
+    sampler.on_invocation_start(aws_lambda)
+
+    # then
+    assert not sampler.is_sampled_out(aws_lambda, _invocation(1), True)
+    assert sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+
+    sampler.on_captured_event(CapturedEvent("telemetry.notice.generated.v1"))
+    assert sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+
+    sampler.on_captured_event(CapturedEvent("telemetry.warning.generated.v1"))
+    assert not sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+
+    sampler.reset()
+    sampler.on_invocation_start(aws_lambda)
+    assert sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+
+
+@pytest.mark.parametrize(
+    "reset_sdk",
+    [
+        {
+            "SLS_SAMPLING_RATE": "0.5",
+            "SLS_SAMPLING_ROUTE_RATES": "/health=0, /orders/{id}=1",
+        }
+    ],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "route,sampled_out",
+    [(None, False), ("/health", True), ("/orders/{id}", False), ("/other", False)],
+)
+def test_route_rates(monkeypatch, sampler, aws_lambda, route, sampled_out):
+    # given
+    monkeypatch.setattr("random.random", lambda: 0.4)
+    if route:
+        aws_lambda.tags["aws.lambda.http_router.path"] = route
+
+    # when
+    sampler.on_invocation_start(aws_lambda)
+
+    # then
+    assert sampler.rate == 0.5
+    assert sampler.is_sampled_out(aws_lambda, _invocation(1), False) is sampled_out
+
+
+def test_max_traces_per_second(monkeypatch, sampler, aws_lambda):
+    # given
+    monkeypatch.setattr("random.random", lambda: 0.0)
+    sampler.configure(max_traces_per_second=2)
+
+    # when
+    decisions = []
+    for _ in range(3):
+        sampler.on_invocation_start(aws_lambda)
+        decisions.append(sampler.is_sampled_out(aws_lambda, _invocation(1), False))
+        sampler.reset()
+
+    # then
+    assert sampler.max_traces_per_second == 2
+    assert decisions == [False, False, True]
+
+
+def test_max_traces_per_second_spent_on_sampled_traces_only(
+    monkeypatch, sampler, aws_lambda
+):
+    # given
+    from sls_sdk.lib.captured_event import CapturedEvent
+
+    monkeypatch.setattr("random.random", lambda: 0.0)
+    sampler.configure(max_traces_per_second=1)
+
+    # when
+    # kept because of a warning, not with the head decision
+    sampler.on_invocation_start(aws_lambda)
+    sampler.on_captured_event(CapturedEvent("telemetry.warning.generated.v1"))
+    kept_with_warning = not sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+    sampler.reset()
+    sampler.on_invocation_start(aws_lambda)
+
+    # then
+    assert kept_with_warning
+    assert not sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+    assert not sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+
+
+def test_max_traces_per_second_below_one(monkeypatch, sampler, aws_lambda):
+    # given
+    monkeypatch.setattr("random.random", lambda: 0.0)
+    sampler.configure(max_traces_per_second=0.5)
+
+    # when
+    sampler.on_invocation_start(aws_lambda)
+
+    # then
+    assert not sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+
+
+@pytest.mark.parametrize(
+    "reset_sdk", [{"SLS_SAMPLING_LATENCY_THRESHOLD": "100"}], indirect=True
+)
+def test_latency_threshold(monkeypatch, sampler, aws_lambda):
+    # given
+    monkeypatch.setattr("random.random", lambda: 0.9)
+    sampler.on_invocation_start(aws_lambda)
+
+    # then
+    assert sampler.is_sampled_out(aws_lambda, _invocation(99), False)
+    assert not sampler.is_sampled_out(aws_lambda, _invocation(100), False)
+
+
+def test_custom_policies(monkeypatch, sampler, aws_lambda):
+    # given
+    monkeypatch.setattr("random.random", lambda: 0.1)
+    sampler.add_policy(lambda span, is_error_outcome: None)
+    sampler.add_policy(
+        lambda span, is_error_outcome: span.tags.get("aws.lambda.event_source")
+        != "aws.sqs"
+    )
+    sampler.on_invocation_start(aws_lambda)
+    assert not sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+
+    # when
+    aws_lambda.tags["aws.lambda.event_source"] = "aws.sqs"
+
+    # then
+    assert sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+    assert not sampler.is_sampled_out(aws_lambda, _invocation(1), True)
+
+
+def test_failing_custom_policy(monkeypatch, sampler, aws_lambda):
+    # given
+    monkeypatch.delenv("SLS_CRASH_ON_SDK_ERROR", False)
+    monkeypatch.setattr("random.random", lambda: 0.9)
+
+    def _policy(span, is_error_outcome):
+        raise ValueError("failed")
+
+    sampler.add_policy(_policy)
+    sampler.on_invocation_start(aws_lambda)
+
+    # then
+    assert not sampler.is_sampled_out(aws_lambda, _invocation(1), False)
+
+
+@pytest.mark.parametrize(
+    "reset_sdk",
+    [{"SLS_SAMPLING_RATE": "often", "SLS_SAMPLING_ROUTE_RATES": "/a=1,/b"}],
+    indirect=True,
+)
+def test_invalid_settings(sampler):
+    assert sampler.rate == 0.2
+    assert sampler.route_rates == {"/a": 1.0}
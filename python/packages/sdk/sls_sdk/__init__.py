@@ -1,12 +1,12 @@
 from __future__ import annotations
 import sys
 from os import environ
-from typing import List, Optional
+from typing import Callable, List, Mapping, Optional, Union
 from typing_extensions import Final
 from types import SimpleNamespace
 
 from .base import Nanoseconds, SLS_ORG_ID, __version__, __name__
-from .lib import trace
+from .lib import stack_trace_string, trace
 from .lib.emitter import event_emitter, EventEmitter
 from .lib.tags import Tags, ValidTags
 from .lib.error_captured_event import create as create_error_captured_event
@@ -15,6 +15,8 @@ from .lib.error import report as report_error
 from .lib.warning import report as report_warning
 from .lib.notice import report as report_notice
 from .lib.instrumentation.logging import install as install_logging
+from .lib.thread_mode import enable_single_threaded_mode
+from .lib.span_context import NOOP_SPAN_CONTEXT, SpanContext, trace_function
 
 
 __all__: Final[List[str]] = [
@@ -28,12 +30,33 @@ class TraceSpans(SimpleNamespace):
         return trace.root_span
 
 
+def _resolve_stack_trace_max_depth(default: int) -> int:
+    value = environ.get("SLS_STACK_TRACE_MAX_DEPTH")
+    if not value:
+        return default
+    try:
+        max_depth = int(value)
+    except ValueError:
+        max_depth = 0
+    if max_depth > 0:
+        return max_depth
+    report_warning(
+        'Ignored "SLS_STACK_TRACE_MAX_DEPTH" environment variable: '
+        f'Expected a positive integer, received "{value}"',
+        "INVALID_STACK_TRACE_MAX_DEPTH",
+        type="USER",
+    )
+    return default
+
+
 class ServerlessSdkSettings:
     disable_captured_events_stdout: bool
     disable_python_log_monitoring: bool
     disable_request_response_monitoring: bool
     disable_http_monitoring: bool
     disable_flask_monitoring: bool
+    single_threaded: bool
+    stack_trace_max_depth: int
 
     def __init__(
         self,
@@ -42,6 +65,8 @@ class ServerlessSdkSettings:
         disable_request_response_monitoring=False,
         disable_http_monitoring=False,
         disable_flask_monitoring=False,
+        single_threaded=False,
+        stack_trace_max_depth=None,
     ):
         self.disable_captured_events_stdout = (
             bool(environ.get("SLS_DISABLE_CAPTURED_EVENTS_STDOUT"))
@@ -62,6 +87,12 @@ class ServerlessSdkSettings:
             bool(environ.get("SLS_DISABLE_FLASK_MONITORING"))
             or disable_flask_monitoring
         )
+        self.single_threaded = (
+            bool(environ.get("SLS_SINGLE_THREADED")) or single_threaded
+        )
+        self.stack_trace_max_depth = _resolve_stack_trace_max_depth(
+            stack_trace_max_depth or stack_trace_string.DEFAULT_MAX_DEPTH
+        )
 
 
 class ServerlessSdk:
@@ -100,6 +131,8 @@ class ServerlessSdk:
         disable_request_response_monitoring: Optional[bool] = False,
         disable_http_monitoring: Optional[bool] = False,
         disable_flask_monitoring: Optional[bool] = False,
+        single_threaded: Optional[bool] = False,
+        stack_trace_max_depth: Optional[int] = None,
         **kwargs,
     ):
         if self._is_initialized:
@@ -113,7 +146,13 @@ class ServerlessSdk:
             disable_request_response_monitoring,
             disable_http_monitoring,
             disable_flask_monitoring,
+            single_threaded,
+            stack_trace_max_depth,
         )
+        stack_trace_string.max_depth = self._settings.stack_trace_max_depth
+
+        if self._settings.single_threaded:
+            enable_single_threaded_mode()
 
         if not self._settings.disable_python_log_monitoring:
             install_logging()
@@ -165,5 +204,29 @@ class ServerlessSdk:
         except Exception as ex:
             report_error(ex, type="USER")
 
+    def span(self, name: str, tags: Optional[Mapping[str, ValidTags]] = None):
+        if not self._is_initialized:
+            return NOOP_SPAN_CONTEXT
+        return SpanContext(name, tags)
+
+    def traced(
+        self, func: Optional[Callable] = None, *, name: Optional[str] = None
+    ) -> Union[Callable, Callable[[Callable], Callable]]:
+        if func is None:
+            return lambda func: trace_function(func, name, self)
+        return trace_function(func, name, self)
+
+    @property
+    def ThreadPoolExecutor(self):
+        from .lib.executor import ThreadPoolExecutor
+
+        return ThreadPoolExecutor
+
+    @property
+    def ProcessPoolExecutor(self):
+        from .lib.executor import ProcessPoolExecutor
+
+        return ProcessPoolExecutor
+
 
 serverlessSdk: Final[ServerlessSdk] = ServerlessSdk()
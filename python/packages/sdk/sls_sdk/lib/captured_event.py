@@ -1,8 +1,7 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import time
 import json
-from backports.cached_property import cached_property  # available in Python >=3.8
 from typing_extensions import Final
 from .timing import to_protobuf_epoch_timestamp
 from .id import generate_id
@@ -19,13 +18,28 @@ __all__: Final[List[str]] = [
 
 
 class CapturedEvent:
+    __slots__ = (
+        "name",
+        "timestamp",
+        "trace_span",
+        "origin",
+        "custom_fingerprint",
+        "_tags",
+        "_lazy_tags",
+        "_custom_tags",
+        "_id",
+    )
+
     name: str
     timestamp: int
-    tags: Tags
-    custom_tags: Tags
     trace_span: Optional[TraceSpan]
     origin: Optional[str]
     custom_fingerprint: Optional[str]
+    _tags: Optional[Tags]
+    # tags with values that are converted to `str` only once tags are read
+    _lazy_tags: Optional[Dict[str, Any]]
+    _custom_tags: Optional[Tags]
+    _id: Optional[str]
 
     def __init__(
         self,
@@ -36,12 +50,13 @@ class CapturedEvent:
         trace_span: Optional[TraceSpan] = None,
         origin: Optional[str] = None,
         custom_fingerprint: Optional[str] = None,
+        lazy_tags: Optional[Dict[str, Any]] = None,
     ):
         trace_span = trace_span or TraceSpan.resolve_current_span()
         default_timestamp = time.perf_counter_ns()
+        self._id = None
         self.name = get_resource_name(name)
-        if origin:
-            self.origin = origin
+        self.origin = origin or None
 
         if timestamp and timestamp > default_timestamp:
             raise FutureEventTimestamp(
@@ -50,11 +65,12 @@ class CapturedEvent:
         self.timestamp = timestamp or default_timestamp
         self.custom_fingerprint = custom_fingerprint
 
-        self.tags = Tags()
+        self._tags = None
+        self._lazy_tags = lazy_tags or None
         if tags:
             self.tags.update(tags)
 
-        self.custom_tags = Tags()
+        self._custom_tags = None
         try:
             if custom_tags:
                 self.custom_tags._update(custom_tags)
@@ -64,9 +80,29 @@ class CapturedEvent:
         self.trace_span = trace_span
         event_emitter.emit("captured-event", self)
 
-    @cached_property
+    @property
+    def tags(self) -> Tags:
+        if self._tags is None:
+            self._tags = Tags()
+        lazy_tags = self._lazy_tags
+        if lazy_tags is not None:
+            # reset only once set, so that concurrent reads don't miss them
+            # (setting a tag again with the same value is fine)
+            self._tags.update({name: str(value) for name, value in lazy_tags.items()})
+            self._lazy_tags = None
+        return self._tags
+
+    @property
+    def custom_tags(self) -> Tags:
+        if self._custom_tags is None:
+            self._custom_tags = Tags()
+        return self._custom_tags
+
+    @property
     def id(self) -> str:
-        return generate_id()
+        if self._id is None:
+            self._id = generate_id()
+        return self._id
 
     def to_protobuf_dict(self):
         return {
@@ -76,6 +112,6 @@ class CapturedEvent:
             "timestampUnixNano": to_protobuf_epoch_timestamp(self.timestamp),
             "eventName": self.name,
             "tags": convert_tags_to_protobuf(self.tags),
-            "customTags": json.dumps(self.custom_tags),
+            "customTags": json.dumps(self._custom_tags or {}),
             "customFingerprint": self.custom_fingerprint,
         }
@@ -1,20 +1,36 @@
-from blinker import Signal
-from typing import Callable
+from threading import Lock
+from typing import Callable, Dict, Tuple
 from typing_extensions import Literal
 
 EVENT_TYPE = Literal["captured-event", "trace-span-close"]
 
 
 class EventEmitter:
+    """Routes SDK events (closed trace spans and captured events) to listeners.
+
+    Listeners are called directly, in order they were registered.
+    """
+
+    _listeners: Dict[str, Tuple[Callable, ...]]
+
     def __init__(self):
-        # create a dictionary of event to signal mappings
-        self._signals = dict([(event, Signal()) for event in EVENT_TYPE.__args__])
+        self._lock = Lock()
+        self.remove_all_listeners()
 
     def on(self, event: Literal[EVENT_TYPE], func: Callable):
-        self._signals[event].connect(func)
+        # listener tuples are replaced and never mutated,
+        # so that `emit` can iterate them without locking
+        with self._lock:
+            if func not in self._listeners[event]:
+                self._listeners[event] = (*self._listeners[event], func)
 
     def emit(self, event: Literal[EVENT_TYPE], *args, **kwargs):
-        self._signals[event].send(*args, **kwargs)
+        for func in self._listeners[event]:
+            func(*args, **kwargs)
+
+    def remove_all_listeners(self):
+        with self._lock:
+            self._listeners = {event: () for event in EVENT_TYPE.__args__}
 
 
 event_emitter = EventEmitter()
@@ -4,7 +4,7 @@ from builtins import type as builtins_type
 from typing import Optional
 from .tags import Tags
 from .captured_event import CapturedEvent
-from .stack_trace_string import resolve as resolve_stack_trace_string
+from .stack_trace_string import capture as capture_stack_trace
 
 
 logger = logging.getLogger(__name__)
@@ -30,12 +30,16 @@ def create(
 ):
     timestamp = timestamp or time.perf_counter_ns()
     tags = tags or Tags()
+    # for errors that are not exceptions, exclude frames of this function and
+    # its caller, stack trace is formatted only once read
+    stack_trace = stack or capture_stack_trace(error, skip=2)
     captured_event = CapturedEvent(
         "telemetry.error.generated.v1",
         timestamp=timestamp,
         custom_tags=tags,
         origin=origin,
         custom_fingerprint=fingerprint,
+        lazy_tags={"error.stacktrace": stack_trace},
     )
     _tags = {
         "type": TYPE_MAP[type],
@@ -46,7 +50,6 @@ def create(
     else:
         _tags["name"] = name or builtins_type(error).__name__
         _tags["message"] = str(error)
-    _tags["stacktrace"] = stack or resolve_stack_trace_string(error)
     captured_event.tags.update(_tags, prefix="error")
 
     # to avoid circular dependency, require inline
@@ -64,7 +67,7 @@ def create(
         "type": "ERROR_TYPE_CAUGHT_USER",
         "name": _tags["name"],
         "message": _tags["message"],
-        "stack": _tags["stacktrace"],
+        "stack": str(stack_trace),
     }
     if fingerprint:
         error_log_data["fingerprint"] = fingerprint
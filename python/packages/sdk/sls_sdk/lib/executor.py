@@ -0,0 +1,209 @@
+from __future__ import annotations
+import concurrent.futures
+import contextvars
+import logging
+from typing import Any, Callable, List, Optional, Tuple
+from typing_extensions import Final
+
+from . import trace
+from .emitter import event_emitter
+from .error import report as report_error
+from .trace import TraceSpan
+
+__all__: Final[List[str]] = [
+    "ThreadPoolExecutor",
+    "ProcessPoolExecutor",
+]
+
+logger = logging.getLogger(__name__)
+
+# Span that traces a task in a process pool worker. It's not shipped to the
+# parent process, its sub spans are attached to the span current at submission.
+WORKER_TASK_SPAN_NAME: Final[str] = "python.process_pool.task"
+
+# attribute under which span records travel with exceptions raised by tasks
+_EXCEPTION_RECORDS_ATTRIBUTE: Final[str] = "_sls_span_records"
+
+# (parent record index or -1, name, start time, end time, input, output,
+# tags, custom tags)
+SpanRecord = Tuple[
+    int,
+    str,
+    int,
+    int,
+    Any,
+    Any,
+    Optional[dict],
+    Optional[dict],
+]
+
+
+class ThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
+    """`ThreadPoolExecutor` that runs tasks in the context they were submitted in.
+
+    Context variables are not copied into pool threads, so without that, spans
+    created by tasks would be attached to the root span, instead of to the
+    span current at submission.
+    """
+
+    def submit(self, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        context = contextvars.copy_context()
+        return super().submit(context.run, fn, *args, **kwargs)
+
+
+class ProcessPoolExecutor(concurrent.futures.ProcessPoolExecutor):
+    """`ProcessPoolExecutor` that traces tasks in worker processes.
+
+    Spans created by a task are recorded in the worker, shipped back to this
+    process along with the task result, and attached to the span that was
+    current at submission. Span times are resolved with `time.perf_counter_ns`,
+    which on Linux is shared by all processes.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        mp_context=None,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = (),
+        **kwargs,
+    ):
+        super().__init__(
+            max_workers,
+            mp_context,
+            initializer=_initialize_worker,
+            initargs=(initializer, initargs),
+            **kwargs,
+        )
+
+    def submit(self, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        parent_span = TraceSpan.resolve_current_span()
+        if parent_span is None or parent_span.end_time is not None:
+            return super().submit(fn, *args, **kwargs)
+        return _TracedFuture(
+            super().submit(_run_in_worker, fn, args, kwargs),
+            parent_span,
+            # resolved here, so that it's not generated on the management thread
+            parent_span.trace_id,
+        )
+
+
+class _TracedFuture(concurrent.futures.Future):
+    # Resolved with result of a worker task, once its spans are merged
+    def __init__(
+        self,
+        future: concurrent.futures.Future,
+        parent_span: TraceSpan,
+        trace_id: str,
+    ):
+        super().__init__()
+        self._future = future
+        self._parent_span = parent_span
+        self._trace_id = trace_id
+        future.add_done_callback(self._resolve)
+
+    def cancel(self) -> bool:
+        # cancellation of the task future cancels this one in `_resolve`
+        return self._future.cancel()
+
+    def running(self) -> bool:
+        # the task future is set running once sent to a worker,
+        # this one is only resolved
+        return self._future.running()
+
+    def _resolve(self, future: concurrent.futures.Future):
+        if future.cancelled():
+            super().cancel()
+            return
+        exception = future.exception()
+        if exception is not None:
+            records = exception.__dict__.pop(_EXCEPTION_RECORDS_ATTRIBUTE, None)
+            _merge_spans(self._parent_span, self._trace_id, records)
+            self.set_exception(exception)
+            return
+        result, records = future.result()
+        _merge_spans(self._parent_span, self._trace_id, records)
+        self.set_result(result)
+
+
+def _initialize_worker(initializer: Optional[Callable], initargs: Tuple):
+    # with `fork` start method, listeners of the parent process are inherited,
+    # in a worker spans are only collected for the parent process
+    event_emitter.remove_all_listeners()
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_in_worker(fn: Callable, args: Tuple, kwargs: dict):
+    # spans of the parent process trace (inherited with `fork`) are not
+    # reachable from the worker, each task is traced as a standalone trace
+    trace.root_span = None
+    task_span = TraceSpan(WORKER_TASK_SPAN_NAME)
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as ex:
+        setattr(ex, _EXCEPTION_RECORDS_ATTRIBUTE, _close_task_span(task_span))
+        raise
+    return result, _close_task_span(task_span)
+
+
+def _close_task_span(task_span: TraceSpan) -> Optional[List[SpanRecord]]:
+    try:
+        task_span.close()
+        spans = task_span._descendant_spans
+        indexes = {id(task_span): -1}
+        records = []
+        for index, span in enumerate(spans):
+            indexes[id(span)] = index
+            records.append(
+                (
+                    indexes[id(span.parent_span)],
+                    span.name,
+                    span.start_time,
+                    span.end_time,
+                    span._input,
+                    span._output,
+                    dict(span._tags) if span._tags else None,
+                    dict(span._custom_tags) if span._custom_tags else None,
+                )
+            )
+        return records
+    except Exception as ex:
+        report_error(ex)
+        return None
+    finally:
+        trace.root_span = None
+
+
+def _is_in_current_trace(span: TraceSpan, trace_id: str) -> bool:
+    root_span = trace.root_span
+    if root_span is None or root_span.end_time is not None:
+        return False
+    # root span may be reused by subsequent traces (e.g. `aws.lambda` span),
+    # its trace id is reset then
+    if root_span._trace_id != trace_id:
+        return False
+    while span.parent_span is not None:
+        span = span.parent_span
+    return span is root_span
+
+
+def _merge_spans(
+    parent_span: TraceSpan, trace_id: str, records: Optional[List[SpanRecord]]
+):
+    # runs on the executor management thread, possibly after the trace that
+    # submitted the task was closed, its spans are then dropped
+    if not records:
+        return
+    if not _is_in_current_trace(parent_span, trace_id):
+        logger.debug(
+            "Spans of process pool task dropped: Trace closed before task completed"
+        )
+        return
+    try:
+        spans = []
+        for parent_index, *fields in records:
+            parent = spans[parent_index] if parent_index >= 0 else parent_span
+            spans.append(TraceSpan._restore(parent, *fields))
+    except Exception as ex:
+        report_error(ex)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import os
 from typing import List
-from secrets import token_hex
 from typing_extensions import Final
 
 from ..base import TraceId
@@ -9,11 +9,42 @@ from ..base import TraceId
 
 __all__: Final[List[str]] = [
     "generate_id",
+    "generate_id_bytes",
 ]
 
 
 DEFAULT_BYTES: Final[int] = 16
 
+# random bytes for ids of the default size are fetched from the OS in bulk,
+# instead of with one syscall per id
+POOL_SIZE: Final[int] = 256
+
+# `list.pop` is atomic, so ids can be taken from multiple threads without a lock
+_pool: List[TraceId] = []
+
+
+def _refill_pool():
+    chunk = os.urandom(POOL_SIZE * DEFAULT_BYTES).hex()
+    size = DEFAULT_BYTES * 2
+    _pool.extend(
+        [chunk[offset : offset + size] for offset in range(0, len(chunk), size)]
+    )
+
+
+if hasattr(os, "register_at_fork"):
+    # forked processes must not generate the same ids as their parent
+    os.register_at_fork(after_in_child=_pool.clear)
+
 
 def generate_id(count: int = DEFAULT_BYTES) -> TraceId:
-    return token_hex(count)
+    if count != DEFAULT_BYTES:
+        return os.urandom(count).hex()
+    while True:
+        try:
+            return _pool.pop()
+        except IndexError:
+            _refill_pool()
+
+
+def generate_id_bytes(count: int = DEFAULT_BYTES) -> bytes:
+    return bytes.fromhex(generate_id(count))
@@ -1,5 +1,6 @@
 import time
 import contextvars
+from typing import Iterator, Optional
 from urllib.parse import urlparse
 from urllib.parse import parse_qs
 from ..error import report as report_error
@@ -19,6 +20,108 @@ def reset_ignore_following_request():
 
 
 _HTTP_SPAN = contextvars.ContextVar("http-span", default=None)
+_HTTPX_SPAN = contextvars.ContextVar("httpx-span", default=None)
+
+
+def _body_view(body) -> Optional[memoryview]:
+    """
+    Resolve a byte view of a `str` or buffer (e.g. `bytes`, `bytearray`) body.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    try:
+        return memoryview(body).cast("B")
+    except (TypeError, ValueError):
+        return None
+
+
+def _view_bytes(view: memoryview) -> bytes:
+    # `bytes` are immutable, so they're captured as they are, without a copy
+    return view.obj if view.obj.__class__ is bytes else view.tobytes()
+
+
+def _report_large_input(trace_span):
+    SDK._report_notice(
+        "Large body excluded",
+        "INPUT_BODY_TOO_LARGE",
+        trace_span,
+    )
+
+
+def _capture_input(trace_span, view: memoryview):
+    if view.nbytes > SDK._maximum_body_byte_length:
+        _report_large_input(trace_span)
+        return
+    trace_span._capture_input(_view_bytes(view))
+
+
+def _capture_output(trace_span, body: bytes):
+    if len(body) > SDK._maximum_body_byte_length:
+        SDK._report_notice(
+            "Large body excluded",
+            "OUTPUT_BODY_TOO_LARGE",
+            trace_span,
+        )
+        return
+    trace_span._capture_output(body)
+
+
+def _capture_file_body(trace_span, body):
+    """
+    Capture a seekable file-like body, and rewind it for sending.
+    Only a bounded prefix is read, enough to tell whether the body is too large.
+    """
+    try:
+        if not body.seekable():
+            return
+        position = body.tell()
+        prefix = body.read(SDK._maximum_body_byte_length + 1)
+        body.seek(position)
+    except Exception:
+        return
+    view = _body_view(prefix)
+    if view:
+        _capture_input(trace_span, view)
+
+
+def _capture_iterable_body(trace_span, chunks: Iterator):
+    """
+    Yield chunks of an iterable body, while capturing them up to the size limit.
+    """
+    captured = []
+    size = 0
+    for chunk in chunks:
+        if size <= SDK._maximum_body_byte_length:
+            view = _body_view(chunk)
+            if view is not None:
+                size += view.nbytes
+                if size <= SDK._maximum_body_byte_length:
+                    captured.append(_view_bytes(view))
+        yield chunk
+    if size > SDK._maximum_body_byte_length:
+        _report_large_input(trace_span)
+    elif captured:
+        trace_span._capture_input(
+            captured[0] if len(captured) == 1 else b"".join(captured)
+        )
+
+
+def _take_connection_setup(connection):
+    """
+    Resolve (and reset) start and end time of the setup of a connection,
+    recorded if it was set up for the request. Reused connections have none.
+    """
+    connection_setup = getattr(connection, "_sls_connection_setup", None)
+    if connection_setup is not None:
+        connection._sls_connection_setup = None
+    return connection_setup
+
+
+def _create_connect_span(protocol, connection_setup):
+    start_time, end_time = connection_setup
+    SDK._create_trace_span(f"python.{protocol}.connect", start_time=start_time).close(
+        end_time=end_time
+    )
 
 
 class BaseInstrumenter:
@@ -57,22 +160,16 @@ class NativeAIOHTTPInstrumenter(BaseInstrumenter):
         super().__init__("aiohttp")
         self._original_init = None
 
-    def _capture_request_body(self, trace_span, body):
-        if not body:
+    def _capture_request_body(self, trace_span, trace_config_ctx):
+        if not trace_config_ctx.request_body_chunks:
             return
         if not self.should_monitor_request_response:
             return
-        if len(body) > SDK._maximum_body_byte_length:
-            SDK._report_notice(
-                "Large body excluded",
-                "INPUT_BODY_TOO_LARGE",
-                trace_span,
-            )
+        if trace_config_ctx.request_body_size > SDK._maximum_body_byte_length:
+            _report_large_input(trace_span)
             return
-        try:
-            trace_span.input = body.decode("utf-8")
-        except Exception:
-            pass
+        chunks = trace_config_ctx.request_body_chunks
+        trace_span._capture_input(chunks[0] if len(chunks) == 1 else b"".join(chunks))
 
     async def _capture_response_body(self, trace_span, response):
         if not self.should_monitor_request_response:
@@ -90,7 +187,7 @@ class NativeAIOHTTPInstrumenter(BaseInstrumenter):
         try:
             response_body = await response.read()
             if response_body:
-                trace_span.output = response_body.decode("utf-8")
+                _capture_output(trace_span, response_body)
         except Exception as ex:
             report_error(ex)
 
@@ -114,22 +211,21 @@ class NativeAIOHTTPInstrumenter(BaseInstrumenter):
             },
             prefix="http",
         )
-        trace_config_ctx.request_body = None
+        # chunks are collected up to the size limit, and joined once request ends
+        trace_config_ctx.request_body_chunks = []
+        trace_config_ctx.request_body_size = 0
 
     async def _on_request_chunk_sent(self, session, trace_config_ctx, params):
         if not hasattr(trace_config_ctx, "trace_span"):
             return
-        if trace_config_ctx.request_body is None:
-            trace_config_ctx.request_body = params.chunk
-        else:
-            trace_config_ctx.request_body += params.chunk
+        trace_config_ctx.request_body_size += len(params.chunk)
+        if trace_config_ctx.request_body_size <= SDK._maximum_body_byte_length:
+            trace_config_ctx.request_body_chunks.append(params.chunk)
 
     async def _on_request_exception(self, session, trace_config_ctx, params):
         if not hasattr(trace_config_ctx, "trace_span"):
             return
-        self._capture_request_body(
-            trace_config_ctx.trace_span, trace_config_ctx.request_body
-        )
+        self._capture_request_body(trace_config_ctx.trace_span, trace_config_ctx)
         trace_config_ctx.trace_span.tags.update(
             {"error_code": params.exception.__class__.__name__}, prefix="http"
         )
@@ -139,9 +235,7 @@ class NativeAIOHTTPInstrumenter(BaseInstrumenter):
     async def _on_request_end(self, session, trace_config_ctx, params):
         if not hasattr(trace_config_ctx, "trace_span"):
             return
-        self._capture_request_body(
-            trace_config_ctx.trace_span, trace_config_ctx.request_body
-        )
+        self._capture_request_body(trace_config_ctx.trace_span, trace_config_ctx)
         trace_config_ctx.trace_span.tags.update(
             {"status_code": params.response.status}, prefix="http"
         )
@@ -189,6 +283,7 @@ class NativeHTTPInstrumenter(BaseInstrumenter):
             reset_ignore_following_request()
 
             if _self._sls_ignore:
+                _take_connection_setup(_self)
                 return self._original_request(
                     _self, method, url, body, headers, encode_chunked=encode_chunked
                 )
@@ -199,11 +294,17 @@ class NativeHTTPInstrumenter(BaseInstrumenter):
                 "https" if _self.__class__.__name__ == "HTTPSConnection" else "http"
             )
 
+            # connection pools (urllib3) may connect ahead of the request
+            connection_setup = _take_connection_setup(_self)
+            if connection_setup is not None:
+                start_time = connection_setup[0]
             trace_span = SDK._create_trace_span(
                 f"python.{protocol}.request",
                 start_time=start_time,
             )
             _HTTP_SPAN.set(trace_span)
+            if connection_setup is not None:
+                _create_connect_span(protocol, connection_setup)
 
             try:
                 parsed_path = urlparse(url)
@@ -219,11 +320,14 @@ class NativeHTTPInstrumenter(BaseInstrumenter):
                     },
                     prefix="http",
                 )
-                self._capture_request_body(trace_span, body)
+                body = self._capture_request_body(trace_span, body)
 
                 self._original_request(
                     _self, method, url, body, headers, encode_chunked=encode_chunked
                 )
+                connection_setup = _take_connection_setup(_self)
+                if connection_setup is not None:
+                    _create_connect_span(protocol, connection_setup)
             except Exception as ex:
                 trace_span = _HTTP_SPAN.get()
                 trace_span.tags["http.error_code"] = ex.__class__.__name__
@@ -234,26 +338,29 @@ class NativeHTTPInstrumenter(BaseInstrumenter):
         return _func
 
     def _capture_request_body(self, trace_span, body):
-        if not body:
-            return
-        if not self.should_monitor_request_response:
-            return
-        if len(body) > SDK._maximum_body_byte_length:
-            SDK._report_notice(
-                "Large body excluded",
-                "INPUT_BODY_TOO_LARGE",
-                trace_span,
-            )
-            return
+        """
+        Capture the request body, and return the body to be sent instead.
+        Iterable bodies are captured as they're sent, and are returned wrapped.
+        """
+        if not body or not self.should_monitor_request_response:
+            return body
+        if hasattr(body, "read"):
+            _capture_file_body(trace_span, body)
+            return body
+        view = _body_view(body)
+        if view is not None:
+            _capture_input(trace_span, view)
+            return body
         try:
-            trace_span.input = body.decode("utf-8")
-        except Exception:
-            pass
+            return _capture_iterable_body(trace_span, iter(body))
+        except TypeError:
+            return body
 
     def _instrumented_getresponse(self):
         def _func(_self, *args, **kwargs):
             trace_span = _HTTP_SPAN.get()
-            if _self._sls_ignore or not trace_span:
+            # not set if request was sent bypassing `HTTPConnection.request`
+            if getattr(_self, "_sls_ignore", False) or not trace_span:
                 return self._original_getresponse(_self, *args, **kwargs)
 
             try:
@@ -270,7 +377,10 @@ class NativeHTTPInstrumenter(BaseInstrumenter):
     def _capture_response_body(self, trace_span, response):
         if not self.should_monitor_request_response:
             return
-        if response.length > SDK._maximum_body_byte_length:
+        if (
+            response.length is not None
+            and response.length > SDK._maximum_body_byte_length
+        ):
             SDK._report_notice(
                 "Large body excluded",
                 "OUTPUT_BODY_TOO_LARGE",
@@ -278,9 +388,10 @@ class NativeHTTPInstrumenter(BaseInstrumenter):
             )
             return
         try:
+            # buffered bytes are captured without being consumed
             response_body = response.peek()
             if response_body:
-                trace_span.output = response_body.decode("utf-8")
+                _capture_output(trace_span, response_body)
         except Exception as ex:
             report_error(ex)
 
@@ -299,7 +410,218 @@ class NativeHTTPInstrumenter(BaseInstrumenter):
         self._module = None
 
 
-_instrumenters = [NativeHTTPInstrumenter(), NativeAIOHTTPInstrumenter()]
+class HTTPXInstrumenter(BaseInstrumenter):
+    """
+    Trace requests sent with `httpx.Client` and `httpx.AsyncClient`.
+
+    A request span covers the `send` call, so also reading of the response body,
+    unless the response is streamed. Connections set up for the request
+    (as opposed to reused from the pool) are traced as
+    `python.<protocol>.connect` sub spans.
+    """
+
+    def __init__(self):
+        super().__init__("httpx")
+        self._original_send = None
+        self._original_async_send = None
+        self._original_connect = None
+        self._original_async_connect = None
+
+    def _start_span(self, request):
+        url = request.url
+        port = url.port or (443 if url.scheme == "https" else 80)
+        SDK._debug_log("HTTP request")
+        trace_span = SDK._create_trace_span(f"python.{url.scheme}.request")
+        trace_span.tags.update(
+            {
+                "method": request.method,
+                "host": f"{url.host}:{port}",
+                "path": url.path,
+                "request_header_names": [
+                    name.decode("latin-1") for name, _ in request.headers.raw
+                ],
+                "query_parameter_names": list(url.params.keys()),
+            },
+            prefix="http",
+        )
+        if self.should_monitor_request_response:
+            try:
+                body = request.content
+            except self._module.RequestNotRead:
+                # streamed request bodies are not captured
+                body = None
+            if body:
+                _capture_input(trace_span, _body_view(body))
+        return trace_span
+
+    def _close_span(self, trace_span, response):
+        trace_span.tags.update(
+            {"protocol": response.http_version, "status_code": response.status_code},
+            prefix="http",
+        )
+        if self.should_monitor_request_response and response.is_stream_consumed:
+            try:
+                if response.content:
+                    _capture_output(trace_span, response.content)
+            except Exception as ex:
+                report_error(ex)
+        trace_span.close()
+
+    def _close_span_with_error(self, trace_span, ex):
+        trace_span.tags["http.error_code"] = ex.__class__.__name__
+        if trace_span.end_time is None:
+            trace_span.close()
+
+    def _instrumented_send(self):
+        def _send(_self, request, *args, **kwargs):
+            if _IGNORE_FOLLOWING_REQUEST.get():
+                reset_ignore_following_request()
+                return self._original_send(_self, request, *args, **kwargs)
+
+            trace_span = self._start_span(request)
+            token = _HTTPX_SPAN.set(trace_span)
+            try:
+                response = self._original_send(_self, request, *args, **kwargs)
+            except Exception as ex:
+                self._close_span_with_error(trace_span, ex)
+                raise
+            finally:
+                _HTTPX_SPAN.reset(token)
+            self._close_span(trace_span, response)
+            return response
+
+        return _send
+
+    def _instrumented_async_send(self):
+        async def _send(_self, request, *args, **kwargs):
+            if _IGNORE_FOLLOWING_REQUEST.get():
+                reset_ignore_following_request()
+                return await self._original_async_send(_self, request, *args, **kwargs)
+
+            trace_span = self._start_span(request)
+            token = _HTTPX_SPAN.set(trace_span)
+            try:
+                response = await self._original_async_send(
+                    _self, request, *args, **kwargs
+                )
+            except Exception as ex:
+                self._close_span_with_error(trace_span, ex)
+                raise
+            finally:
+                _HTTPX_SPAN.reset(token)
+            self._close_span(trace_span, response)
+            return response
+
+        return _send
+
+    def _instrumented_connect(self):
+        def _connect(_self, request):
+            if _HTTPX_SPAN.get() is None:
+                return self._original_connect(_self, request)
+            start_time = time.perf_counter_ns()
+            stream = self._original_connect(_self, request)
+            _create_connect_span(
+                request.url.scheme.decode("ascii"),
+                (start_time, time.perf_counter_ns()),
+            )
+            return stream
+
+        return _connect
+
+    def _instrumented_async_connect(self):
+        async def _connect(_self, request):
+            if _HTTPX_SPAN.get() is None:
+                return await self._original_async_connect(_self, request)
+            start_time = time.perf_counter_ns()
+            stream = await self._original_async_connect(_self, request)
+            _create_connect_span(
+                request.url.scheme.decode("ascii"),
+                (start_time, time.perf_counter_ns()),
+            )
+            return stream
+
+        return _connect
+
+    def _install(self, module):
+        import httpcore
+
+        self._module = module
+        self._original_send = module.Client.send
+        self._original_async_send = module.AsyncClient.send
+        module.Client.send = self._instrumented_send()
+        module.AsyncClient.send = self._instrumented_async_send()
+
+        # connection setup is internal to httpcore, resolved only if it's as expected
+        if hasattr(httpcore.HTTPConnection, "_connect") and hasattr(
+            httpcore.AsyncHTTPConnection, "_connect"
+        ):
+            self._original_connect = httpcore.HTTPConnection._connect
+            self._original_async_connect = httpcore.AsyncHTTPConnection._connect
+            httpcore.HTTPConnection._connect = self._instrumented_connect()
+            httpcore.AsyncHTTPConnection._connect = self._instrumented_async_connect()
+
+    def _uninstall(self, module):
+        import httpcore
+
+        self._module.Client.send = self._original_send
+        self._module.AsyncClient.send = self._original_async_send
+        if self._original_connect:
+            httpcore.HTTPConnection._connect = self._original_connect
+            httpcore.AsyncHTTPConnection._connect = self._original_async_connect
+            self._original_connect = None
+            self._original_async_connect = None
+        self._module = None
+
+
+class Urllib3Instrumenter(BaseInstrumenter):
+    """
+    Record setup of urllib3 pool connections.
+
+    Requests are traced by `NativeHTTPInstrumenter`, as urllib3 connections are
+    `http.client` connections. A request that had to set up a new connection
+    (a pool miss) gets a `python.<protocol>.connect` sub span covering
+    the TCP connection and TLS handshake, while requests sent over a reused
+    pooled connection (a pool hit) have none.
+    """
+
+    def __init__(self):
+        super().__init__("urllib3")
+        self._original_connects = {}
+
+    def _instrumented_connect(self, original_connect):
+        def _func(_self, *args, **kwargs):
+            start_time = time.perf_counter_ns()
+            result = original_connect(_self, *args, **kwargs)
+            _self._sls_connection_setup = (start_time, time.perf_counter_ns())
+            return result
+
+        return _func
+
+    def _install(self, module):
+        self._module = module
+        for connection_class in (
+            module.connection.HTTPConnection,
+            module.connection.HTTPSConnection,
+        ):
+            original_connect = connection_class.__dict__.get("connect")
+            if original_connect is None:
+                continue
+            self._original_connects[connection_class] = original_connect
+            connection_class.connect = self._instrumented_connect(original_connect)
+
+    def _uninstall(self, module):
+        for connection_class, original_connect in self._original_connects.items():
+            connection_class.connect = original_connect
+        self._original_connects = {}
+        self._module = None
+
+
+_instrumenters = [
+    NativeHTTPInstrumenter(),
+    NativeAIOHTTPInstrumenter(),
+    Urllib3Instrumenter(),
+    HTTPXInstrumenter(),
+]
 _is_installed = False
 
 
@@ -0,0 +1,242 @@
+from __future__ import annotations
+import functools
+import inspect
+import re
+from typing import Callable, List, Mapping, Optional
+from typing_extensions import Final
+
+from . import trace
+from .error import report as report_error
+from .name import is_valid_name
+from .tags import ValidTags
+from .trace import TraceSpan
+
+__all__: Final[List[str]] = [
+    "SpanContext",
+    "NOOP_SPAN_CONTEXT",
+    "resolve_function_span_name",
+    "trace_function",
+]
+
+DEFAULT_FUNCTION_SPAN_NAME: Final[str] = "function"
+
+_INVALID_NAME_CHARACTERS_RE = re.compile(r"[^a-z0-9_]+")
+_REPEATED_UNDERSCORES_RE = re.compile(r"_+")
+
+
+class SpanContext:
+    """Context manager that traces its block as a span.
+
+    Span is created on enter and closed on exit. If span cannot be created
+    (e.g. due to invalid name) the error is reported and the block is run
+    without a span.
+    """
+
+    __slots__ = ("_name", "_tags", "_span")
+
+    def __init__(self, name: str, tags: Optional[Mapping[str, ValidTags]] = None):
+        self._name = name
+        self._tags = tags
+        self._span = None
+
+    def __enter__(self) -> Optional[TraceSpan]:
+        try:
+            self._span = TraceSpan(self._name)
+            if self._tags:
+                self._span.custom_tags.update(self._tags)
+        except Exception as ex:
+            report_error(ex, type="USER")
+        return self._span
+
+    def __exit__(self, *args) -> bool:
+        span = self._span
+        if span is not None and span.end_time is None:
+            try:
+                span.close()
+            except Exception as ex:
+                report_error(ex)
+        return False
+
+    async def __aenter__(self) -> Optional[TraceSpan]:
+        return self.__enter__()
+
+    async def __aexit__(self, *args) -> bool:
+        return self.__exit__(*args)
+
+
+class _NoopSpanContext:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args) -> bool:
+        return False
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *args) -> bool:
+        return False
+
+
+# returned when tracing is disabled, stateless, so it's shared
+NOOP_SPAN_CONTEXT: Final[_NoopSpanContext] = _NoopSpanContext()
+
+
+def resolve_function_span_name(func: Callable) -> str:
+    """Resolve span name from module and qualified name of a function.
+
+    e.g. `handler.get_user` for `get_user` function of `handler` module,
+    tokens are lower cased, and characters not allowed in span names are dropped.
+    """
+    tokens = []
+    path = f"{getattr(func, '__module__', None) or ''}.{func.__qualname__}"
+    for token in path.lower().split("."):
+        token = _INVALID_NAME_CHARACTERS_RE.sub("_", token)
+        # tokens need to start with a letter
+        token = _REPEATED_UNDERSCORES_RE.sub("_", token).lstrip("_0123456789")
+        token = token.rstrip("_")
+        if token:
+            tokens.append(token)
+    name = ".".join(tokens)
+    return name if is_valid_name(name) else DEFAULT_FUNCTION_SPAN_NAME
+
+
+class _GeneratorSpan:
+    """Span of a (async) generator, that is current only while it runs.
+
+    Generators are suspended in between iterations, and spans that the caller
+    creates in the meantime should not become sub spans of generator span.
+    """
+
+    __slots__ = ("_span_context", "_current")
+
+    def __init__(self, name: str):
+        caller = trace.ctx.get()
+        self._span_context = SpanContext(name)
+        self._span_context.__enter__()
+        self._current = trace.ctx.get()
+        trace.ctx.set(caller)
+
+    def _resume(self) -> Optional[TraceSpan]:
+        caller = trace.ctx.get()
+        trace.ctx.set(self._current)
+        return caller
+
+    def _suspend(self, caller: Optional[TraceSpan]):
+        self._current = trace.ctx.get()
+        trace.ctx.set(caller)
+
+    def run(self, func: Callable, *args):
+        caller = self._resume()
+        try:
+            return func(*args)
+        finally:
+            self._suspend(caller)
+
+    async def run_async(self, func: Callable, *args):
+        caller = self._resume()
+        try:
+            return await func(*args)
+        finally:
+            self._suspend(caller)
+
+    def close(self):
+        self._span_context.__exit__(None, None, None)
+
+
+def _drive_generator(generator, span: _GeneratorSpan):
+    # same as `yield from generator`, but runs generator with its span current
+    step, value = generator.send, None
+    while True:
+        try:
+            item = span.run(step, value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value = yield item
+            step = generator.send
+        except GeneratorExit:
+            span.run(generator.close)
+            raise
+        except BaseException as ex:
+            step, value = generator.throw, ex
+
+
+async def _call_async(func: Callable, *args):
+    return await func(*args)
+
+
+def trace_function(func: Callable, name: Optional[str], sdk):
+    """Wrap `func`, so that its calls are traced as spans.
+
+    Coroutine and (async) generator functions are traced until they're completed
+    (generators until they're exhausted or closed). Calls are not traced
+    until `sdk` is initialized.
+    """
+    name = name or resolve_function_span_name(func)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def _coroutine_wrapper(*args, **kwargs):
+            if not sdk._is_initialized:
+                return await func(*args, **kwargs)
+            with SpanContext(name):
+                return await func(*args, **kwargs)
+
+        return _coroutine_wrapper
+
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        async def _async_generator_wrapper(*args, **kwargs):
+            # async generators cannot delegate with `yield from`, values sent
+            # with `asend` and exceptions thrown with `athrow` are forwarded
+            span = _GeneratorSpan(name) if sdk._is_initialized else None
+            run = span.run_async if span else _call_async
+            try:
+                generator = func(*args, **kwargs)
+                step, value = generator.asend, None
+                while True:
+                    try:
+                        item = await run(step, value)
+                    except StopAsyncIteration:
+                        return
+                    try:
+                        value = yield item
+                        step = generator.asend
+                    except GeneratorExit:
+                        await run(generator.aclose)
+                        raise
+                    except BaseException as ex:
+                        step, value = generator.athrow, ex
+            finally:
+                if span:
+                    span.close()
+
+        return _async_generator_wrapper
+
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def _generator_wrapper(*args, **kwargs):
+            if not sdk._is_initialized:
+                return (yield from func(*args, **kwargs))
+            span = _GeneratorSpan(name)
+            try:
+                return (yield from _drive_generator(func(*args, **kwargs), span))
+            finally:
+                span.close()
+
+        return _generator_wrapper
+
+    @functools.wraps(func)
+    def _wrapper(*args, **kwargs):
+        if not sdk._is_initialized:
+            return func(*args, **kwargs)
+        with SpanContext(name):
+            return func(*args, **kwargs)
+
+    return _wrapper
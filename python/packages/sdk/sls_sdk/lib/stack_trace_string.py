@@ -1,21 +1,105 @@
-import traceback
+from __future__ import annotations
+import linecache
 import sys
-import inspect
-from typing import Optional, Any
+import traceback
+from types import CodeType
+from typing import Dict, List, Optional, Any, Tuple
+from typing_extensions import Final
 
+# most recent frames kept in stack traces, configurable with
+# `SLS_STACK_TRACE_MAX_DEPTH` setting
+DEFAULT_MAX_DEPTH: Final[int] = 100
+max_depth: int = DEFAULT_MAX_DEPTH
 
-def resolve(error: Optional[Any] = None) -> str:
+# the same frames are captured over and over (e.g. by logging calls),
+# formatted frames are cached up to this many entries
+MAX_CACHED_FRAMES: Final[int] = 4096
+_formatted_frames: Dict[Tuple[CodeType, int], str] = {}
+
+
+def _format_frame(code: CodeType, lineno: int) -> str:
+    key = (code, lineno)
+    formatted = _formatted_frames.get(key)
+    if formatted is not None:
+        return formatted
+
+    # same format as of `traceback.format_stack`
+    formatted = f'  File "{code.co_filename}", line {lineno}, in {code.co_name}\n'
+    line = linecache.getline(code.co_filename, lineno).strip()
+    if line:
+        formatted += f"    {line}\n"
+    if len(_formatted_frames) < MAX_CACHED_FRAMES:
+        _formatted_frames[key] = formatted
+    return formatted
+
+
+class StackTrace:
+    """Stack trace captured as raw frames, formatted once it's read.
+
+    Capturing only records code objects and line numbers of frames (or
+    unformatted traceback of an exception), source lines are looked up and
+    formatted on first conversion to `str`.
+    """
+
+    __slots__ = ("_frames", "_exception", "_formatted")
+
+    _frames: Optional[List[Tuple[CodeType, int]]]
+    _exception: Optional[traceback.TracebackException]
+    _formatted: Optional[str]
+
+    def __init__(
+        self,
+        frames: Optional[List[Tuple[CodeType, int]]] = None,
+        exception: Optional[traceback.TracebackException] = None,
+    ):
+        self._frames = frames
+        self._exception = exception
+        self._formatted = None
+
+    def __str__(self) -> str:
+        if self._formatted is None:
+            if self._exception is not None:
+                self._formatted = "".join(self._exception.format())
+            else:
+                # frames are recorded most recent first
+                self._formatted = "".join(
+                    _format_frame(code, lineno)
+                    for code, lineno in reversed(self._frames)
+                )
+            self._frames = self._exception = None
+        return self._formatted
+
+
+def capture(error: Optional[Any] = None, skip: int = 0) -> StackTrace:
+    """Capture stack trace of `error`, or the current one, to be formatted later.
+
+    Current stack trace starts `skip` frames above the caller of this function.
+    """
     if isinstance(error, BaseException):
         # in case of an actual Exception, stack trace is already set up.
-        return "".join(
-            traceback.format_exception(
-                etype=type(error), value=error, tb=error.__traceback__
+        return StackTrace(
+            exception=traceback.TracebackException(
+                type(error),
+                error,
+                error.__traceback__,
+                limit=-max_depth,
+                lookup_lines=False,
             )
         )
-    else:
-        # in case of errors that are not exceptions, return the current stack trace
-        # but exclude the most recent 3 frames to make sure stack trace ends at
-        # customer's code and does not include SDK internal methods.
-        depth = len(inspect.stack())
-        relevant_frame = sys._getframe(3) if depth > 3 else None
-        return "".join(traceback.format_stack(f=relevant_frame))
+
+    try:
+        frame = sys._getframe(skip + 1)
+    except ValueError:
+        frame = sys._getframe(1)
+    frames = []
+    while frame is not None and len(frames) < max_depth:
+        frames.append((frame.f_code, frame.f_lineno))
+        frame = frame.f_back
+    return StackTrace(frames)
+
+
+def resolve(error: Optional[Any] = None) -> str:
+    # in case of errors that are not exceptions, return the current stack trace
+    # but exclude the most recent 3 frames to make sure stack trace ends at
+    # customer's code and does not include SDK internal methods.
+    return str(capture(error, skip=3))
@@ -1,12 +1,14 @@
 from __future__ import annotations
 import re
+import sys
 from datetime import datetime
 from math import inf, nan
 from re import Pattern
-from typing import Dict, List, Mapping, Tuple, Optional
+from typing import Dict, Mapping, Tuple, Optional
 from js_regex import compile
 from typing_extensions import Final, get_args
 from threading import Lock
+from . import thread_mode
 from .error import report as report_error
 from ..base import TagType, ValidTags
 from ..exceptions import (
@@ -20,11 +22,37 @@ from ..exceptions import (
 RE: Final[str] = r"^[a-zA-Z0-9_.-]+$"
 RE_C: Final[Pattern] = compile(RE)
 
+VALID_TYPES: Final[Tuple[type, ...]] = (*get_args(TagType), list)
+NON_FINITE_NUMBERS: Final[Tuple[float, ...]] = (inf, -inf, nan)
+
+# instrumentations set the same static tag names over and over,
+# validated names are interned and cached up to this many entries
+MAX_CACHED_TAG_NAMES: Final[int] = 4096
+_valid_tag_names: Dict[str, str] = {}
+# tag name -> (camelCased parent tokens, camelCased last token)
+_key_paths: Dict[str, Tuple[Tuple[str, ...], str]] = {}
+
+
+# guards lazy creation of per-instance locks
+_lock_creation_lock: Final[Lock] = Lock()
+
 
 class Tags(Dict[str, ValidTags]):
+    __slots__ = ("_lock",)
+
     def __init__(self):
         super().__init__()
-        self._lock = Lock()
+        # created on first write, most tag sets are never written concurrently
+        self._lock = None
+
+    def _get_lock(self) -> Lock:
+        lock = self._lock
+        if lock is None:
+            with _lock_creation_lock:
+                if self._lock is None:
+                    self._lock = Lock()
+                lock = self._lock
+        return lock
 
     def _set(self, key: str, value: ValidTags):
         if value is None:
@@ -33,7 +61,15 @@ class Tags(Dict[str, ValidTags]):
         name = ensure_tag_name(key)
         value = ensure_tag_value(name, value)
 
-        with self._lock:
+        if thread_mode.is_single_threaded and thread_mode.ensure_owner_thread():
+            if name not in self:
+                super().__setitem__(name, value)
+                return
+            if value == self[name]:
+                return
+            raise DuplicateTraceSpanName(f"Cannot set tag: Tag {name} is already set")
+
+        with self._get_lock():
             if name not in self:
                 super().__setitem__(name, value)
                 return
@@ -51,7 +87,12 @@ class Tags(Dict[str, ValidTags]):
             report_error(ex)
 
     def __delitem__(self, key: str):
-        with self._lock:
+        if thread_mode.is_single_threaded and thread_mode.ensure_owner_thread():
+            if key in self:
+                super().__delitem__(key)
+            return
+
+        with self._get_lock():
             if key in self:
                 super().__delitem__(key)
 
@@ -97,22 +138,20 @@ def is_valid_name(name: str) -> bool:
     return bool(match)
 
 
-def is_date(value: str) -> bool:
-    try:
-        datetime.fromisoformat(value)
-        return True
-
-    except ValueError:
-        return False
-
-
 def ensure_tag_name(name: str) -> str:
     if not isinstance(name, str):
         raise InvalidTraceSpanTagName(
             f"Invalid trace span tag {name}: Expected string, received {name}"
         )
 
+    cached = _valid_tag_names.get(name)
+    if cached is not None:
+        return cached
+
     if is_valid_name(name):
+        name = sys.intern(name)
+        if len(_valid_tag_names) < MAX_CACHED_TAG_NAMES:
+            _valid_tag_names[name] = name
         return name
 
     raise InvalidTraceSpanTagName(
@@ -123,28 +162,13 @@ def ensure_tag_name(name: str) -> str:
 
 
 def ensure_tag_value(attr: str, value: str) -> ValidTags:
-    valid_types: Tuple[type] = get_args(TagType)  # type: ignore
-    valid_types = (*valid_types, list)  # type: ignore
-
-    if not isinstance(value, valid_types):
-        raise InvalidTraceSpanTagValue(
-            f"Invalid trace span tag value for {attr}: "
-            f"Expected {valid_types}, received {value}"
-        )
-
-    if isinstance(value, datetime):
-        return value.isoformat()
-
-    if isinstance(value, str) and is_date(value):
-        return value
-
-    elif isinstance(value, str):
+    # strings, including ISO date strings, are stored as they are
+    if isinstance(value, str):
         return value
 
-    elif isinstance(value, (int, float)):
-        invalid = inf, -inf, nan
-
-        if value in invalid:
+    # covers bool, which is a subclass of int
+    if isinstance(value, (int, float)):
+        if value in NON_FINITE_NUMBERS:
             raise InvalidTraceSpanTagValue(
                 f"Invalid trace span tag value for {attr}: "
                 f"Number must be finite. Received: {value}"
@@ -152,10 +176,10 @@ def ensure_tag_value(attr: str, value: str) -> ValidTags:
 
         return value
 
-    elif isinstance(value, bool):
-        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
 
-    if isinstance(value, List):
+    if isinstance(value, list):
         valid: bool = all(ensure_tag_value("tags", item) is not None for item in value)
 
         if valid:
@@ -163,7 +187,7 @@ def ensure_tag_value(attr: str, value: str) -> ValidTags:
 
     raise InvalidTraceSpanTagValue(
         f"Invalid trace span tag value for {attr}: "
-        f"Expected {valid_types}, received {value}"
+        f"Expected {VALID_TYPES}, received {value}"
     )
 
 
@@ -171,16 +195,32 @@ def _snake_to_camel_case(string):
     return re.sub(r"_(.)", lambda match: match.group(1).upper(), string)
 
 
+def _to_key_path(key: str) -> Tuple[Tuple[str, ...], str]:
+    path = _key_paths.get(key)
+    if path is not None:
+        return path
+
+    tokens = tuple(_snake_to_camel_case(token) for token in key.split("."))
+    path = tokens[:-1], tokens[-1]
+    if len(_key_paths) < MAX_CACHED_TAG_NAMES:
+        _key_paths[key] = path
+    return path
+
+
 def convert_tags_to_protobuf(tags: Tags):
     protobuf_tags = {}
+    # nested dicts by their (camelCased) parent path,
+    # so that tags sharing a prefix resolve it once
+    contexts = {(): protobuf_tags}
     for key, value in tags.items():
-        context = protobuf_tags
-        key_tokens = key.split(".")
-        key_tokens = [_snake_to_camel_case(token) for token in key_tokens]
-        last_token = key_tokens.pop()
-        for token in key_tokens:
-            if token not in context:
-                context[token] = {}
-            context = context[token]
+        parent_path, last_token = _to_key_path(key)
+        context = contexts.get(parent_path)
+        if context is None:
+            context = protobuf_tags
+            for token in parent_path:
+                if token not in context:
+                    context[token] = {}
+                context = context[token]
+            contexts[parent_path] = context
         context[last_token] = value
     return protobuf_tags
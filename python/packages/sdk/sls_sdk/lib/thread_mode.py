@@ -0,0 +1,42 @@
+from __future__ import annotations
+import logging
+from threading import get_ident
+from typing import List, Optional
+from typing_extensions import Final
+
+__all__: Final[List[str]] = [
+    "enable_single_threaded_mode",
+    "disable_single_threaded_mode",
+    "ensure_owner_thread",
+]
+
+logger = logging.getLogger(__name__)
+
+# When enabled, Tags are written without acquiring locks. It's enabled with
+# `SLS_SINGLE_THREADED` setting, and is switched off once a span is created,
+# or a tag is written, in a thread other than the one that enabled it.
+is_single_threaded: bool = False
+owner_thread_id: Optional[int] = None
+
+
+def enable_single_threaded_mode():
+    global is_single_threaded, owner_thread_id
+    owner_thread_id = get_ident()
+    is_single_threaded = True
+
+
+def disable_single_threaded_mode():
+    global is_single_threaded, owner_thread_id
+    is_single_threaded = False
+    owner_thread_id = None
+
+
+def ensure_owner_thread() -> bool:
+    """Switch single threaded mode off if called outside of the owner thread.
+
+    Returns whether single threaded mode is (still) enabled.
+    """
+    if is_single_threaded and get_ident() != owner_thread_id:
+        disable_single_threaded_mode()
+        logger.debug("Single threaded mode disabled: SDK used in another thread")
+    return is_single_threaded
@@ -1,10 +1,8 @@
 from __future__ import annotations
-from collections.abc import Iterable
 import logging
 import time
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Union
 from contextvars import ContextVar
-from backports.cached_property import cached_property  # available in Python >=3.8
 from typing_extensions import Final, Self
 import json
 from .timing import to_protobuf_epoch_timestamp
@@ -21,6 +19,7 @@ from .emitter import event_emitter
 from .id import generate_id
 from .name import get_resource_name
 from .tags import Tags, convert_tags_to_protobuf
+from . import thread_mode
 
 logger = logging.getLogger(__name__)
 
@@ -33,21 +32,56 @@ __all__: Final[List[str]] = [
 TraceSpanContext = ContextVar[Optional["TraceSpan"]]
 
 
+# Current span. Each asyncio task runs in a copy of the context it was created in,
+# so it resolves parents of its spans from the span current at its creation,
+# unaffected by spans opened and closed by concurrent tasks.
 ctx: Final[TraceSpanContext] = ContextVar("ctx", default=None)
 root_span: Optional[TraceSpan] = None
 
 
+def _decode_body(body: bytes) -> Optional[str]:
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
 class TraceSpan:
+    # Spans are created in large numbers, slots keep them compact. `__dict__` is
+    # kept so that arbitrary attributes can still be attached, it is only
+    # allocated when that happens.
+    __slots__ = (
+        "parent_span",
+        "name",
+        "start_time",
+        "sub_spans",
+        "_end_time",
+        "_input",
+        "_output",
+        "_tags",
+        "_custom_tags",
+        "_id",
+        "_trace_id",
+        "_on_close_by_root",
+        "_descendant_spans",
+        "__dict__",
+    )
+
     parent_span: Self
     name: str
     start_time: Nanoseconds
-    end_time: Optional[Nanoseconds] = None
-    _input: Optional[str] = None
-    _output: Optional[str] = None
-    tags: Tags
-    custom_tags: Tags
     sub_spans: List[Self]
-    _on_close_by_root: Optional[Callable] = None
+    _end_time: Optional[Nanoseconds]
+    # bodies captured by instrumentations are kept as `bytes` until read
+    _input: Optional[Union[str, bytes]]
+    _output: Optional[Union[str, bytes]]
+    _tags: Optional[Tags]
+    _custom_tags: Optional[Tags]
+    _id: Optional[TraceId]
+    _trace_id: Optional[TraceId]
+    _on_close_by_root: Optional[Callable]
+    # append-only registry of all descendant spans, only maintained on the root span
+    _descendant_spans: Optional[List[Self]]
 
     def __init__(
         self,
@@ -59,6 +93,11 @@ class TraceSpan:
         immediate_descendants: Optional[List[str]] = None,
         on_close_by_root: Optional[Callable] = None,
     ):
+        self._end_time = None
+        self._id = None
+        self._trace_id = None
+        self._descendant_spans = None
+        self._on_close_by_root = on_close_by_root
         self._set_name(name)
         self.input = input
         self.output = output
@@ -67,14 +106,60 @@ class TraceSpan:
         self._set_start_time(start_time)
         self._set_tags(tags)
         self._set_spans(immediate_descendants)
-        self._on_close_by_root = on_close_by_root
+
+    @classmethod
+    def _restore(
+        cls,
+        parent_span: TraceSpan,
+        name: str,
+        start_time: Nanoseconds,
+        end_time: Nanoseconds,
+        input: Optional[Union[str, bytes]] = None,
+        output: Optional[Union[str, bytes]] = None,
+        tags: Optional[dict] = None,
+        custom_tags: Optional[dict] = None,
+    ) -> Self:
+        """Recreate a closed span recorded in another process.
+
+        Span is attached as a sub span of `parent_span` and emitted as closed.
+        Its name and tags were validated when it was recorded, and are not
+        validated again.
+        """
+        if thread_mode.is_single_threaded:
+            thread_mode.ensure_owner_thread()
+        span = cls.__new__(cls)
+        span.name = name
+        span.start_time = start_time
+        span._end_time = end_time
+        span._input = input
+        span._output = output
+        span._tags = None
+        span._custom_tags = None
+        span._id = None
+        span._trace_id = None
+        span._descendant_spans = None
+        span._on_close_by_root = None
+        span.sub_spans = []
+        # fresh tag sets, not shared with other threads yet
+        if tags:
+            dict.update(span.tags, tags)
+        if custom_tags:
+            dict.update(span.custom_tags, custom_tags)
+        span.parent_span = parent_span
+        parent_span.sub_spans.append(span)
+        root_span._descendant_spans.append(span)
+        event_emitter.emit("trace-span-close", span)
+        return span
 
     @staticmethod
     def resolve_current_span() -> Optional[TraceSpan]:
         global root_span, ctx
-        span = ctx.get(None)
-
-        return span or root_span or None
+        span = ctx.get(None) or root_span
+        # closing a span leaves its parent current, even if it's closed already,
+        # closed ancestors are skipped only once the current span is needed
+        while span is not None and span.end_time is not None and span is not root_span:
+            span = span.parent_span or root_span
+        return span
 
     def _set_spans(self, immediate_descendants: Optional[List[str]]):
         self._set_span_hierarchy()
@@ -88,19 +173,21 @@ class TraceSpan:
 
     def _set_span_hierarchy(self):
         global root_span
+        if thread_mode.is_single_threaded:
+            thread_mode.ensure_owner_thread()
         if root_span is None:
             root_span = self
             self.parent_span = None
+            self._descendant_spans = []
         else:
             if root_span.end_time is not None:
                 raise UnreachableTrace("Cannot initialize span: Trace is closed")
 
             self.parent_span = TraceSpan.resolve_current_span()
-            while self.parent_span.end_time:
-                self.parent_span = self.parent_span.parent_span or root_span
 
         if self.parent_span:
             self.parent_span.sub_spans.append(self)
+            root_span._descendant_spans.append(self)
 
     def _set_ctx(self, override: Optional[TraceSpan] = None):
         global ctx
@@ -110,12 +197,37 @@ class TraceSpan:
         self.name = get_resource_name(name)
 
     def _set_tags(self, tags: Optional[Tags]):
-        self.tags = Tags()
-        self.custom_tags = Tags()
+        # tags are allocated lazily, on first access
+        self._tags = None
+        self._custom_tags = None
 
-        if tags is not None:
+        if tags:
             self.tags.update(tags)
 
+    @property
+    def tags(self) -> Tags:
+        if self._tags is None:
+            self._tags = Tags()
+        return self._tags
+
+    @property
+    def custom_tags(self) -> Tags:
+        if self._custom_tags is None:
+            self._custom_tags = Tags()
+        return self._custom_tags
+
+    @property
+    def end_time(self) -> Optional[Nanoseconds]:
+        return self._end_time
+
+    @end_time.setter
+    def end_time(self, value: Optional[Nanoseconds]):
+        self._end_time = value
+
+    @end_time.deleter
+    def end_time(self):
+        self._end_time = None
+
     def _set_start_time(self, start_time: Optional[Nanoseconds]):
         default_start = time.perf_counter_ns()
 
@@ -128,25 +240,52 @@ class TraceSpan:
             )
         self.start_time = start_time or default_start
 
-    @cached_property
+    @property
     def id(self) -> TraceId:
-        return generate_id()
+        if self._id is None:
+            self._id = generate_id()
+        return self._id
 
-    @cached_property
-    def trace_id(self) -> TraceId:
-        parent = self.parent_span
+    @id.deleter
+    def id(self):
+        self._id = None
 
-        if parent is self:
-            return generate_id()
-
-        return parent.trace_id if parent else generate_id()
+    @property
+    def trace_id(self) -> TraceId:
+        if self._trace_id is None:
+            parent = self.parent_span
+            if parent is None or parent is self:
+                self._trace_id = generate_id()
+            else:
+                self._trace_id = parent.trace_id
+        return self._trace_id
+
+    @trace_id.deleter
+    def trace_id(self):
+        self._trace_id = None
 
     @property
     def spans(self) -> List[TraceSpan]:
-        return [self] + list(_flatten([s.spans for s in self.sub_spans]))
+        if self._descendant_spans is not None:
+            return [self, *self._descendant_spans]
+
+        spans = []
+        pending = [self]
+        while pending:
+            span = pending.pop()
+            spans.append(span)
+            pending.extend(reversed(span.sub_spans))
+        return spans
+
+    def _clear_sub_spans(self):
+        self.sub_spans.clear()
+        if self._descendant_spans is not None:
+            self._descendant_spans.clear()
 
     @property
     def output(self) -> str:
+        if self._output.__class__ is bytes:
+            self._output = _decode_body(self._output)
         return self._output
 
     @output.setter
@@ -158,6 +297,8 @@ class TraceSpan:
 
     @property
     def input(self) -> str:
+        if self._input.__class__ is bytes:
+            self._input = _decode_body(self._input)
         return self._input
 
     @input.setter
@@ -167,6 +308,13 @@ class TraceSpan:
 
         self._input = value
 
+    def _capture_input(self, body: bytes):
+        # captured bodies are decoded only once read
+        self._input = body
+
+    def _capture_output(self, body: bytes):
+        self._output = body
+
     def close(self, end_time: Optional[Nanoseconds] = None):
         global root_span, ctx
         default: Nanoseconds = time.perf_counter_ns()
@@ -192,7 +340,7 @@ class TraceSpan:
             # if this is the root span, check if there are any leftovers
             # and finally reset root_span and reset the context
             left_over_spans = []
-            for sub_span in self.spans:
+            for sub_span in self._descendant_spans:
                 if not sub_span.end_time:
                     if sub_span._on_close_by_root:
                         sub_span._on_close_by_root()
@@ -206,22 +354,10 @@ class TraceSpan:
                     + f" end of lambda invocation: {spans}"
                 )
             self._set_ctx()
-        else:
+        elif self is ctx.get(None):
             # if this is not the root span and context points to this
-            # then we need to reset the context to the first open ancestor span
-            if self is ctx.get(None):
-                current = self.parent_span
-                found = False
-                # loop through ancestors
-                while current:
-                    if not current.end_time:
-                        # break at the first open ancestor and store it in the context
-                        self._set_ctx(current)
-                        found = True
-                        break
-                    current = current.parent_span
-                if not found:
-                    self._set_ctx(root_span)
+            # then we need to reset the context to the parent span
+            self._set_ctx(self.parent_span or root_span)
 
         event_emitter.emit("trace-span-close", self)
         return self
@@ -236,17 +372,8 @@ class TraceSpan:
             "endTimeUnixNano": to_protobuf_epoch_timestamp(self.end_time),
             "input": self.input,
             "output": self.output,
-            "tags": convert_tags_to_protobuf(self.tags),
+            "tags": convert_tags_to_protobuf(self._tags or {}),
         }
-        if self.custom_tags:
+        if self._custom_tags:
             result["customTags"] = json.dumps(self.custom_tags)
         return result
-
-
-def _flatten(xs):
-    # https://stackoverflow.com/a/2158532
-    for x in xs:
-        if isinstance(x, Iterable) and not isinstance(x, (str, bytes)):
-            yield from _flatten(x)
-        else:
-            yield x
@@ -3,7 +3,7 @@ import time
 from typing import Optional
 from .tags import Tags
 from .captured_event import CapturedEvent
-from .stack_trace_string import resolve as resolve_stack_trace_string
+from .stack_trace_string import capture as capture_stack_trace
 
 
 logger = logging.getLogger(__name__)
@@ -24,7 +24,9 @@ def create(
     fingerprint: Optional[str] = None,
 ):
     timestamp = time.perf_counter_ns()
-    stack_trace = resolve_stack_trace_string()
+    # exclude frames of this function and its caller, so that
+    # stack trace ends at customer's code, it's formatted only once read
+    stack_trace = capture_stack_trace(skip=2)
 
     tags = tags or Tags()
     captured_event = CapturedEvent(
@@ -35,8 +37,8 @@ def create(
         tags={
             "warning.message": message,
             "warning.type": TYPE_MAP[type],
-            "warning.stacktrace": stack_trace,
         },
+        lazy_tags={"warning.stacktrace": stack_trace},
         origin=origin,
     )
     # to avoid circular dependency, require inline
@@ -53,7 +55,7 @@ def create(
         "source": "serverlessSdk",
         "type": "WARNING_TYPE_USER",
         "message": message,
-        "stack": stack_trace,
+        "stack": str(stack_trace),
     }
     if fingerprint:
         warn_log_data["fingerprint"] = fingerprint
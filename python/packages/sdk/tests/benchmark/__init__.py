@@ -0,0 +1,13 @@
+import os
+import timeit
+from typing import Callable
+
+
+def setup_environment():
+    os.environ.setdefault("SLS_ORG_ID", "benchmark-org")
+
+
+def measure(name: str, func: Callable, number: int = 100, repeat: int = 5) -> float:
+    duration = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print(f"{name.ljust(48)} {duration * 1_000_000:12.1f}µs")
+    return duration
@@ -0,0 +1,60 @@
+import asyncio
+from . import measure, setup_environment
+
+setup_environment()
+
+from sls_sdk.lib.trace import TraceSpan  # noqa: E402
+
+TASK_COUNT = 1000
+DEPTH = 10
+
+
+async def _task(parent, results):
+    spans = []
+    for _ in range(DEPTH):
+        spans.append(TraceSpan("nested"))
+        await asyncio.sleep(0)
+    expected_parent = parent
+    for span in spans:
+        results.append(span.parent_span is expected_parent)
+        expected_parent = span
+    # close outermost first, inner spans then restore closed parents
+    for span in spans:
+        span.close()
+    TraceSpan("after").close()
+
+
+async def _task_without_spans():
+    for _ in range(DEPTH):
+        await asyncio.sleep(0)
+
+
+async def _fan_out_without_spans():
+    await asyncio.gather(*(_task_without_spans() for _ in range(TASK_COUNT)))
+
+
+async def _fan_out(root, results):
+    parent = TraceSpan("parent")
+    await asyncio.gather(*(_task(parent, results) for _ in range(TASK_COUNT)))
+    parent.close()
+    root.sub_spans.clear()
+    root._descendant_spans.clear()
+
+
+if __name__ == "__main__":
+    root = TraceSpan("root")
+    results = []
+    asyncio.run(_fan_out(root, results))
+    print(
+        f"Parents resolved correctly: {sum(results)} of {len(results)}"
+        f" ({TASK_COUNT} concurrent tasks)"
+    )
+    print(f"{TASK_COUNT} concurrent tasks creating {DEPTH} nested spans each:")
+    baseline = measure(
+        "without spans", lambda: asyncio.run(_fan_out_without_spans()), number=5
+    )
+    traced = measure("with spans", lambda: asyncio.run(_fan_out(root, [])), number=5)
+    print(
+        f"{'overhead per span'.ljust(48)}"
+        f" {(traced - baseline) * 1_000_000 / (TASK_COUNT * (DEPTH + 1)):12.1f}µs"
+    )
@@ -0,0 +1,44 @@
+from . import measure, setup_environment
+
+setup_environment()
+
+from sls_sdk import serverlessSdk  # noqa: E402
+from sls_sdk.lib.trace import TraceSpan  # noqa: E402
+from sls_sdk.lib.instrumentation.http import (  # noqa: E402
+    _body_view,
+    _capture_input,
+    _capture_iterable_body,
+)
+
+BODY = b"a" * 1024 * 100
+CHUNKS = [BODY[index : index + 1024] for index in range(0, len(BODY), 1024)]
+
+
+def _decode_eagerly(span):
+    span.input = BODY.decode("utf-8")
+
+
+def _concatenate_chunks(span):
+    body = None
+    for chunk in CHUNKS:
+        body = chunk if body is None else body + chunk
+    span.input = body.decode("utf-8")
+
+
+def _drain(iterable):
+    for _ in iterable:
+        pass
+
+
+if __name__ == "__main__":
+    serverlessSdk._initialize()
+    span = TraceSpan("python.http.request")
+    print(f"Capturing a {len(BODY) // 1024}KB request body:")
+    measure("decoded on capture", lambda: _decode_eagerly(span))
+    measure("captured as bytes", lambda: _capture_input(span, _body_view(BODY)))
+    print(f"Capturing a body sent in {len(CHUNKS)} chunks:")
+    measure("concatenated with +=", lambda: _concatenate_chunks(span))
+    measure(
+        "captured while iterated",
+        lambda: _drain(_capture_iterable_body(span, iter(CHUNKS))),
+    )
@@ -0,0 +1,60 @@
+from threading import Lock
+from blinker import Signal
+from . import measure, setup_environment
+
+setup_environment()
+
+from sls_sdk.lib.emitter import EventEmitter  # noqa: E402
+
+SPAN_COUNT = 10_000
+
+
+class _Instrumenter:
+    # mimics dev mode listener of the AWS Lambda instrumenter,
+    # which buffers spans under a lock
+    def __init__(self):
+        self.spans = []
+        self._lock = Lock()
+
+    def on_span_close(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+
+def _emit(emit, instrumenter):
+    def _run():
+        for span in range(SPAN_COUNT):
+            emit("trace-span-close", span)
+        instrumenter.spans.clear()
+
+    return _run
+
+
+def _blinker():
+    instrumenter = _Instrumenter()
+    signals = {"trace-span-close": Signal()}
+    signals["trace-span-close"].connect(instrumenter.on_span_close)
+    return (
+        lambda event, *args, **kwargs: signals[event].send(*args, **kwargs),
+        instrumenter,
+    )
+
+
+def _emitter():
+    instrumenter = _Instrumenter()
+    emitter = EventEmitter()
+    emitter.on("trace-span-close", instrumenter.on_span_close)
+    return emitter.emit, instrumenter
+
+
+if __name__ == "__main__":
+    print(f"Emitting {SPAN_COUNT} closed spans:")
+    results = (
+        ("blinker Signal", measure("blinker Signal", _emit(*_blinker()), number=20)),
+        ("EventEmitter", measure("EventEmitter", _emit(*_emitter()), number=20)),
+    )
+    for name, duration in results:
+        print(
+            f"{f'per span, {name}'.ljust(48)}"
+            f" {duration * 1_000_000_000 / SPAN_COUNT:12.1f}ns"
+        )
@@ -0,0 +1,40 @@
+from . import measure, setup_environment
+
+setup_environment()
+
+import httpx  # noqa: E402
+from sls_sdk import serverlessSdk  # noqa: E402
+from sls_sdk.lib.instrumentation import http  # noqa: E402
+
+REQUEST_COUNT = 100
+
+
+def _handler(request):
+    return httpx.Response(200, content=b"ok")
+
+
+def _send_requests(client):
+    for _ in range(REQUEST_COUNT):
+        client.get("https://example.com/items?limit=10", headers={"X-Foo": "bar"})
+
+
+if __name__ == "__main__":
+    # mock transport, so that only the client side of requests is measured
+    client = httpx.Client(transport=httpx.MockTransport(_handler))
+    print(f"Sending {REQUEST_COUNT} requests with httpx (mock transport):")
+    baseline = measure("not instrumented", lambda: _send_requests(client), number=10)
+
+    serverlessSdk._initialize()
+    root = serverlessSdk._create_trace_span("root")
+
+    def _send_traced_requests():
+        _send_requests(client)
+        root.sub_spans.clear()
+        root._descendant_spans.clear()
+
+    traced = measure("instrumented", _send_traced_requests, number=10)
+    http.uninstall()
+    print(
+        f"{'overhead per request'.ljust(48)}"
+        f" {(traced - baseline) * 1_000_000 / REQUEST_COUNT:12.1f}µs"
+    )
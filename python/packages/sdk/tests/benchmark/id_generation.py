@@ -0,0 +1,14 @@
+from secrets import token_hex
+from . import measure, setup_environment
+
+setup_environment()
+
+from sls_sdk.lib.id import generate_id  # noqa: E402
+
+COUNT = 1000
+
+
+if __name__ == "__main__":
+    print(f"Generating {COUNT} ids:")
+    measure("secrets.token_hex", lambda: [token_hex(16) for _ in range(COUNT)])
+    measure("generate_id", lambda: [generate_id() for _ in range(COUNT)])
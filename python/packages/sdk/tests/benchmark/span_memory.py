@@ -0,0 +1,60 @@
+import gc
+import tracemalloc
+from . import setup_environment
+
+setup_environment()
+
+from sls_sdk import serverlessSdk  # noqa: E402
+from sls_sdk.lib.captured_event import CapturedEvent  # noqa: E402
+
+COUNT = 10_000
+
+
+def _create_spans(with_tags: bool):
+    for index in range(COUNT):
+        span = serverlessSdk._create_trace_span("python.https.request")
+        if with_tags:
+            span.tags.update(
+                {"method": "GET", "path": "/items", "status_code": 200}, prefix="http"
+            )
+        span.close()
+
+
+def _create_captured_events():
+    return [
+        CapturedEvent("telemetry.notice.generated.v1", tags={"notice.type": 1})
+        for _ in range(COUNT)
+    ]
+
+
+def _measure(name: str, func):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(
+        f"{name.ljust(40)} {retained / 1024:10.1f} KiB"
+        f" {retained / COUNT:8.0f} B/item"
+    )
+    return result
+
+
+def main():
+    serverlessSdk._initialize(
+        disable_python_log_monitoring=True,
+        disable_http_monitoring=True,
+        disable_flask_monitoring=True,
+    )
+    root = serverlessSdk._create_trace_span("root")
+    print(f"Retained memory ({COUNT} items)")
+    _measure("spans without tags", lambda: _create_spans(False))
+    _measure("spans with 3 tags", lambda: _create_spans(True))
+    _measure("captured events with 1 tag", _create_captured_events)
+    root.close()
+
+
+if __name__ == "__main__":
+    main()
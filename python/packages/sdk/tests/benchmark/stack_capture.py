@@ -0,0 +1,43 @@
+import inspect
+import sys
+import traceback
+from . import measure, setup_environment
+
+setup_environment()
+
+from sls_sdk.lib.stack_trace_string import capture  # noqa: E402
+
+DEPTH = 30
+CAPTURE_COUNT = 100
+
+
+def _previous_resolve():
+    # stack trace resolution as done before captures were made lazy
+    depth = len(inspect.stack())
+    relevant_frame = sys._getframe(3) if depth > 3 else None
+    return "".join(traceback.format_stack(f=relevant_frame))
+
+
+def _nested(depth, func):
+    if depth:
+        return _nested(depth - 1, func)
+    return func()
+
+
+def _captures(func):
+    def _run():
+        for _ in range(CAPTURE_COUNT):
+            _nested(DEPTH, func)
+
+    return _run
+
+
+if __name__ == "__main__":
+    print(f"{CAPTURE_COUNT} stack traces, {DEPTH}+ frames deep:")
+    measure("inspect.stack and format_stack", _captures(_previous_resolve), number=5)
+    measure("capture", _captures(lambda: capture(skip=2)), number=5)
+    measure(
+        "capture and format (cached frames)",
+        _captures(lambda: str(capture(skip=2))),
+        number=5,
+    )
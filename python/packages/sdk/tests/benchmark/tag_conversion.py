@@ -0,0 +1,66 @@
+from . import measure, setup_environment
+
+setup_environment()
+
+from sls_sdk.lib.tags import Tags, convert_tags_to_protobuf  # noqa: E402
+
+SPAN_COUNT = 500
+
+
+def _create_span_tags():
+    tags = []
+    aws_lambda_tags = Tags()
+    aws_lambda_tags.update(
+        {"event_source": "aws.apigateway", "event_type": "aws.apigateway.rest"},
+        "aws.lambda",
+    )
+    aws_lambda_tags.update(
+        {"account_id": "123456789012", "api_id": "xxxxxxxxxx", "api_stage": "dev"},
+        "aws.lambda.api_gateway",
+    )
+    aws_lambda_tags.update(
+        {"id": "request-id", "time_epoch": 1680000000000, "path_parameter_names": []},
+        "aws.lambda.api_gateway.request",
+    )
+    tags.append(aws_lambda_tags)
+    for index in range(SPAN_COUNT - 1):
+        span_tags = Tags()
+        if index % 2:
+            span_tags.update(
+                {
+                    "method": "GET",
+                    "protocol": "HTTP/1.1",
+                    "host": "example.com:443",
+                    "path": f"/items/{index}",
+                    "request_header_names": ["Host", "User-Agent"],
+                    "query_parameter_names": [],
+                    "status_code": 200,
+                },
+                "http",
+            )
+        else:
+            span_tags.update(
+                {
+                    "region": "us-east-1",
+                    "signature_version": "v4",
+                    "service": "dynamodb",
+                    "operation": "query",
+                    "request_id": f"request-{index}",
+                },
+                "aws.sdk",
+            )
+            span_tags.update(
+                {"table_name": "items", "limit": 10, "count": 1, "scanned_count": 1},
+                "aws.sdk.dynamodb",
+            )
+        tags.append(span_tags)
+    return tags
+
+
+if __name__ == "__main__":
+    span_tags = _create_span_tags()
+    print(f"Converting tags of a {SPAN_COUNT} span trace:")
+    measure(
+        "convert_tags_to_protobuf",
+        lambda: [convert_tags_to_protobuf(tags) for tags in span_tags],
+    )
@@ -0,0 +1,50 @@
+from . import measure, setup_environment
+
+setup_environment()
+
+from sls_sdk import serverlessSdk  # noqa: E402
+from sls_sdk.lib.trace import TraceSpan  # noqa: E402
+
+CALL_COUNT = 10_000
+
+
+def get_user(user_id):
+    return user_id
+
+
+traced_get_user = serverlessSdk.traced(get_user)
+
+
+def _calls(func):
+    def _run():
+        for user_id in range(CALL_COUNT):
+            func(user_id)
+
+    return _run
+
+
+def _traced_calls(root):
+    run = _calls(traced_get_user)
+
+    def _run():
+        run()
+        root.sub_spans.clear()
+        root._descendant_spans.clear()
+
+    return _run
+
+
+if __name__ == "__main__":
+    print(f"{CALL_COUNT} calls:")
+    baseline = measure("plain function", _calls(get_user), number=5)
+    disabled = measure(
+        "traced function, SDK not initialized", _calls(traced_get_user), number=5
+    )
+    serverlessSdk._initialize()
+    root = TraceSpan("root")
+    enabled = measure("traced function, SDK initialized", _traced_calls(root), number=5)
+    for name, duration in (("not initialized", disabled), ("initialized", enabled)):
+        print(
+            f"{f'overhead per call, {name}'.ljust(48)}"
+            f" {(duration - baseline) * 1_000_000_000 / CALL_COUNT:12.1f}ns"
+        )
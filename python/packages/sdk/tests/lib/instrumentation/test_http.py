@@ -1,3 +1,4 @@
+import io
 import pytest
 from unittest.mock import patch
 import asyncio
@@ -82,6 +83,122 @@ def test_instrument_http_client(
     _assert_request_response_body(instrumented_sdk, request_body, response_body)
 
 
+def test_instrument_http_client_request_bypassed(
+    instrumented_sdk,
+    httpserver: HTTPServer,
+):
+    # given
+    httpserver.expect_request("/foo").respond_with_data("ok")
+
+    # when
+    import http.client
+
+    url = urlparse(httpserver.url_for("/foo"))
+    conn = http.client.HTTPConnection(url.hostname, url.port)
+    # as urllib3 2.x does, instead of calling `request`
+    conn.putrequest("GET", url.path)
+    conn.endheaders()
+    response = conn.getresponse()
+    conn.close()
+
+    # then
+    assert response.status == 200
+
+
+@pytest.mark.parametrize(
+    "request_body",
+    [SMALL_REQUEST_PAYLOAD, LARGE_REQUEST_PAYLOAD],
+)
+def test_instrument_http_client_file_body(
+    instrumented_sdk,
+    httpserver: HTTPServer,
+    request_body,
+):
+    # given
+    received = []
+
+    def handler(request: Request):
+        received.append(request.get_data())
+        return Response(SMALL_RESPONSE_PAYLOAD)
+
+    httpserver.expect_request("/foo").respond_with_handler(handler)
+
+    # when
+    import http.client
+
+    url = urlparse(httpserver.url_for("/foo"))
+    conn = http.client.HTTPConnection(url.hostname, url.port)
+    conn.request("POST", url.path, io.BytesIO(request_body))
+    conn.getresponse()
+    conn.close()
+
+    # then
+    assert received == [request_body]
+    _assert_request_response_body(
+        instrumented_sdk, request_body, SMALL_RESPONSE_PAYLOAD
+    )
+
+
+@pytest.mark.parametrize(
+    "request_body",
+    [SMALL_REQUEST_PAYLOAD, LARGE_REQUEST_PAYLOAD],
+)
+def test_instrument_http_client_iterable_body(
+    instrumented_sdk,
+    httpserver: HTTPServer,
+    request_body,
+):
+    # given
+    received = []
+
+    def handler(request: Request):
+        received.append(request.get_data())
+        return Response(SMALL_RESPONSE_PAYLOAD)
+
+    httpserver.expect_request("/foo").respond_with_handler(handler)
+    chunks = [request_body[i : i + 1024] for i in range(0, len(request_body), 1024)]
+
+    # when
+    import http.client
+
+    url = urlparse(httpserver.url_for("/foo"))
+    conn = http.client.HTTPConnection(url.hostname, url.port)
+    conn.request("POST", url.path, (chunk for chunk in chunks))
+    conn.getresponse()
+    conn.close()
+
+    # then
+    assert received == [request_body]
+    _assert_request_response_body(
+        instrumented_sdk, request_body, SMALL_RESPONSE_PAYLOAD
+    )
+
+
+def test_instrument_http_client_chunked_response(
+    instrumented_sdk,
+    httpserver: HTTPServer,
+):
+    # given
+    def handler(request: Request):
+        return Response(iter([SMALL_RESPONSE_PAYLOAD]))
+
+    httpserver.expect_request("/foo").respond_with_handler(handler)
+
+    # when
+    import http.client
+
+    url = urlparse(httpserver.url_for("/foo"))
+    conn = http.client.HTTPConnection(url.hostname, url.port)
+    conn.request("GET", url.path)
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+
+    # then
+    assert body == SMALL_RESPONSE_PAYLOAD
+    assert instrumented_sdk.trace_spans.root.tags["http.status_code"] == 200
+
+
 @pytest.mark.parametrize(
     "request_body,response_body",
     [
@@ -176,6 +293,79 @@ def test_instrument_urllib3(
     _assert_request_response_body(instrumented_sdk, request_body, response_body)
 
 
+@pytest.fixture()
+def keep_alive_server():
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import threading
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_instrument_urllib3_connection_reuse(instrumented_sdk, keep_alive_server):
+    # given
+    root = instrumented_sdk._create_trace_span("root")
+
+    # when
+    import urllib3
+
+    pool = urllib3.PoolManager()
+    pool.request("GET", f"{keep_alive_server}/foo")
+    pool.request("GET", f"{keep_alive_server}/foo")
+    pool.clear()
+    root.close()
+
+    # then
+    first, second = root.sub_spans
+    assert [span.name for span in (first, second)] == ["python.http.request"] * 2
+    assert [span.name for span in first.sub_spans] == ["python.http.connect"]
+    assert first.sub_spans[0].start_time >= first.start_time
+    assert first.sub_spans[0].end_time <= first.end_time
+    assert second.sub_spans == [], "should not set up reused connection"
+
+
+def test_instrument_connection_set_up_ahead_of_request(
+    instrumented_sdk, keep_alive_server
+):
+    # given
+    import http.client
+    import time
+
+    url = urlparse(keep_alive_server)
+    conn = http.client.HTTPConnection(url.hostname, url.port)
+    start_time = time.perf_counter_ns()
+    conn.connect()
+    # as recorded by urllib3 instrumentation, e.g. for TLS pool connections
+    conn._sls_connection_setup = (start_time, time.perf_counter_ns())
+
+    # when
+    conn.request("GET", "/foo")
+    conn.getresponse().read()
+    conn.close()
+
+    # then
+    request_span = instrumented_sdk.trace_spans.root
+    assert request_span.start_time == start_time
+    assert [span.name for span in request_span.sub_spans] == ["python.http.connect"]
+    assert request_span.sub_spans[0].start_time == start_time
+
+
 @pytest.mark.parametrize(
     "request_body,response_body",
     [
@@ -332,6 +522,36 @@ def test_instrument_aiohttp(
     _assert_request_response_body(instrumented_sdk, request_body, response_body)
 
 
+def test_instrument_aiohttp_concurrent_requests(
+    instrumented_sdk, httpserver: HTTPServer
+):
+    # given
+    httpserver.expect_request("/foo").respond_with_data("ok")
+    root = instrumented_sdk._create_trace_span("root")
+
+    # when
+    import aiohttp
+
+    async def _get(session):
+        task_span = instrumented_sdk._create_trace_span("task")
+        async with session.get(httpserver.url_for("/foo")) as resp:
+            await resp.read()
+        task_span.close()
+        return task_span
+
+    async def _main():
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(*(_get(session) for _ in range(20)))
+
+    task_spans = asyncio.run(_main())
+    root.close()
+
+    # then
+    assert root.sub_spans == task_spans
+    for task_span in task_spans:
+        assert [span.name for span in task_span.sub_spans] == ["python.http.request"]
+
+
 @pytest.mark.parametrize(
     "request_body",
     [
@@ -496,3 +716,182 @@ def test_instrument_aiohttp_sls_ignore(
 
     # then
     assert instrumented_sdk.trace_spans.root is None
+
+
+@pytest.mark.parametrize(
+    "request_body,response_body",
+    [
+        (SMALL_REQUEST_PAYLOAD, SMALL_RESPONSE_PAYLOAD),
+        (LARGE_REQUEST_PAYLOAD, LARGE_RESPONSE_PAYLOAD),
+    ],
+)
+def test_instrument_httpx(
+    instrumented_sdk,
+    httpserver: HTTPServer,
+    request_body,
+    response_body,
+):
+    # given
+    def handler(request: Request):
+        return Response(response_body)
+
+    httpserver.expect_request("/foo/bar").respond_with_handler(handler)
+
+    # when
+    import httpx
+
+    with httpx.Client() as client:
+        client.post(
+            httpserver.url_for("/foo/bar?baz=qux"),
+            headers={"User-Agent": "foo"},
+            content=request_body,
+        )
+
+    # then
+    assert instrumented_sdk.trace_spans.root.name == "python.http.request"
+    assert (
+        instrumented_sdk.trace_spans.root.tags.items()
+        >= dict(
+            {
+                "http.method": "POST",
+                # as reported by the response, test server responds with HTTP/1.0
+                "http.protocol": "HTTP/1.0",
+                "http.host": f"127.0.0.1:{httpserver.port}",
+                "http.path": "/foo/bar",
+                "http.query_parameter_names": ["baz"],
+                "http.status_code": 200,
+            }
+        ).items()
+    )
+    assert (
+        "User-Agent"
+        in instrumented_sdk.trace_spans.root.tags["http.request_header_names"]
+    )
+    assert [span.name for span in instrumented_sdk.trace_spans.root.sub_spans] == [
+        "python.http.connect"
+    ]
+    _assert_request_response_body(instrumented_sdk, request_body, response_body)
+
+
+@pytest.mark.parametrize(
+    "request_body,response_body",
+    [
+        (SMALL_REQUEST_PAYLOAD, SMALL_RESPONSE_PAYLOAD),
+        (LARGE_REQUEST_PAYLOAD, LARGE_RESPONSE_PAYLOAD),
+    ],
+)
+def test_instrument_httpx_async(
+    instrumented_sdk,
+    httpserver: HTTPServer,
+    request_body,
+    response_body,
+):
+    # given
+    def handler(request: Request):
+        return Response(response_body)
+
+    httpserver.expect_request("/foo/bar").respond_with_handler(handler)
+
+    # when
+    import httpx
+
+    async def _post():
+        async with httpx.AsyncClient() as client:
+            await client.post(
+                httpserver.url_for("/foo/bar?baz=qux"),
+                headers={"User-Agent": "foo"},
+                content=request_body,
+            )
+
+    asyncio.run(_post())
+
+    # then
+    assert instrumented_sdk.trace_spans.root.name == "python.http.request"
+    assert (
+        instrumented_sdk.trace_spans.root.tags.items()
+        >= dict(
+            {
+                "http.method": "POST",
+                # as reported by the response, test server responds with HTTP/1.0
+                "http.protocol": "HTTP/1.0",
+                "http.host": f"127.0.0.1:{httpserver.port}",
+                "http.path": "/foo/bar",
+                "http.query_parameter_names": ["baz"],
+                "http.status_code": 200,
+            }
+        ).items()
+    )
+    assert [span.name for span in instrumented_sdk.trace_spans.root.sub_spans] == [
+        "python.http.connect"
+    ]
+    _assert_request_response_body(instrumented_sdk, request_body, response_body)
+
+
+def test_instrument_httpx_connection_reuse(instrumented_sdk, keep_alive_server):
+    # given
+    root = instrumented_sdk._create_trace_span("root")
+
+    # when
+    import httpx
+
+    with httpx.Client() as client:
+        client.get(f"{keep_alive_server}/foo")
+        client.get(f"{keep_alive_server}/foo")
+    root.close()
+
+    # then
+    first, second = root.sub_spans
+    assert [span.name for span in (first, second)] == ["python.http.request"] * 2
+    assert [span.name for span in first.sub_spans] == ["python.http.connect"]
+    assert second.sub_spans == [], "should not set up reused connection"
+
+
+def test_instrument_httpx_ignore_following_request(
+    instrumented_sdk, httpserver: HTTPServer
+):
+    # given
+    httpserver.expect_request("/foo").respond_with_data("ok")
+
+    # when
+    from sls_sdk.lib.instrumentation.http import ignore_following_request
+    import httpx
+
+    ignore_following_request()
+    httpx.get(httpserver.url_for("/foo"))
+
+    # then
+    assert instrumented_sdk.trace_spans.root is None
+
+    # when
+    httpx.get(httpserver.url_for("/foo"))
+
+    # then
+    assert instrumented_sdk.trace_spans.root.name == "python.http.request"
+
+
+def test_instrument_httpx_error(instrumented_sdk):
+    # given
+    import httpx
+
+    host = str(uuid.uuid4()) + ":1234"
+
+    # when
+    with pytest.raises(httpx.ConnectError):
+        httpx.get(f"https://{host}/foo/bar?baz=qux")
+
+    # then
+    assert instrumented_sdk.trace_spans.root.name == "python.https.request"
+    assert (
+        instrumented_sdk.trace_spans.root.tags.items()
+        >= dict(
+            {
+                "http.method": "GET",
+                "http.host": host,
+                "http.path": "/foo/bar",
+                "http.query_parameter_names": ["baz"],
+                "http.error_code": "ConnectError",
+            }
+        ).items()
+    )
+    assert "http.protocol" not in instrumented_sdk.trace_spans.root.tags
+    assert instrumented_sdk.trace_spans.root.end_time is not None
@@ -78,3 +78,22 @@ def test_captured_event_invalid_custom_tags(monkeypatch):
     }
     assert captured_event.origin == origin
     mock.assert_called_once()
+
+
+def test_captured_event_lazy_tags():
+    # given
+    stack_trace = MagicMock()
+    stack_trace.__str__.return_value = "formatted stack trace"
+
+    # when
+    captured_event = CapturedEvent(
+        "foo.bar.event", lazy_tags={"warning.stacktrace": stack_trace}
+    )
+
+    # then
+    stack_trace.__str__.assert_not_called()
+    assert captured_event.to_protobuf_dict()["tags"] == {
+        "warning": {"stacktrace": "formatted stack trace"}
+    }
+    assert captured_event.tags == {"warning.stacktrace": "formatted stack trace"}
+    stack_trace.__str__.assert_called_once()
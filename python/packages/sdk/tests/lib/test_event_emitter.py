@@ -19,3 +19,39 @@ def test_event_emitter(event_type: EVENT_TYPE):
 
     # then
     mock.assert_called_once_with("foo", bar="foo-bar")
+
+
+def test_event_emitter_remove_all_listeners():
+    # given
+    mock = MagicMock()
+
+    def handler(*args, **kwargs):
+        mock(*args, **kwargs)
+
+    event_emitter = EventEmitter()
+    event_emitter.on("trace-span-close", handler)
+
+    # when
+    event_emitter.remove_all_listeners()
+    event_emitter.emit("trace-span-close", "foo")
+
+    # then
+    mock.assert_not_called()
+
+
+def test_event_emitter_ignores_duplicate_listener():
+    # given
+    mock = MagicMock()
+
+    def handler(*args, **kwargs):
+        mock(*args, **kwargs)
+
+    event_emitter = EventEmitter()
+    event_emitter.on("captured-event", handler)
+    event_emitter.on("captured-event", handler)
+
+    # when
+    event_emitter.emit("captured-event", "foo")
+
+    # then
+    mock.assert_called_once_with("foo")
@@ -0,0 +1,138 @@
+import concurrent.futures
+import multiprocessing
+import time
+import pytest
+
+
+def _create_spans(name):
+    from sls_sdk import serverlessSdk
+
+    span = serverlessSdk._create_trace_span(name)
+    span.tags["task.name"] = name
+    serverlessSdk._create_trace_span("child").close()
+    span.close()
+    return name
+
+
+def _fail():
+    from sls_sdk import serverlessSdk
+
+    serverlessSdk._create_trace_span("failing").close()
+    raise ValueError("failed")
+
+
+def test_thread_pool_executor(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+    parent = sdk._create_trace_span("parent")
+
+    # when
+    with sdk.ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(_create_spans, ["one", "two"]))
+
+    # then
+    assert results == ["one", "two"]
+    assert sorted(span.name for span in parent.sub_spans) == ["one", "two"]
+    for span in parent.sub_spans:
+        assert [sub_span.name for sub_span in span.sub_spans] == ["child"]
+    assert root.sub_spans == [parent]
+
+
+@pytest.fixture()
+def process_pool_executor(sdk):
+    with sdk.ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        yield executor
+
+
+def test_process_pool_executor(sdk, process_pool_executor):
+    # given
+    root = sdk._create_trace_span("root")
+    parent = sdk._create_trace_span("parent")
+    closed_spans = []
+
+    def _on_span_close(span):
+        closed_spans.append(span)
+
+    sdk._event_emitter.on("trace-span-close", _on_span_close)
+
+    # when
+    results = list(process_pool_executor.map(_create_spans, ["one", "two"]))
+
+    # then
+    assert results == ["one", "two"]
+    assert [span.name for span in parent.sub_spans] == ["one", "two"]
+    for span in parent.sub_spans:
+        assert span.parent_span is parent
+        assert span.trace_id == root.trace_id
+        assert span.tags == {"task.name": span.name}
+        assert [sub_span.name for sub_span in span.sub_spans] == ["child"]
+        assert span.sub_spans[0].end_time <= span.end_time
+        assert span in closed_spans, "should emit merged spans as closed"
+    assert len(root.spans) == 6
+
+
+def test_process_pool_executor_error(sdk, process_pool_executor):
+    # given
+    sdk._create_trace_span("root")
+    parent = sdk._create_trace_span("parent")
+
+    # when
+    future = process_pool_executor.submit(_fail)
+
+    # then
+    with pytest.raises(ValueError):
+        future.result()
+    assert [span.name for span in parent.sub_spans] == ["failing"]
+
+
+def test_process_pool_executor_running(sdk, process_pool_executor):
+    # given
+    sdk._create_trace_span("root")
+
+    # when
+    future = process_pool_executor.submit(time.sleep, 0.2)
+    deadline = time.monotonic() + 5
+    while not future.running() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # then
+    assert future.running()
+    future.result()
+    assert not future.running()
+
+
+def test_process_pool_executor_without_trace(sdk, process_pool_executor):
+    # when
+    result = process_pool_executor.submit(_create_spans, "one").result()
+
+    # then
+    assert result == "one"
+    assert sdk.trace_spans.root is None
+
+
+def test_process_pool_executor_trace_closed(sdk):
+    from sls_sdk.lib.executor import _TracedFuture
+
+    # given
+    root = sdk._create_trace_span("root")
+    parent = sdk._create_trace_span("parent")
+    task_future = concurrent.futures.Future()
+    future = _TracedFuture(task_future, parent, parent.trace_id)
+
+    # when
+    # root span reused by the next trace (as `aws.lambda` span is),
+    # before the task completes
+    parent.close()
+    root._clear_sub_spans()
+    del root.trace_id
+    next_parent = sdk._create_trace_span("next")
+    start_time = time.perf_counter_ns()
+    record = (-1, "one", start_time, start_time, None, None, None, None)
+    task_future.set_result(("one", [record]))
+
+    # then
+    assert future.result() == "one"
+    assert parent.sub_spans == []
+    assert root.spans == [root, next_parent]
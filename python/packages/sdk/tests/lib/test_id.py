@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sls_sdk.lib.id import generate_id
+from sls_sdk.lib.id import POOL_SIZE, generate_id, generate_id_bytes
 
 
 def test_generate_id():
@@ -10,3 +10,19 @@ def test_generate_id():
 
     assert len(new_id) == 32
     assert len(new_bytes) == 16
+
+
+def test_generate_id_unique():
+    # ids are drawn from a pool that's refilled several times here
+    ids = {generate_id() for _ in range(POOL_SIZE * 3)}
+
+    assert len(ids) == POOL_SIZE * 3
+
+
+def test_generate_id_custom_length():
+    assert len(generate_id(8)) == 16
+
+
+def test_generate_id_bytes():
+    assert len(generate_id_bytes()) == 16
+    assert generate_id_bytes() != generate_id_bytes()
@@ -0,0 +1,332 @@
+import asyncio
+import pytest
+
+
+def test_span(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    # when
+    with sdk.span("db.query", tags={"table": "users"}) as span:
+        child = sdk._create_trace_span("child")
+        child.close()
+
+    # then
+    assert span.name == "db.query"
+    assert span.parent_span is root
+    assert span.sub_spans == [child]
+    assert span.custom_tags == {"table": "users"}
+    assert span.end_time is not None
+    assert sdk._create_trace_span("after").parent_span is root
+
+
+def test_span_closed_on_error(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    # when
+    with pytest.raises(ValueError):
+        with sdk.span("db.query"):
+            raise ValueError("failed")
+
+    # then
+    span = root.sub_spans[0]
+    assert span.name == "db.query"
+    assert span.end_time is not None
+
+
+def test_span_async(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    # when
+    async def _query():
+        async with sdk.span("db.query") as span:
+            await asyncio.sleep(0)
+        return span
+
+    span = asyncio.run(_query())
+
+    # then
+    assert span.parent_span is root
+    assert span.end_time is not None
+
+
+def test_span_invalid_name(sdk, monkeypatch):
+    # given
+    monkeypatch.delenv("SLS_CRASH_ON_SDK_ERROR", False)
+    root = sdk._create_trace_span("root")
+
+    # when
+    with sdk.span("Invalid Name") as span:
+        result = "done"
+
+    # then
+    assert span is None, "should run the block without a span"
+    assert result == "done"
+    assert root.sub_spans == []
+
+
+def test_span_noop_when_not_initialized(reset_sdk):
+    # given
+    from sls_sdk import serverlessSdk
+
+    # when
+    with serverlessSdk.span("db.query") as span:
+        pass
+
+    # then
+    assert span is None
+    assert serverlessSdk.trace_spans.root is None
+
+
+def test_traced(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    @sdk.traced
+    def get_user(user_id):
+        return {"id": user_id}
+
+    # when
+    result = get_user(1)
+
+    # then
+    assert result == {"id": 1}
+    assert get_user.__name__ == "get_user"
+    assert [span.name for span in root.sub_spans] == [
+        f"{__name__.lower()}.test_traced.locals.get_user"
+    ]
+    assert root.sub_spans[0].end_time is not None
+
+
+def test_traced_with_name(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    @sdk.traced(name="users.get")
+    def get_user(user_id):
+        return {"id": user_id}
+
+    # when
+    get_user(1)
+
+    # then
+    assert [span.name for span in root.sub_spans] == ["users.get"]
+
+
+def test_traced_coroutine(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    @sdk.traced(name="users.get")
+    async def get_user(user_id):
+        await asyncio.sleep(0)
+        sdk._create_trace_span("child").close()
+        return {"id": user_id}
+
+    # when
+    async def _main():
+        return await asyncio.gather(get_user(1), get_user(2))
+
+    result = asyncio.run(_main())
+
+    # then
+    assert result == [{"id": 1}, {"id": 2}]
+    assert [span.name for span in root.sub_spans] == ["users.get"] * 2
+    for span in root.sub_spans:
+        assert [sub_span.name for sub_span in span.sub_spans] == ["child"]
+        assert span.end_time is not None
+
+
+def test_traced_generator(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    @sdk.traced(name="users.list")
+    def list_users():
+        yield 1
+        yield 2
+        return "done"
+
+    # when
+    iterator = list_users()
+    first = next(iterator)
+
+    # then
+    span = root.sub_spans[0]
+    assert first == 1
+    assert span.end_time is None, "should trace until generator is exhausted"
+
+    # when
+    with pytest.raises(StopIteration) as stop:
+        next(iterator), next(iterator)
+
+    # then
+    assert stop.value.value == "done"
+    assert span.end_time is not None
+
+
+def test_traced_generator_closed(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    @sdk.traced(name="users.list")
+    def list_users():
+        yield from range(10)
+
+    # when
+    for user in list_users():
+        if user == 2:
+            break
+
+    # then
+    assert root.sub_spans[0].end_time is not None
+
+
+def test_traced_generator_span_current_only_while_running(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    @sdk.traced(name="users.list")
+    def list_users():
+        yield 1
+        sdk._create_trace_span("fetch").close()
+        yield 2
+
+    # when
+    iterator = list_users()
+    next(iterator)
+    with sdk.span("caller.work") as caller_span:
+        pass
+    next(iterator)
+
+    # then
+    span = root.sub_spans[0]
+    assert caller_span.parent_span is root
+    assert [sub_span.name for sub_span in span.sub_spans] == ["fetch"]
+    assert sdk._create_trace_span("after").parent_span is root
+
+
+def test_traced_generator_send_and_throw(sdk):
+    # given
+    sdk._create_trace_span("root")
+
+    @sdk.traced(name="users.echo")
+    def echo():
+        received = []
+        while True:
+            try:
+                received.append((yield len(received)))
+            except KeyError:
+                return received
+
+    # when
+    iterator = echo()
+    next(iterator)
+    iterator.send("a")
+    iterator.send("b")
+
+    # then
+    with pytest.raises(StopIteration) as stop:
+        iterator.throw(KeyError("done"))
+    assert stop.value.value == ["a", "b"]
+
+
+def test_traced_async_generator_asend_and_athrow(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    @sdk.traced(name="users.echo")
+    async def echo():
+        received = []
+        while True:
+            try:
+                received.append((yield len(received)))
+            except KeyError:
+                yield received
+                return
+
+    # when
+    async def _main():
+        iterator = echo()
+        await iterator.asend(None)
+        async with sdk.span("caller.work") as caller_span:
+            await iterator.asend("a")
+        await iterator.asend("b")
+        received = await iterator.athrow(KeyError("done"))
+        await iterator.aclose()
+        return received, caller_span
+
+    received, caller_span = asyncio.run(_main())
+
+    # then
+    assert received == ["a", "b"]
+    assert caller_span.parent_span is root
+    assert root.sub_spans[0].name == "users.echo"
+    assert root.sub_spans[0].end_time is not None
+
+
+def test_traced_async_generator(sdk):
+    # given
+    root = sdk._create_trace_span("root")
+
+    @sdk.traced(name="users.list")
+    async def list_users():
+        for user in range(3):
+            await asyncio.sleep(0)
+            yield user
+
+    # when
+    async def _main():
+        return [user async for user in list_users()]
+
+    result = asyncio.run(_main())
+
+    # then
+    assert result == [0, 1, 2]
+    assert [span.name for span in root.sub_spans] == ["users.list"]
+    assert root.sub_spans[0].end_time is not None
+
+
+def test_traced_noop_when_not_initialized(reset_sdk):
+    # given
+    from sls_sdk import serverlessSdk
+
+    @serverlessSdk.traced
+    def get_user(user_id):
+        return {"id": user_id}
+
+    # when
+    result = get_user(1)
+
+    # then
+    assert result == {"id": 1}
+    assert serverlessSdk.trace_spans.root is None
+
+
+@pytest.mark.parametrize(
+    "qualname,expected",
+    [
+        ("handler", "module.handler"),
+        ("Service.get_user", "module.service.get_user"),
+        ("handler.<locals>._inner", "module.handler.locals.inner"),
+        ("<lambda>", "module.lambda"),
+        ("handler2", "module.handler2"),
+    ],
+)
+def test_resolve_function_span_name(qualname, expected):
+    # given
+    from sls_sdk.lib.span_context import resolve_function_span_name
+
+    def func():
+        pass
+
+    func.__module__ = "__module__"
+    func.__qualname__ = qualname
+
+    # when
+    name = resolve_function_span_name(func)
+
+    # then
+    assert name == expected
@@ -1,5 +1,5 @@
 import traceback
-from sls_sdk.lib.stack_trace_string import resolve
+from sls_sdk.lib.stack_trace_string import capture, resolve
 
 
 def test_resolve_stack_trace_string_from_error():
@@ -18,9 +18,7 @@ def test_resolve_stack_trace_string_from_error():
 
     # then
     assert stack_trace == "".join(
-        traceback.format_exception(
-            etype=type(error), value=error, tb=error.__traceback__
-        )
+        traceback.format_exception(type(error), error, error.__traceback__)
     )
 
 
@@ -39,3 +37,29 @@ def test_resolve_stack_trace_string_from_current_stack():
 
     # then
     assert "stack_trace = func()" in [line for line in stack_trace.split("  File")][-1]
+
+
+def test_capture_formats_as_format_stack():
+    # when
+    stack_trace = capture()
+    expected = "".join(traceback.format_stack())
+
+    # then
+    assert str(stack_trace).splitlines()[:-2] == expected.splitlines()[:-2]
+    assert "stack_trace = capture()" in str(stack_trace).splitlines()[-1]
+
+
+def test_capture_max_depth(monkeypatch):
+    # given
+    # patched in module `capture` was imported from, as SDK fixtures reimport it
+    monkeypatch.setitem(capture.__globals__, "max_depth", 2)
+
+    def func():
+        return capture()
+
+    # when
+    stack_trace = str(func())
+
+    # then
+    assert stack_trace.count("  File") == 2
+    assert "return capture()" in stack_trace.splitlines()[-1]
@@ -14,7 +14,12 @@ from sls_sdk.exceptions import (
     InvalidTraceSpanTagValue,
     SdkException,
 )
-from sls_sdk.lib.tags import ensure_tag_name, ensure_tag_value, Tags
+from sls_sdk.lib.tags import (
+    convert_tags_to_protobuf,
+    ensure_tag_name,
+    ensure_tag_value,
+    Tags,
+)
 import sls_sdk.lib.tags
 
 
@@ -251,3 +256,53 @@ def test_tags_invalid_names_and_values_bulk_internal_method_raises_exception(
     # when
     with pytest.raises(SdkException):
         tags._update({name: "" for name in INVALID_NAMES})
+
+
+def test_ensure_tag_name_caches_valid_names(monkeypatch):
+    # given
+    monkeypatch.setattr(sls_sdk.lib.tags, "_valid_tag_names", {})
+    monkeypatch.setattr(sls_sdk.lib.tags, "MAX_CACHED_TAG_NAMES", 2)
+    names = ["".join(["cached.", str(index)]) for index in range(3)]
+
+    # when
+    validated = [ensure_tag_name(name) for name in names]
+
+    # then
+    assert validated == names
+    assert sls_sdk.lib.tags._valid_tag_names == {
+        "cached.0": "cached.0",
+        "cached.1": "cached.1",
+    }
+    assert ensure_tag_name("".join(["cached.", "0"])) is validated[0]
+    for name in INVALID_NAMES:
+        with pytest.raises(InvalidTraceSpanTagName):
+            ensure_tag_name(name)
+    assert len(sls_sdk.lib.tags._valid_tag_names) == 2
+
+
+def test_convert_tags_to_protobuf():
+    # given
+    tags = Tags()
+    tags.update({"event_source": "aws.sqs", "outcome": 1}, prefix="aws.lambda")
+    tags.update({"queue_name": "queue", "message_ids": ["1"]}, prefix="aws.lambda.sqs")
+    tags["http.status_code"] = 200
+
+    # when
+    result = convert_tags_to_protobuf(tags)
+
+    # then
+    assert result == {
+        "aws": {
+            "lambda": {
+                "eventSource": "aws.sqs",
+                "outcome": 1,
+                "sqs": {"queueName": "queue", "messageIds": ["1"]},
+            }
+        },
+        "http": {"statusCode": 200},
+    }
+    assert convert_tags_to_protobuf(tags) == result
+    assert sls_sdk.lib.tags._key_paths["aws.lambda.sqs.queue_name"] == (
+        ("aws", "lambda", "sqs"),
+        "queueName",
+    )
@@ -269,7 +269,7 @@ def test_root_span_reuse(sdk):
     TraceSpan("child1").close()
     TraceSpan("child2").close()
     span.close()
-    span.sub_spans.clear()
+    span._clear_sub_spans()
     del sls_sdk.lib.trace.root_span.end_time
 
     # when
@@ -282,4 +282,116 @@ def test_root_span_reuse(sdk):
         "root",
         "otherchild",
     ]
-    sls_sdk.lib.trace.root_span.sub_spans.clear()
+    sls_sdk.lib.trace.root_span._clear_sub_spans()
+
+
+def test_spans_of_interleaved_subtrees(sdk):
+    # given
+    from sls_sdk.lib.trace import TraceSpan
+
+    root = TraceSpan("root")
+    child1 = TraceSpan("child1")
+    root._set_ctx()
+    child2 = TraceSpan("child2")
+    child1._set_ctx()
+    grandchild1 = TraceSpan("grandchild1")
+
+    # when
+    grandchild1.close()
+    child1.close()
+    root.close()
+
+    # then
+    assert child2.end_time == root.end_time, "should close leftover spans"
+    assert child1.spans == [child1, grandchild1]
+    assert child2.spans == [child2]
+    assert root.spans == [root, child1, child2, grandchild1]
+
+
+def test_span_lazy_attributes(sdk):
+    # given
+    from sls_sdk.lib.trace import TraceSpan
+
+    span = TraceSpan("root")
+
+    # when
+    span_id = span.id
+    del span.id
+    span.close()
+    del span.end_time
+
+    # then
+    assert span._tags is None and span._custom_tags is None
+    assert span.tags == {} and span.custom_tags == {}
+    assert span.id != span_id, "should regenerate `id` after reset"
+    assert span.end_time is None
+
+
+def test_span_captured_body(sdk):
+    # given
+    from sls_sdk.lib.trace import TraceSpan
+
+    span = TraceSpan("root")
+
+    # when
+    span._capture_input("zażółć".encode("utf-8"))
+    span._capture_output(b"\xff\xfe")
+
+    # then
+    assert span._input.__class__ is bytes, "should not decode until read"
+    assert span.input == "zażółć"
+    assert span.output is None, "should skip bodies that are not valid utf-8"
+    assert span.to_protobuf_dict()["input"] == "zażółć"
+
+
+def test_span_parent_of_concurrent_tasks(sdk):
+    # given
+    import asyncio
+    from sls_sdk.lib.trace import TraceSpan
+
+    root = TraceSpan("root")
+
+    async def _task():
+        task_span = TraceSpan("task")
+        await asyncio.sleep(0)
+        child = TraceSpan("child")
+        await asyncio.sleep(0)
+        child.close()
+        await asyncio.sleep(0)
+        TraceSpan("sibling").close()
+        task_span.close()
+        return task_span
+
+    async def _main():
+        parent = TraceSpan("parent")
+        task_spans = await asyncio.gather(*(_task() for _ in range(100)))
+        parent.close()
+        return parent, task_spans
+
+    # when
+    parent, task_spans = asyncio.run(_main())
+
+    # then
+    assert parent.sub_spans == task_spans
+    for task_span in task_spans:
+        assert [span.name for span in task_span.sub_spans] == ["child", "sibling"]
+    assert TraceSpan("after").parent_span is root
+
+
+def test_span_parent_after_closed_ancestors(sdk):
+    # given
+    from sls_sdk.lib.trace import TraceSpan
+
+    root = TraceSpan("root")
+    parent = TraceSpan("parent")
+    child = TraceSpan("child")
+    grandchild = TraceSpan("grandchild")
+
+    # when
+    child.close()
+    parent.close()
+    grandchild.close()
+
+    # then
+    assert TraceSpan.resolve_current_span() is root
+    assert TraceSpan("next").parent_span is root
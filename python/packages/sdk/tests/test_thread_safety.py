@@ -11,6 +11,16 @@ SMALL_REQUEST_PAYLOAD = b"a"
 SMALL_RESPONSE_PAYLOAD = b"r"
 
 
+@pytest.fixture(params=[False, True], ids=["thread_safe", "single_threaded"])
+def sdk(sdk, request):
+    # every test is run both with locking tags and in (opt-in) single threaded mode
+    if request.param:
+        from sls_sdk.lib.thread_mode import enable_single_threaded_mode
+
+        enable_single_threaded_mode()
+    yield sdk
+
+
 def print_spans(root, length=100):
     # normalize start and end times within [0, length]
     offset = root.start_time
@@ -340,9 +350,10 @@ def test_instrument_requests_multithreaded(
             assert future.exception() is None
 
     # then
-    assert len(root.spans) == parallelism + 1
-    for span in root.spans[1:]:
+    assert len(root.sub_spans) == parallelism
+    for span in root.sub_spans:
         assert span.name == "python.http.request"
+        assert [sub_span.name for sub_span in span.sub_spans] == ["python.http.connect"]
         assert (
             span.tags.items()
             >= dict(
@@ -357,3 +368,62 @@ def test_instrument_requests_multithreaded(
             ).items()
         )
         assert "User-Agent" in span.tags["http.request_header_names"]
+
+
+@pytest.mark.parametrize("reset_sdk", [{"SLS_SINGLE_THREADED": "1"}], indirect=True)
+def test_single_threaded_mode_switches_off_on_span_from_another_thread(reset_sdk):
+    # given
+    from sls_sdk import serverlessSdk
+    from sls_sdk.lib import thread_mode
+
+    serverlessSdk._initialize()
+    root_span = serverlessSdk._create_trace_span("root")
+    root_span.tags["tag.main"] = 1
+    assert serverlessSdk._settings.single_threaded
+    assert thread_mode.is_single_threaded
+    assert root_span.tags._lock is None
+
+    # when
+    def _create_span():
+        span = serverlessSdk._create_trace_span("child")
+        span.tags["tag.thread"] = 2
+        span.close()
+        return span
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        child_span = executor.submit(_create_span).result()
+    root_span.tags["tag.after"] = 3
+    root_span.close()
+
+    # then
+    assert not thread_mode.is_single_threaded
+    assert root_span.tags._lock is not None
+    assert root_span.tags == {"tag.main": 1, "tag.after": 3}
+    assert child_span.tags == {"tag.thread": 2}
+    assert root_span.spans == [root_span, child_span]
+
+
+@pytest.mark.parametrize("reset_sdk", [{"SLS_SINGLE_THREADED": "1"}], indirect=True)
+def test_single_threaded_mode_switches_off_on_tag_from_another_thread(reset_sdk):
+    # given
+    from sls_sdk import serverlessSdk
+    from sls_sdk.lib import thread_mode
+
+    serverlessSdk._initialize()
+    root_span = serverlessSdk._create_trace_span("root")
+    assert thread_mode.is_single_threaded
+
+    # when
+    def _set_tags():
+        serverlessSdk.set_tag("custom", "value")
+        root_span.tags.update({"tag.thread": 2})
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(_set_tags).result()
+    root_span.close()
+
+    # then
+    assert not thread_mode.is_single_threaded
+    assert root_span.tags._lock is not None
+    assert root_span.tags == {"tag.thread": 2}
+    assert serverlessSdk._custom_tags == {"custom": "value"}